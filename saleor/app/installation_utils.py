@@ -25,6 +25,7 @@ from ..thumbnail import ICON_MIME_TYPES
 from ..thumbnail.utils import get_filename_from_url
 from ..thumbnail.validators import validate_icon_image
 from ..webhook.models import Webhook, WebhookEvent
+from ..webhook.registry import invalidate_webhook_registry
 from .error_codes import AppErrorCode
 from .manifest_validations import clean_manifest_data
 from .models import App, AppExtension, AppInstallation
@@ -260,6 +261,8 @@ def install_app(app_installation: AppInstallation, activate: bool = False):
                 WebhookEvent(webhook=db_webhook, event_type=event_type)
             )
     WebhookEvent.objects.bulk_create(webhook_events)
+    # bulk created webhooks and events don't send the signals invalidating the registry
+    invalidate_webhook_registry()
 
     _, token = app.tokens.create(name="Default token")  # type: ignore[call-arg] # calling create on a related manager # noqa: E501
 
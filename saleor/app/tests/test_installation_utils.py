@@ -482,6 +482,29 @@ def test_install_app_with_webhook(
     assert webhook.custom_headers == {"x-key": "Value"}
 
 
+@patch("saleor.app.installation_utils.invalidate_webhook_registry")
+def test_install_app_with_webhook_invalidates_webhook_registry(
+    mocked_invalidate_webhook_registry,
+    app_manifest,
+    app_manifest_webhook,
+    app_installation,
+    monkeypatch,
+):
+    # given
+    app_manifest["webhooks"] = [app_manifest_webhook]
+
+    mocked_get_response = Mock()
+    mocked_get_response.json.return_value = app_manifest
+    monkeypatch.setattr(HTTPSession, "request", Mock(return_value=mocked_get_response))
+    monkeypatch.setattr("saleor.app.installation_utils.send_app_token", Mock())
+
+    # when
+    install_app(app_installation, activate=True)
+
+    # then
+    mocked_invalidate_webhook_registry.assert_called_once_with()
+
+
 def test_install_app_webhook_incorrect_url(
     app_manifest, app_manifest_webhook, app_installation, monkeypatch
 ):
@@ -24,7 +24,10 @@ def preload_app() -> None:
     from django.conf import settings
     from django.urls import get_resolver
 
+    from ..graphql.api import warm_up_document_cache
+
     getattr(get_resolver(settings.ROOT_URLCONF), "url_patterns")
+    warm_up_document_cache()
     gc.collect()
     gc.freeze()  # mark anything that remains as uncollectable to speed up future collections
 
@@ -16,6 +16,8 @@ from ..core.taxes import zero_money
 from ..discount import VoucherType
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from ..channel.models import Channel
     from .fetch import CheckoutInfo, CheckoutLineInfo, ShippingMethodInfo
 
@@ -236,18 +238,8 @@ def get_line_total_price_with_propagated_checkout_discount(
     The discount amount is calculated for every line proportionally to
     the rate of total line price to checkout total price.
     """
-    voucher = checkout_info.voucher
-    base_total_price = calculate_base_line_total_price(
-        checkout_line_info,
-    )
-    if voucher and (
-        voucher.apply_once_per_order
-        or voucher.type in [VoucherType.SHIPPING, VoucherType.SPECIFIC_PRODUCT]
-    ):
-        return base_total_price
-
-    if not voucher and not checkout_info.discounts:
-        return base_total_price
+    if not _is_checkout_discount_propagated_on_lines(checkout_info):
+        return calculate_base_line_total_price(checkout_line_info)
 
     total_discount = checkout_info.checkout.discount
     for (
@@ -258,7 +250,45 @@ def get_line_total_price_with_propagated_checkout_discount(
     ):
         if checkout_line_info.line.id == checkout_line.id:
             return total_price
-    return base_total_price
+    return calculate_base_line_total_price(checkout_line_info)
+
+
+def get_lines_total_prices_with_propagated_checkout_discount(
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+) -> dict["UUID", Money]:
+    """Calculate prices with discounts for all checkout lines at once.
+
+    Return the same prices as `get_line_total_price_with_propagated_checkout_discount`
+    mapped by the line id, with the checkout discount propagated in a single pass
+    instead of once per line.
+    """
+    if not _is_checkout_discount_propagated_on_lines(checkout_info):
+        return {
+            line_info.line.id: calculate_base_line_total_price(line_info)
+            for line_info in lines
+        }
+
+    return {
+        checkout_line.id: total_price
+        for checkout_line, total_price in (
+            _propagate_checkout_discount_on_checkout_lines_prices(
+                lines,
+                checkout_info.checkout.discount,
+                checkout_info.channel.currency_code,
+            )
+        )
+    }
+
+
+def _is_checkout_discount_propagated_on_lines(checkout_info: "CheckoutInfo") -> bool:
+    voucher = checkout_info.voucher
+    if voucher and (
+        voucher.apply_once_per_order
+        or voucher.type in [VoucherType.SHIPPING, VoucherType.SPECIFIC_PRODUCT]
+    ):
+        return False
+    return bool(voucher or checkout_info.discounts)
 
 
 def _propagate_checkout_discount_on_checkout_lines_prices(
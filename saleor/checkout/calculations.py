@@ -33,7 +33,7 @@ from ..tax.utils import (
     validate_tax_data,
 )
 from .fetch import find_checkout_line_info
-from .models import Checkout
+from .models import Checkout, CheckoutLine
 from .payment_utils import update_checkout_payment_statuses
 
 if TYPE_CHECKING:
@@ -43,6 +43,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+CHECKOUT_LINE_PRICE_FIELDS = (
+    "total_price_net_amount",
+    "total_price_gross_amount",
+    "tax_rate",
+    "undiscounted_unit_price_amount",
+)
+
 
 def checkout_shipping_price(
     *,
@@ -338,6 +345,9 @@ def _fetch_checkout_prices_if_expired(
     )
 
     lines = cast(list, lines)
+    initial_line_prices = {
+        line_info.line.id: _get_line_price_values(line_info.line) for line_info in lines
+    }
     update_undiscounted_unit_price_for_lines(lines)
 
     create_or_update_discount_objects_from_promotion_for_checkout(
@@ -425,24 +435,32 @@ def _fetch_checkout_prices_if_expired(
 
     from .utils import checkout_lines_bulk_update
 
+    # Only lines with changed prices are saved, so a change of a single line in
+    # a large checkout doesn't rewrite all of them. Gift lines added by promotions
+    # are not in the initial prices and are always saved.
+    lines_to_update = [
+        line_info.line
+        for line_info in lines
+        if _get_line_price_values(line_info.line)
+        != initial_line_prices.get(line_info.line.id)
+    ]
     with allow_writer():
         with transaction.atomic():
             checkout.save(
                 update_fields=checkout_update_fields,
                 using=settings.DATABASE_CONNECTION_DEFAULT_NAME,
             )
-            checkout_lines_bulk_update(
-                [line_info.line for line_info in lines],
-                [
-                    "total_price_net_amount",
-                    "total_price_gross_amount",
-                    "tax_rate",
-                    "undiscounted_unit_price_amount",
-                ],
-            )
+            if lines_to_update:
+                checkout_lines_bulk_update(
+                    lines_to_update, list(CHECKOUT_LINE_PRICE_FIELDS)
+                )
     return checkout_info, lines
 
 
+def _get_line_price_values(line: CheckoutLine) -> tuple:
+    return tuple(getattr(line, field) for field in CHECKOUT_LINE_PRICE_FIELDS)
+
+
 def _calculate_and_add_tax(
     tax_calculation_strategy: str,
     tax_app_identifier: Optional[str],
@@ -617,6 +635,11 @@ def _apply_tax_data_from_plugins(
     address: Optional["Address"],
     plugin_ids: Optional[list[str]] = None,
 ) -> None:
+    lines_total_prices = (
+        base_calculations.get_lines_total_prices_with_propagated_checkout_discount(
+            checkout_info, lines
+        )
+    )
     for line_info in lines:
         line = line_info.line
 
@@ -626,6 +649,7 @@ def _apply_tax_data_from_plugins(
             line_info,
             address,
             plugin_ids=plugin_ids,
+            lines_total_prices=lines_total_prices,
         )
         line.total_price = total_price
 
@@ -645,7 +669,11 @@ def _apply_tax_data_from_plugins(
         checkout_info, lines, address, checkout.shipping_price, plugin_ids=plugin_ids
     )
     checkout.subtotal = manager.calculate_checkout_subtotal(
-        checkout_info, lines, address, plugin_ids=plugin_ids
+        checkout_info,
+        lines,
+        address,
+        plugin_ids=plugin_ids,
+        lines_total_prices=lines_total_prices,
     )
     checkout.total = manager.calculate_checkout_total(
         checkout_info,
@@ -662,15 +690,15 @@ def _set_checkout_base_prices(
 ) -> None:
     currency = checkout_info.checkout.currency
     subtotal = zero_money(currency)
+    lines_total_prices = (
+        base_calculations.get_lines_total_prices_with_propagated_checkout_discount(
+            checkout_info, lines
+        )
+    )
 
     for line_info in lines:
         line = line_info.line
-        total_price = (
-            base_calculations.get_line_total_price_with_propagated_checkout_discount(
-                checkout_info, lines, line_info
-            )
-        )
-        line_total_price = quantize_price(total_price, currency)
+        line_total_price = quantize_price(lines_total_prices[line.id], currency)
         subtotal += line_total_price
 
         line.total_price = TaxedMoney(net=line_total_price, gross=line_total_price)
@@ -37,7 +37,7 @@ from ..order.actions import mark_order_as_paid_with_payment, order_created
 from ..order.fetch import OrderInfo, OrderLineInfo
 from ..order.models import Order, OrderLine
 from ..order.notifications import send_order_confirmation
-from ..order.search import prepare_order_search_vector_value
+from ..order.search import prepare_order_search_vector_value, update_order_search_vector
 from ..order.utils import (
     update_order_authorize_data,
     update_order_charge_data,
@@ -1345,13 +1345,17 @@ def _create_order_from_checkout(
         ]
     )
     # allocations
-    _handle_allocations_of_order_lines(
-        checkout_info=checkout_info,
-        checkout_lines=checkout_lines_info,
-        order_lines_info=order_lines_info,
-        manager=manager,
-        reservation_enabled=reservation_enabled,
-    )
+    # In the fast path stocks are allocated right before the commit, so the stock
+    # rows stay locked only for the allocation and the remaining order inserts.
+    fast_path = settings.CHECKOUT_COMPLETE_FAST_PATH_ENABLED
+    if not fast_path:
+        _handle_allocations_of_order_lines(
+            checkout_info=checkout_info,
+            checkout_lines=checkout_lines_info,
+            order_lines_info=order_lines_info,
+            manager=manager,
+            reservation_enabled=reservation_enabled,
+        )
 
     # giftcards
     total_without_giftcard = (
@@ -1373,11 +1377,23 @@ def _create_order_from_checkout(
     update_order_display_gross_prices(order)
 
     # order search
-    order.search_vector = FlatConcatSearchVector(
-        *prepare_order_search_vector_value(order)
-    )
+    if fast_path:
+        transaction.on_commit(lambda: update_order_search_vector(order))
+    else:
+        order.search_vector = FlatConcatSearchVector(
+            *prepare_order_search_vector_value(order)
+        )
     order.save()
 
+    if fast_path:
+        _handle_allocations_of_order_lines(
+            checkout_info=checkout_info,
+            checkout_lines=checkout_lines_info,
+            order_lines_info=order_lines_info,
+            manager=manager,
+            reservation_enabled=reservation_enabled,
+        )
+
     # post create actions
     _post_create_order_actions(
         order=order,
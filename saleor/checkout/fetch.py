@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 from uuid import UUID
 
 from django.conf import settings
+from django.db.models import prefetch_related_objects
 from prices import Money
 
 from ..core.db.connection import allow_writer
@@ -571,6 +572,59 @@ def fetch_checkout_info(
     return checkout_info
 
 
+# Checkout relations used while building `CheckoutInfo` which are not already
+# selected with the checkout by the checkout mutations.
+CHECKOUT_CONTEXT_PREFETCH_LOOKUPS = (
+    "user",
+    "collection_point__address",
+    "channel__tax_configuration__country_exceptions",
+)
+
+
+def fetch_checkout_context(
+    checkout: "Checkout",
+    manager: "PluginsManager",
+    shipping_channel_listings: Optional[
+        Iterable["ShippingMethodChannelListing"]
+    ] = None,
+    prefetch_variant_attributes: bool = False,
+    skip_lines_with_unavailable_variants: bool = True,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> tuple[CheckoutInfo, Iterable[CheckoutLineInfo], Iterable[int]]:
+    """Fetch checkout lines and checkout info together.
+
+    The voucher is fetched once and shared between lines and checkout info, and the
+    remaining checkout relations are prefetched up front, so the number of queries
+    doesn't depend on the number of lines.
+    """
+    from .utils import get_voucher_for_checkout
+
+    prefetch_related_objects([checkout], *CHECKOUT_CONTEXT_PREFETCH_LOOKUPS)
+    voucher, voucher_code = get_voucher_for_checkout(
+        checkout,
+        channel_slug=checkout.channel.slug,
+        with_prefetch=True,
+        database_connection_name=database_connection_name,
+    )
+    lines, unavailable_variant_pks = fetch_checkout_lines(
+        checkout,
+        prefetch_variant_attributes=prefetch_variant_attributes,
+        skip_lines_with_unavailable_variants=skip_lines_with_unavailable_variants,
+        voucher=voucher,
+        database_connection_name=database_connection_name,
+    )
+    checkout_info = fetch_checkout_info(
+        checkout,
+        lines,
+        manager,
+        shipping_channel_listings,
+        voucher=voucher,
+        voucher_code=voucher_code,
+        database_connection_name=database_connection_name,
+    )
+    return checkout_info, lines, unavailable_variant_pks
+
+
 def get_valid_internal_shipping_method_list_for_checkout_info(
     checkout_info: "CheckoutInfo",
     shipping_address: Optional["Address"],
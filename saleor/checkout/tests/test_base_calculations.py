@@ -11,6 +11,8 @@ from ..base_calculations import (
     calculate_base_line_total_price,
     calculate_base_line_unit_price,
     checkout_total,
+    get_line_total_price_with_propagated_checkout_discount,
+    get_lines_total_prices_with_propagated_checkout_discount,
 )
 from ..fetch import fetch_checkout_info, fetch_checkout_lines
 
@@ -970,3 +972,37 @@ def test_checkout_total_gift_promotion(
         net * checkout.lines.first().quantity + shipping_channel_listings.price
     )
     assert total == expected_price
+
+
+def test_get_lines_total_prices_with_propagated_checkout_discount(
+    checkout_with_items, voucher
+):
+    # given
+    manager = get_plugins_manager(allow_replica=False)
+    checkout = checkout_with_items
+    checkout.voucher_code = voucher.code
+    checkout.discount = Money(7, checkout.currency)
+    checkout.save()
+
+    checkout_lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, checkout_lines, manager)
+
+    # when
+    prices = get_lines_total_prices_with_propagated_checkout_discount(
+        checkout_info, checkout_lines
+    )
+
+    # then
+    assert prices == {
+        line_info.line.id: get_line_total_price_with_propagated_checkout_discount(
+            checkout_info, checkout_lines, line_info
+        )
+        for line_info in checkout_lines
+    }
+    base_total = sum(
+        (calculate_base_line_total_price(line_info) for line_info in checkout_lines),
+        Money(0, checkout.currency),
+    )
+    assert sum(prices.values(), Money(0, checkout.currency)) == (
+        base_total - checkout.discount
+    )
@@ -28,9 +28,11 @@ from ...tax.calculations.checkout import update_checkout_prices_with_flat_rates
 from ..base_calculations import (
     base_checkout_delivery_price,
     calculate_base_line_total_price,
+    get_lines_total_prices_with_propagated_checkout_discount,
 )
 from ..calculations import (
     _apply_tax_data,
+    _apply_tax_data_from_plugins,
     _calculate_and_add_tax,
     _set_checkout_base_prices,
     fetch_checkout_data,
@@ -239,6 +241,71 @@ def test_fetch_checkout_data_flat_rates(
     assert checkout.shipping_tax_rate == Decimal("0.2300")
 
 
+@patch("saleor.checkout.utils.checkout_lines_bulk_update")
+def test_fetch_checkout_data_saves_only_lines_with_changed_prices(
+    mocked_checkout_lines_bulk_update, checkout_with_items, fetch_kwargs
+):
+    # given
+    tc = checkout_with_items.channel.tax_configuration
+    tc.tax_calculation_strategy = TaxCalculationStrategy.FLAT_RATES
+    tc.save()
+    fetch_checkout_data(**fetch_kwargs, force_update=True)
+    mocked_checkout_lines_bulk_update.reset_mock()
+
+    line = fetch_kwargs["lines"][0].line
+    line.quantity += 1
+
+    # when
+    fetch_checkout_data(**fetch_kwargs, force_update=True)
+
+    # then
+    mocked_checkout_lines_bulk_update.assert_called_once()
+    lines_to_update = mocked_checkout_lines_bulk_update.call_args.args[0]
+    assert lines_to_update == [line]
+
+
+@patch(
+    "saleor.checkout.base_calculations."
+    "get_line_total_price_with_propagated_checkout_discount"
+)
+@patch(
+    "saleor.checkout.base_calculations."
+    "get_lines_total_prices_with_propagated_checkout_discount",
+    wraps=get_lines_total_prices_with_propagated_checkout_discount,
+)
+def test_apply_tax_data_from_plugins_propagates_checkout_discount_once(
+    mocked_get_lines_total_prices,
+    mocked_get_line_total_price,
+    checkout_with_items,
+    voucher,
+    fetch_kwargs,
+):
+    # given
+    checkout = checkout_with_items
+    checkout.voucher_code = voucher.code
+    checkout.discount = Money(7, checkout.currency)
+    checkout.save()
+    lines = fetch_kwargs["lines"]
+    checkout_info = fetch_checkout_info(checkout, lines, fetch_kwargs["manager"])
+
+    # when
+    _apply_tax_data_from_plugins(
+        checkout,
+        fetch_kwargs["manager"],
+        checkout_info,
+        lines,
+        fetch_kwargs["address"],
+    )
+
+    # then
+    mocked_get_lines_total_prices.assert_called_once()
+    mocked_get_line_total_price.assert_not_called()
+    assert checkout.subtotal.gross == sum(
+        (line_info.line.total_price.gross for line_info in lines),
+        Money(0, checkout.currency),
+    )
+
+
 @patch(
     "saleor.checkout.calculations.update_checkout_prices_with_flat_rates",
     wraps=update_checkout_prices_with_flat_rates,
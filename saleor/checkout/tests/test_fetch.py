@@ -1,12 +1,19 @@
 from decimal import Decimal
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from prices import Money
 
 from ...core.prices import quantize_price
 from ...product.models import ProductChannelListing, ProductVariantChannelListing
 from ..calculations import fetch_checkout_data
-from ..fetch import CheckoutLineInfo, fetch_checkout_info, fetch_checkout_lines
+from ..fetch import (
+    CheckoutLineInfo,
+    fetch_checkout_context,
+    fetch_checkout_info,
+    fetch_checkout_lines,
+)
 
 
 def test_checkout_line_info_undiscounted_unit_price(checkout_with_item_on_promotion):
@@ -506,3 +513,62 @@ def test_fetch_checkout_lines_info_when_variant_channel_listing_without_price(
     line = lines[0]
     assert line_info.line.pk == line.pk
     assert unavailable_variants == [line.variant_id]
+
+
+def _count_fetch_checkout_context_queries(checkout, manager):
+    checkout = type(checkout).objects.get(pk=checkout.pk)
+    with CaptureQueriesContext(connection) as queries:
+        checkout_info, lines, _ = fetch_checkout_context(checkout, manager)
+    return len(queries), lines
+
+
+def test_fetch_checkout_context_queries_do_not_depend_on_lines_count(
+    checkout_with_items, voucher, plugins_manager
+):
+    # given
+    checkout = checkout_with_items
+    checkout.voucher_code = voucher.code
+    checkout.save(update_fields=["voucher_code"])
+    many_lines_queries, lines = _count_fetch_checkout_context_queries(
+        checkout, plugins_manager
+    )
+    assert len(lines) > 1
+
+    # when
+    checkout.lines.exclude(pk=lines[0].line.pk).delete()
+    single_line_queries, lines = _count_fetch_checkout_context_queries(
+        checkout, plugins_manager
+    )
+
+    # then
+    assert len(lines) == 1
+    assert single_line_queries == many_lines_queries
+
+
+def test_fetch_checkout_context_matches_separate_fetch(
+    checkout_with_items, voucher, plugins_manager
+):
+    # given
+    checkout = checkout_with_items
+    checkout.voucher_code = voucher.code
+    checkout.save(update_fields=["voucher_code"])
+    expected_lines, _ = fetch_checkout_lines(checkout)
+    expected_checkout_info = fetch_checkout_info(
+        checkout, expected_lines, plugins_manager
+    )
+
+    # when
+    checkout_info, lines, unavailable_variant_pks = fetch_checkout_context(
+        checkout, plugins_manager
+    )
+
+    # then
+    assert [line_info.line for line_info in lines] == [
+        line_info.line for line_info in expected_lines
+    ]
+    assert not unavailable_variant_pks
+    assert checkout_info.voucher == expected_checkout_info.voucher
+    assert checkout_info.voucher_code == expected_checkout_info.voucher_code
+    assert checkout_info.shipping_channel_listings == (
+        expected_checkout_info.shipping_channel_listings
+    )
@@ -12,6 +12,7 @@ from ...core.prices import quantize_price
 from ...core.taxes import zero_money, zero_taxed_money
 from ...giftcard import GiftCardEvents
 from ...giftcard.models import GiftCard, GiftCardEvent
+from ...order.models import Order
 from ...plugins.manager import get_plugins_manager
 from ...product.models import ProductTranslation, ProductVariantTranslation
 from ...tests.utils import flush_post_commit_hooks
@@ -47,6 +48,80 @@ def test_create_order_insufficient_stock(
         )
 
 
+@override_settings(CHECKOUT_COMPLETE_FAST_PATH_ENABLED=True)
+def test_create_order_insufficient_stock_fast_path(
+    checkout, customer_user, product_without_shipping, app
+):
+    # given
+    variant = product_without_shipping.variants.get()
+    manager = get_plugins_manager(allow_replica=False)
+    checkout_info = fetch_checkout_info(checkout, [], manager)
+    add_variant_to_checkout(checkout_info, variant, 10, check_quantity=False)
+    checkout.user = customer_user
+    checkout.billing_address = customer_user.default_billing_address
+    checkout.shipping_address = customer_user.default_billing_address
+    checkout.save()
+
+    checkout_lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, checkout_lines, manager)
+
+    # when
+    with pytest.raises(InsufficientStock):
+        create_order_from_checkout(
+            checkout_info=checkout_info,
+            manager=manager,
+            user=None,
+            app=app,
+        )
+
+    # then
+    assert not Order.objects.exists()
+    assert Checkout.objects.filter(pk=checkout.pk).exists()
+
+
+@override_settings(CHECKOUT_COMPLETE_FAST_PATH_ENABLED=True)
+def test_create_order_fast_path(
+    checkout_with_item,
+    customer_user,
+    shipping_method,
+    app,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    checkout = checkout_with_item
+    checkout.user = customer_user
+    checkout.billing_address = customer_user.default_billing_address
+    checkout.shipping_address = customer_user.default_billing_address
+    checkout.shipping_method = shipping_method
+    checkout.save()
+    checkout_line = checkout.lines.get()
+
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        order = create_order_from_checkout(
+            checkout_info=checkout_info,
+            manager=manager,
+            user=None,
+            app=app,
+        )
+
+    # then
+    order_line = order.lines.get()
+    assert order_line.allocations.get().quantity_allocated == checkout_line.quantity
+    assert not Checkout.objects.filter(pk=checkout.pk).exists()
+    order.refresh_from_db()
+    assert not order.search_vector
+
+    for callback in callbacks:
+        callback()
+    order.refresh_from_db()
+    assert order.search_vector
+
+
 @pytest.mark.parametrize("is_anonymous_user", [True, False])
 def test_create_order_with_gift_card(
     checkout_with_gift_card, customer_user, shipping_method, is_anonymous_user, app
@@ -1,12 +1,16 @@
+from datetime import timedelta
 from decimal import Decimal
+from unittest import mock
 
 import graphene
 import pytest
+from django.utils import timezone
 from prices import Money, TaxedMoney
 
 from ...discount import DiscountType, DiscountValueType
 from ...tax.calculations import get_taxed_undiscounted_price
-from ..utils import checkout_info_for_logs
+from ...warehouse.models import Reservation
+from ..utils import checkout_info_for_logs, checkout_lines_bulk_delete, delete_checkouts
 
 BASE = Money("35.00", "USD")
 
@@ -89,3 +93,50 @@ def test_checkout_info_for_logs(checkout_info, voucher, order_promotion_with_rul
     assert extra["checkout_id"] == graphene.Node.to_global_id("Checkout", checkout.pk)
     assert extra["discounts"]
     assert extra["lines"][0]["discounts"]
+
+
+@mock.patch("saleor.warehouse.tasks.update_variants_channel_availability_task.delay")
+def test_checkout_lines_bulk_delete_updates_reserved_variants_availability(
+    mocked_update_task,
+    checkout_line_with_reservation_in_many_stocks,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.VARIANT_CHANNEL_AVAILABILITY_ENABLED = True
+    line = checkout_line_with_reservation_in_many_stocks
+    stock_ids = set(
+        Reservation.objects.filter(checkout_line=line).values_list(
+            "stock_id", flat=True
+        )
+    )
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        checkout_lines_bulk_delete([line.pk])
+
+    # then
+    mocked_update_task.assert_called_once()
+    assert set(mocked_update_task.call_args.kwargs["stock_ids"]) == stock_ids
+
+
+@mock.patch("saleor.warehouse.tasks.update_variants_channel_availability_task.delay")
+def test_delete_checkouts_skips_expired_reservations(
+    mocked_update_task,
+    checkout_line_with_reservation_in_many_stocks,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.VARIANT_CHANNEL_AVAILABILITY_ENABLED = True
+    line = checkout_line_with_reservation_in_many_stocks
+    Reservation.objects.filter(checkout_line=line).update(
+        reserved_until=timezone.now() - timedelta(minutes=1)
+    )
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        delete_checkouts([line.checkout_id])
+
+    # then
+    mocked_update_task.assert_not_called()
@@ -52,7 +52,10 @@ from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
 from ..shipping.utils import convert_to_shipping_method_data
 from ..warehouse.availability import check_stock_and_preorder_quantity
 from ..warehouse.models import Warehouse
-from ..warehouse.reservations import reserve_stocks_and_preorders
+from ..warehouse.reservations import (
+    reserve_stocks_and_preorders,
+    schedule_variants_channel_availability_update_for_checkout_lines,
+)
 from . import AddressType, base_calculations, calculations
 from .error_codes import CheckoutErrorCode
 from .models import Checkout, CheckoutLine, CheckoutMetadata
@@ -136,6 +139,9 @@ def checkout_lines_bulk_update(
 def checkout_lines_bulk_delete(line_pks_to_delete: list[UUID]):
     """Delete CheckoutLines with lock applied on them."""
     with transaction.atomic():
+        schedule_variants_channel_availability_update_for_checkout_lines(
+            CheckoutLine.objects.filter(pk__in=line_pks_to_delete)
+        )
         CheckoutLine.objects.filter(
             id__in=checkout_lines_qs_select_for_update()
             .filter(pk__in=line_pks_to_delete)
@@ -146,6 +152,9 @@ def checkout_lines_bulk_delete(line_pks_to_delete: list[UUID]):
 def delete_checkouts(checkout_pks_to_delete: list[UUID]) -> int:
     """Delete a checouts with lock applied on them."""
     with transaction.atomic():
+        schedule_variants_channel_availability_update_for_checkout_lines(
+            CheckoutLine.objects.filter(checkout_id__in=checkout_pks_to_delete)
+        )
         CheckoutLine.objects.filter(
             id__in=CheckoutLine.objects.order_by("id")
             .select_for_update()
@@ -257,6 +266,7 @@ def add_variant_to_checkout(
 
     if new_quantity == 0:
         if line is not None:
+            schedule_variants_channel_availability_update_for_checkout_lines([line])
             line.delete()
     elif line is None:
         checkout.lines.create(
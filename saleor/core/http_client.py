@@ -1,3 +1,9 @@
+import threading
+import time
+from collections import OrderedDict
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlparse
+
 import requests_hardened
 from django.conf import settings
 
@@ -12,3 +18,108 @@ HTTPConfig = requests_hardened.Config(
 )
 
 HTTPClient = requests_hardened.Manager(HTTPConfig)
+
+
+class HTTPSessionPool:
+    """Long-lived HTTP sessions reused between requests to the same host.
+
+    Every thread keeps its own sessions, one per scheme and host of the target
+    URL, so consecutive requests to the same app reuse open keep-alive
+    connections instead of paying for a new TCP and TLS handshake. Sessions
+    idle for longer than `keep_alive_timeout` are closed and replaced, the
+    least recently used ones are closed when more than `size` hosts are kept.
+
+    Cookies are never stored, requests are sent as if each of them used a new
+    session.
+    """
+
+    def __init__(self, manager: requests_hardened.Manager):
+        self.manager = manager
+        self._local = threading.local()
+
+    @property
+    def _sessions(self) -> OrderedDict:
+        sessions = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = OrderedDict()
+        return sessions
+
+    def send_request(
+        self,
+        method: str,
+        url: str,
+        size: int,
+        keep_alive_timeout: float,
+        **kwargs,
+    ):
+        """Send the request and return the response with `connection_reused` set."""
+        session = self.get_session(url, size, keep_alive_timeout)
+        connections = _count_connections(session)
+        response = session.request(method, url, **kwargs)
+        response.connection_reused = _count_connections(session) == connections
+        return response
+
+    def get_session(self, url: str, size: int, keep_alive_timeout: float):
+        parts = urlparse(url)
+        key = (parts.scheme, parts.netloc)
+        sessions = self._sessions
+        now = time.monotonic()
+        entry = sessions.pop(key, None)
+        if entry is not None:
+            session, last_used_at = entry
+            if now - last_used_at > keep_alive_timeout:
+                session.close()
+                entry = None
+        if entry is None:
+            session = self._create_session()
+        sessions[key] = (session, now)
+        while len(sessions) > size:
+            _, (evicted_session, _) = sessions.popitem(last=False)
+            evicted_session.close()
+        return session
+
+    def _create_session(self):
+        session = requests_hardened.HTTPSession(self.manager.config)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def clear(self):
+        """Close all sessions of the current thread."""
+        sessions = self._sessions
+        while sessions:
+            _, (session, _) = sessions.popitem()
+            session.close()
+
+
+def _count_connections(session) -> int:
+    count = 0
+    for adapter in session.adapters.values():
+        pools = getattr(adapter, "poolmanager", None)
+        if pools is None:
+            continue
+        pools = pools.pools
+        count += sum(pools[key].num_connections for key in pools.keys())
+    return count
+
+
+HTTPSessions = HTTPSessionPool(HTTPClient)
+
+
+def send_pooled_request(method: str, url: str, **kwargs):
+    """Send a request through a pooled keep-alive session when enabled.
+
+    Falls back to a new session per request when
+    `HTTP_KEEP_ALIVE_ENABLED` is off. The returned response has
+    `connection_reused` set to `True` when no new connection was opened.
+    """
+    if not settings.HTTP_KEEP_ALIVE_ENABLED:
+        response = HTTPClient.send_request(method, url, **kwargs)
+        response.connection_reused = False
+        return response
+    return HTTPSessions.send_request(
+        method,
+        url,
+        size=settings.HTTP_SESSION_POOL_SIZE,
+        keep_alive_timeout=settings.HTTP_KEEP_ALIVE_TIMEOUT,
+        **kwargs,
+    )
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0011_eventpayload_payload_file"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PersistedQuery",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("query_hash", models.CharField(max_length=64, unique=True)),
+                ("query", models.TextField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ("pk",),
+            },
+        ),
+    ]
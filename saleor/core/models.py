@@ -236,3 +236,12 @@ class EventDeliveryAttempt(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+
+
+class PersistedQuery(models.Model):
+    query_hash = models.CharField(max_length=64, unique=True)
+    query = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("pk",)
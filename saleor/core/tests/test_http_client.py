@@ -1,10 +1,12 @@
+from unittest import mock
+
 import pytest
 import requests_hardened
 from requests import Request
 from requests_hardened.ip_filter import InvalidIPAddress
 
 from ... import user_agent_version
-from ..http_client import HTTPClient, HTTPConfig
+from ..http_client import HTTPClient, HTTPConfig, HTTPSessionPool, send_pooled_request
 
 
 def test_user_agent_override():
@@ -42,3 +44,102 @@ def test_http_client_disallows_private_ip_ranges(protocol):
     # Should not reject public IP ranges (sanity check).
     response = http_manager.send_request("GET", f"{protocol}://example.com")
     assert response.status_code == 200
+
+
+@pytest.fixture
+def session_pool():
+    pool = HTTPSessionPool(HTTPClient)
+    yield pool
+    pool.clear()
+
+
+def test_session_pool_reuses_session_for_host(session_pool):
+    # given
+    session = session_pool.get_session("https://example.com/a", 2, 30)
+
+    # when
+    same_host_session = session_pool.get_session("https://example.com/b", 2, 30)
+    other_host_session = session_pool.get_session("https://example.org/a", 2, 30)
+
+    # then
+    assert same_host_session is session
+    assert other_host_session is not session
+
+
+def test_session_pool_closes_least_recently_used_session(session_pool):
+    # given
+    first = session_pool.get_session("https://first.com", 2, 30)
+    second = session_pool.get_session("https://second.com", 2, 30)
+    session_pool.get_session("https://first.com", 2, 30)
+
+    # when
+    with mock.patch.object(second, "close") as mocked_close:
+        session_pool.get_session("https://third.com", 2, 30)
+
+    # then
+    mocked_close.assert_called_once_with()
+    assert session_pool.get_session("https://first.com", 2, 30) is first
+
+
+def test_session_pool_replaces_idle_session(session_pool):
+    # given
+    session = session_pool.get_session("https://example.com", 2, 30)
+
+    # when
+    with mock.patch("saleor.core.http_client.time.monotonic", return_value=10**9):
+        new_session = session_pool.get_session("https://example.com", 2, 30)
+
+    # then
+    assert new_session is not session
+
+
+@mock.patch.object(requests_hardened.HTTPSession, "request")
+def test_session_pool_send_request(mocked_request, session_pool):
+    # when
+    response = session_pool.send_request("POST", "https://example.com", 2, 30)
+
+    # then
+    mocked_request.assert_called_once_with("POST", "https://example.com")
+    assert response.connection_reused is True
+
+
+@mock.patch("saleor.core.http_client.HTTPSessions.send_request")
+@mock.patch("saleor.core.http_client.HTTPClient.send_request")
+def test_send_pooled_request_uses_session_pool(
+    mocked_send_request, mocked_session_pool_send_request, settings
+):
+    # given
+    settings.HTTP_KEEP_ALIVE_ENABLED = True
+
+    # when
+    response = send_pooled_request("POST", "https://example.com", timeout=1)
+
+    # then
+    mocked_send_request.assert_not_called()
+    mocked_session_pool_send_request.assert_called_once_with(
+        "POST",
+        "https://example.com",
+        size=settings.HTTP_SESSION_POOL_SIZE,
+        keep_alive_timeout=settings.HTTP_KEEP_ALIVE_TIMEOUT,
+        timeout=1,
+    )
+    assert response == mocked_session_pool_send_request.return_value
+
+
+@mock.patch("saleor.core.http_client.HTTPSessions.send_request")
+@mock.patch("saleor.core.http_client.HTTPClient.send_request")
+def test_send_pooled_request_keep_alive_disabled(
+    mocked_send_request, mocked_session_pool_send_request, settings
+):
+    # given
+    settings.HTTP_KEEP_ALIVE_ENABLED = False
+
+    # when
+    response = send_pooled_request("POST", "https://example.com", timeout=1)
+
+    # then
+    mocked_session_pool_send_request.assert_not_called()
+    mocked_send_request.assert_called_once_with(
+        "POST", "https://example.com", timeout=1
+    )
+    assert response.connection_reused is False
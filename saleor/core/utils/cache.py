@@ -4,6 +4,7 @@ import collections
 class CacheDict(collections.OrderedDict):
     def __init__(self, capacity: int):
         self.capacity = capacity
+        self.evictions = 0
         super().__init__()
 
     def __getitem__(self, key):
@@ -18,3 +19,4 @@ class CacheDict(collections.OrderedDict):
         while len(self) > self.capacity:
             surplus = next(iter(self))
             super().__delitem__(surplus)
+            self.evictions += 1
@@ -1,3 +1,8 @@
+from collections import defaultdict
+from functools import partial
+from typing import Optional
+
+from django.conf import settings
 from django.db import transaction
 
 from ...checkout.fetch import CheckoutInfo
@@ -109,6 +114,86 @@ def webhook_async_event_requires_sync_webhooks_to_trigger(
     return True
 
 
+# Plugin manager events called once per object when the transaction is committed.
+COALESCED_EVENTS = {"product_updated", "product_variant_updated"}
+
+# Plugin manager events taking a list of objects; each object is passed to the event
+# once when the transaction is committed.
+MERGED_EVENTS = {"product_variant_stocks_updated"}
+
+
+def get_event_outbox_key(func_obj, func_args: tuple) -> Optional[tuple]:
+    """Return the key under which the event is deduplicated in the outbox.
+
+    Return `None` for events which are not handled by the outbox.
+    """
+    from ...plugins.manager import PluginsManager
+
+    manager = getattr(func_obj, "__self__", None)
+    if not isinstance(manager, PluginsManager) or not func_args:
+        return None
+    method_name = func_obj.__func__.__name__
+    if method_name in COALESCED_EVENTS:
+        instance = func_args[0]
+        return (id(manager), method_name, type(instance), instance.pk)
+    if method_name in MERGED_EVENTS:
+        return (id(manager), method_name)
+    return None
+
+
+# Attribute of the database connection holding the outbox of its transaction
+EVENT_OUTBOX_ATTRIBUTE = "saleor_event_outbox"
+
+
+class EventOutbox:
+    """Deduplicate plugin manager events called when a transaction is committed.
+
+    Each event is registered as a separate `on_commit` callback, so it keeps its
+    position among other callbacks and is dropped when its savepoint is rolled back.
+    Events from `COALESCED_EVENTS` are called once per object, by the first callback
+    that runs. Events from `MERGED_EVENTS` are called only with the objects which
+    were not passed to the event yet.
+    """
+
+    def __init__(self):
+        self.sent_keys: set[tuple] = set()
+        self.sent_pks: dict[tuple, set] = defaultdict(set)
+        self.flushed = False
+
+    def add(self, key: tuple, func_obj, func_args: tuple, func_kwargs: dict):
+        transaction.on_commit(partial(self.send, key, func_obj, func_args, func_kwargs))
+
+    def send(self, key: tuple, func_obj, func_args: tuple, func_kwargs: dict):
+        self.flushed = True
+        if key[1] in MERGED_EVENTS:
+            sent_pks = self.sent_pks[key]
+            instances = [
+                instance for instance in func_args[0] if instance.pk not in sent_pks
+            ]
+            if not instances:
+                return
+            sent_pks.update(instance.pk for instance in instances)
+            func_args = (instances, *func_args[1:])
+        elif key in self.sent_keys:
+            return
+        else:
+            self.sent_keys.add(key)
+        func_obj(*func_args, **func_kwargs)
+
+
+def _get_event_outbox(connection) -> EventOutbox:
+    """Return the outbox of the current transaction.
+
+    An outbox which started sending events belongs to an already committed
+    transaction, so a new one is created.
+    """
+    outbox = getattr(connection, EVENT_OUTBOX_ATTRIBUTE, None)
+    if outbox is None or outbox.flushed:
+        outbox = EventOutbox()
+        setattr(connection, EVENT_OUTBOX_ATTRIBUTE, outbox)
+    return outbox
+
+
 def call_event_including_protected_events(func_obj, *func_args, **func_kwargs):
     """Call event without additional validation.
 
@@ -118,7 +203,13 @@ def call_event_including_protected_events(func_obj, *func_args, **func_kwargs):
     """
     connection = transaction.get_connection()
     if connection.in_atomic_block:
-        transaction.on_commit(lambda: func_obj(*func_args, **func_kwargs))
+        key = None
+        if settings.EVENT_OUTBOX_ENABLED:
+            key = get_event_outbox_key(func_obj, func_args)
+        if key is not None:
+            _get_event_outbox(connection).add(key, func_obj, func_args, func_kwargs)
+        else:
+            transaction.on_commit(lambda: func_obj(*func_args, **func_kwargs))
     else:
         func_obj(*func_args, **func_kwargs)
 
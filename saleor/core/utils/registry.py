@@ -0,0 +1,93 @@
+"""Process-level registries of rarely changing database data.
+
+A registry is built from the writer database and served to every request and
+Celery task of the process, without querying the database each time.
+
+Any change to the data replaces the registry version stored in the cache, after
+the transaction is committed. Each process compares its registry with that
+version at most once per check interval and rebuilds it when stale. The writer
+is used, as a replica may not have the changes that replaced the version yet.
+
+Until the transaction that invalidated a registry is committed, the process
+that made the change builds registries without storing them, so neither its
+own uncommitted changes nor the rolled back ones are cached.
+"""
+
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ..db.connection import allow_writer
+
+T = TypeVar("T")
+
+
+class VersionedRegistry(Generic[T]):
+    def __init__(
+        self,
+        version_key: str,
+        build: Callable[[], T],
+        check_interval_setting: str,
+    ):
+        self.version_key = version_key
+        self.build = build
+        self.check_interval_setting = check_interval_setting
+        self._registry: Optional[T] = None
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._invalidation_pending = False
+
+    def get_version(self) -> int:
+        version = cache.get(self.version_key)
+        if version is None:
+            version = time.time_ns()
+            cache.add(self.version_key, version, timeout=None)
+            return cache.get(self.version_key, version)
+        return version
+
+    def get(self, check_version: bool = False) -> T:
+        """Return the registry, rebuilding it when its version is stale.
+
+        The version is compared at most once per check interval, unless
+        `check_version` is set.
+        """
+        if self._invalidation_pending:
+            if transaction.get_connection().in_atomic_block:
+                return self._build()
+            # the transaction was rolled back
+            self.clear()
+
+        interval = getattr(settings, self.check_interval_setting)
+        if (
+            self._registry is not None
+            and not check_version
+            and time.monotonic() - self._checked_at <= interval
+        ):
+            return self._registry
+
+        version = self.get_version()
+        if self._registry is None or self._version != version:
+            self._registry = self._build()
+            self._version = version
+        self._checked_at = time.monotonic()
+        return self._registry
+
+    def _build(self) -> T:
+        with allow_writer():
+            return self.build()
+
+    def clear(self):
+        self._registry = None
+        self._version = None
+        self._invalidation_pending = False
+
+    def invalidate(self, using: Optional[str] = None):
+        def invalidate():
+            self.clear()
+            cache.set(self.version_key, time.time_ns(), timeout=None)
+
+        self._invalidation_pending = True
+        transaction.on_commit(invalidate, using=using)
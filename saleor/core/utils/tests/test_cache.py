@@ -42,3 +42,17 @@ def test_eviction_order():
     assert 1 in cache
     assert 2 not in cache
     assert 3 in cache
+
+
+def test_evictions_are_counted():
+    # given
+    cache = CacheDict(2)
+    cache[1] = "a"
+    cache[2] = "b"
+
+    # when
+    cache[3] = "c"
+    cache[4] = "d"
+
+    # then
+    assert cache.evictions == 2
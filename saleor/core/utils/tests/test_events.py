@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
 import pytest
+from django.db import transaction
+from django.test import override_settings
 
 from ....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ....webhook.utils import get_webhooks_for_multiple_events
@@ -302,3 +304,189 @@ def test_webhook_async_event_requires_sync_webhooks_to_trigger_no_subscription_f
 
     # then
     assert should_trigger
+
+
+@override_settings(EVENT_OUTBOX_ENABLED=True)
+@patch("saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_plugins")
+def test_call_event_coalesces_events_for_the_same_object(
+    mocked_run_method_on_plugins,
+    product_list,
+    plugins_manager,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    first_product, second_product = product_list[:2]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            call_event(plugins_manager.product_updated, first_product)
+            call_event(plugins_manager.product_updated, second_product)
+            call_event(plugins_manager.product_updated, first_product)
+
+    # then
+    called_products = [
+        call.args[2] for call in mocked_run_method_on_plugins.call_args_list
+    ]
+    assert called_products == [first_product, second_product]
+
+
+@override_settings(EVENT_OUTBOX_ENABLED=True)
+@patch("saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_plugins")
+def test_call_event_skips_already_sent_stocks(
+    mocked_run_method_on_plugins,
+    stocks_for_cc,
+    plugins_manager,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    first_stock, second_stock = stocks_for_cc[:2]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            call_event(plugins_manager.product_variant_stocks_updated, [first_stock])
+            call_event(
+                plugins_manager.product_variant_stocks_updated,
+                [first_stock, second_stock],
+            )
+
+    # then
+    called_stocks = [
+        call.args[2] for call in mocked_run_method_on_plugins.call_args_list
+    ]
+    assert called_stocks == [[first_stock], [second_stock]]
+
+
+def _call_event_in_rolled_back_savepoint(func_obj, *func_args):
+    with transaction.atomic():
+        call_event(func_obj, *func_args)
+        raise ValueError("Rolled back")
+
+
+@override_settings(EVENT_OUTBOX_ENABLED=True)
+@patch("saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_plugins")
+def test_call_event_drops_events_from_rolled_back_savepoint(
+    mocked_run_method_on_plugins,
+    product_list,
+    plugins_manager,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    first_product, second_product = product_list[:2]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            call_event(plugins_manager.product_updated, first_product)
+            with pytest.raises(ValueError, match="Rolled back"):
+                _call_event_in_rolled_back_savepoint(
+                    plugins_manager.product_updated, second_product
+                )
+
+    # then
+    mocked_run_method_on_plugins.assert_called_once()
+    assert mocked_run_method_on_plugins.call_args.args[2] == first_product
+
+
+@override_settings(EVENT_OUTBOX_ENABLED=True)
+@patch("saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_plugins")
+def test_call_event_keeps_events_after_savepoint_creating_outbox_is_rolled_back(
+    mocked_run_method_on_plugins,
+    product_list,
+    plugins_manager,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    first_product, second_product = product_list[:2]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            with pytest.raises(ValueError, match="Rolled back"):
+                _call_event_in_rolled_back_savepoint(
+                    plugins_manager.product_updated, first_product
+                )
+            call_event(plugins_manager.product_updated, second_product)
+            call_event(plugins_manager.product_updated, first_product)
+
+    # then
+    called_products = [
+        call.args[2] for call in mocked_run_method_on_plugins.call_args_list
+    ]
+    assert called_products == [second_product, first_product]
+
+
+@override_settings(EVENT_OUTBOX_ENABLED=True)
+@patch("saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_plugins")
+def test_call_event_keeps_order_of_events_emitted_after_outbox_creation(
+    mocked_run_method_on_plugins,
+    product_list,
+    plugins_manager,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    first_product, second_product = product_list[:2]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            call_event(plugins_manager.product_updated, first_product)
+            call_event(plugins_manager.product_created, second_product)
+            call_event(plugins_manager.product_updated, second_product)
+
+    # then
+    called_events = [
+        (call.args[0], call.args[2])
+        for call in mocked_run_method_on_plugins.call_args_list
+    ]
+    assert called_events == [
+        ("product_updated", first_product),
+        ("product_created", second_product),
+        ("product_updated", second_product),
+    ]
+
+
+@override_settings(EVENT_OUTBOX_ENABLED=True)
+@patch("saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_plugins")
+def test_call_event_keeps_order_relative_to_other_on_commit_callbacks(
+    mocked_run_method_on_plugins,
+    product_list,
+    plugins_manager,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    first_product, second_product = product_list[:2]
+    calls = []
+    mocked_run_method_on_plugins.side_effect = lambda *args, **kwargs: calls.append(
+        args[2]
+    )
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            call_event(plugins_manager.product_updated, first_product)
+            transaction.on_commit(lambda: calls.append("callback"))
+            call_event(plugins_manager.product_updated, second_product)
+            call_event(plugins_manager.product_updated, first_product)
+
+    # then
+    assert calls == [first_product, "callback", second_product]
+
+
+@override_settings(EVENT_OUTBOX_ENABLED=False)
+@patch("saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_plugins")
+def test_call_event_without_outbox(
+    mocked_run_method_on_plugins,
+    product,
+    plugins_manager,
+    django_capture_on_commit_callbacks,
+):
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            call_event(plugins_manager.product_updated, product)
+            call_event(plugins_manager.product_updated, product)
+
+    # then
+    assert mocked_run_method_on_plugins.call_count == 2
@@ -1,11 +1,18 @@
-from functools import partial
+import logging
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from functools import cached_property, partial
+from typing import Optional
 
 import graphql
+from django.conf import settings
 from django.urls import reverse
 from django.utils.functional import SimpleLazyObject
 from graphql import (
     GraphQLCachedBackend,
     GraphQLCoreBackend,
+    GraphQLError,
     GraphQLScalarType,
     GraphQLSchema,
     execute,
@@ -25,6 +32,7 @@ from .checkout.schema import CheckoutMutations, CheckoutQueries
 from .core.enums import unit_enums
 from .core.federation.schema import build_federated_schema
 from .core.schema import CoreMutations, CoreQueries
+from .core.validators.query_cost import QueryCostPlan, build_query_cost_plan
 from .csv.schema import CsvMutations, CsvQueries
 from .discount.schema import DiscountMutations, DiscountQueries
 from .giftcard.schema import GiftCardMutations, GiftCardQueries
@@ -34,13 +42,16 @@ from .meta.schema import MetaMutations
 from .order.schema import OrderMutations, OrderQueries
 from .page.schema import PageMutations, PageQueries
 from .payment.schema import PaymentMutations, PaymentQueries
-from .pharmacy.schema import SiteSettingsQueries, SiteSettingsMutations
+from .pharmacy.schema import SiteSettingsMutations, SiteSettingsQueries
 from .plugins.schema import PluginsMutations, PluginsQueries
 from .product.schema import ProductMutations, ProductQueries
+from .query_cost_map import COST_MAP
 from .shipping.schema import ShippingMutations, ShippingQueries
 from .shop.schema import ShopMutations, ShopQueries
 from .tax.schema import TaxMutations, TaxQueries
 from .translations.schema import TranslationQueries
+from .utils import query_fingerprint, query_identifier
+from .utils.validators import check_if_query_contains_only_schema
 from .warehouse.schema import (
     StockMutations,
     StockQueries,
@@ -50,6 +61,8 @@ from .warehouse.schema import (
 from .webhook.schema import WebhookMutations, WebhookQueries
 from .webhook.subscription_types import WEBHOOK_TYPES_MAP, Subscription
 
+logger = logging.getLogger(__name__)
+
 API_PATH = SimpleLazyObject(lambda: reverse("api"))
 
 
@@ -190,6 +203,52 @@ def _fail(errors, **_kwargs) -> ExecutionResult:
     return ExecutionResult(errors=errors, invalid=True)
 
 
+class SaleorGraphQLDocument(GraphQLDocument):
+    """GraphQL document memoizing the analyses derived from its AST.
+
+    Documents are kept in the backend's cache, so the values computed here are
+    shared by all requests sending the same query string.
+    """
+
+    def __init__(self, *args, validation_errors=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.validation_errors: list[GraphQLError] = validation_errors or []
+
+    @cached_property
+    def query_identifier(self) -> str:
+        return query_identifier(self)
+
+    @cached_property
+    def query_fingerprint(self) -> str:
+        return query_fingerprint(self)
+
+    @cached_property
+    def _contains_only_schema(self) -> tuple[bool, Optional[GraphQLError]]:
+        try:
+            return check_if_query_contains_only_schema(self), None
+        except GraphQLError as e:
+            return False, e
+
+    def contains_only_schema(self) -> bool:
+        """Return True if the query requests only the `__schema` field.
+
+        Raise GraphQLError when the introspection is mixed with other fields.
+        """
+        contains_only_schema, error = self._contains_only_schema
+        if error:
+            raise error
+        return contains_only_schema
+
+    @cached_property
+    def query_cost_plan(self) -> QueryCostPlan:
+        return build_query_cost_plan(self.schema, self.document_ast, COST_MAP)
+
+    def get_query_cost(
+        self, variables: Optional[dict], maximum_cost: int
+    ) -> tuple[int, Optional[list[GraphQLError]]]:
+        return self.query_cost_plan.evaluate(variables, maximum_cost)
+
+
 class SaleorGraphQLBackend(GraphQLCoreBackend):
     def document_from_string(
         self,
@@ -200,14 +259,15 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         document_ast = parse(document_string)
         validation_errors = validate(schema, document_ast)
         if validation_errors:
-            return GraphQLDocument(
+            return SaleorGraphQLDocument(
                 schema=schema,
                 document_string=document_string,
                 document_ast=document_ast,
                 execute=partial(_fail, validation_errors),
+                validation_errors=validation_errors,
             )
 
-        return GraphQLDocument(
+        return SaleorGraphQLDocument(
             schema=schema,
             document_string=document_string,
             document_ast=document_ast,
@@ -215,4 +275,99 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         )
 
 
-backend = GraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1000))
+class SaleorGraphQLCachedBackend(GraphQLCachedBackend):
+    """Cached backend collecting hit, miss and eviction metrics.
+
+    The backend is shared by all threads of the process, so the cache and the
+    counters are accessed under a lock. Documents are parsed outside of it.
+    """
+
+    def __init__(self, backend: GraphQLCoreBackend, cache_map: CacheDict):
+        super().__init__(backend, cache_map=cache_map)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def document_from_string(
+        self,
+        schema: GraphQLSchema,
+        request_string: str,  # type: ignore[override]
+    ) -> GraphQLDocument:
+        document, _cache_hit = self.get_document(schema, request_string)
+        return document
+
+    def get_document(
+        self, schema: GraphQLSchema, request_string: str
+    ) -> tuple[GraphQLDocument, bool]:
+        """Return the document and whether it was served from the cache."""
+        key = self.get_key_for_schema_and_document_string(schema, request_string)
+        with self._lock:
+            document = self.cache_map[key] if key in self.cache_map else None
+            if document is not None:
+                self.hits += 1
+                return document, True
+            self.misses += 1
+        document = self.backend.document_from_string(schema, request_string)
+        with self._lock:
+            self.cache_map[key] = document
+        return document, False
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self.cache_map),
+                "capacity": self.cache_map.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.cache_map.evictions,
+            }
+
+
+def read_warm_up_operations(path: str) -> Iterator[str]:
+    """Yield query strings stored in a `.graphql` file or a directory of them."""
+    if os.path.isdir(path):
+        paths = sorted(
+            os.path.join(path, file_name)
+            for file_name in os.listdir(path)
+            if file_name.endswith(".graphql")
+        )
+    else:
+        paths = [path]
+    for file_path in paths:
+        with open(file_path, encoding="utf-8") as f:
+            yield f.read()
+
+
+def warm_up_document_cache(operations: Optional[Iterable[str]] = None) -> int:
+    """Parse, validate and analyse known operations ahead of the first request.
+
+    When no operations are given, the ones stored under
+    `GRAPHQL_DOCUMENT_CACHE_WARM_UP_PATH` are used. Return the number of
+    operations that were loaded into the cache.
+    """
+    if operations is None:
+        path = settings.GRAPHQL_DOCUMENT_CACHE_WARM_UP_PATH
+        if not path:
+            return 0
+        operations = read_warm_up_operations(path)
+
+    count = 0
+    for operation in operations:
+        try:
+            document = backend.document_from_string(schema, operation)
+        except Exception:
+            logger.warning("Unable to warm up GraphQL operation.", exc_info=True)
+            continue
+        if isinstance(document, SaleorGraphQLDocument):
+            document.query_identifier  # noqa: B018
+            document.query_fingerprint  # noqa: B018
+            document._contains_only_schema  # noqa: B018
+            document.query_cost_plan  # noqa: B018
+        count += 1
+    logger.info("Warmed up GraphQL document cache with %s operations.", count)
+    return count
+
+
+backend = SaleorGraphQLCachedBackend(
+    SaleorGraphQLBackend(), cache_map=CacheDict(settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+)
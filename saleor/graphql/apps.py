@@ -0,0 +1,18 @@
+from django.apps import AppConfig, apps
+from django.db.models.signals import post_delete, post_save
+
+
+class GraphQLAppConfig(AppConfig):
+    name = "saleor.graphql"
+
+    def ready(self):
+        from .core.shared_cache import SHARED_CACHE_MODELS, invalidate_shared_cache
+
+        for model_label in SHARED_CACHE_MODELS:
+            model = apps.get_model(model_label)
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    invalidate_shared_cache,
+                    sender=model,
+                    dispatch_uid=f"invalidate_shared_cache_{model_label}",
+                )
@@ -19,6 +19,7 @@ from ...core.descriptions import ADDED_IN_315, PREVIEW_FEATURE
 from ...core.doc_category import DOC_CATEGORY_ATTRIBUTES
 from ...core.enums import ErrorPolicyEnum
 from ...core.mutations import BaseMutation, ModelMutation
+from ...core.shared_cache import invalidate_shared_cache_models
 from ...core.types import (
     AttributeBulkUpdateError,
     BaseInputObjectType,
@@ -573,6 +574,7 @@ class AttributeBulkUpdate(BaseMutation):
                 "external_reference",
             ],
         )
+        invalidate_shared_cache_models("attribute.Attribute")
 
         models.AttributeValue.objects.filter(
             id__in=[values_to_remove.id for values_to_remove in values_to_remove]
@@ -2,20 +2,22 @@ from django.db.models import Exists, OuterRef
 
 from ...channel.models import Channel
 from ...order.models import Order
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import DataLoader, SharedCacheDataLoader
 from ..order.dataloaders import OrderByIdLoader
 
 
-class ChannelByIdLoader(DataLoader):
+class ChannelByIdLoader(SharedCacheDataLoader):
     context_key = "channel_by_id"
+    shared_cache_models = ("channel.Channel",)
 
     def batch_load(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(keys)
         return [channels.get(channel_id) for channel_id in keys]
 
 
-class ChannelBySlugLoader(DataLoader):
+class ChannelBySlugLoader(SharedCacheDataLoader):
     context_key = "channel_by_slug"
+    shared_cache_models = ("channel.Channel",)
 
     def batch_load(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(
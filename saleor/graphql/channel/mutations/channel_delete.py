@@ -5,10 +5,13 @@ from django.core.exceptions import ValidationError
 
 from ....channel import models
 from ....channel.error_codes import ChannelErrorCode
-from ....checkout.models import Checkout
+from ....checkout.models import Checkout, CheckoutLine
 from ....core.tracing import traced_atomic_transaction
 from ....order.models import Order
 from ....permission.enums import ChannelPermissions
+from ....warehouse.reservations import (
+    schedule_variants_channel_availability_update_for_checkout_lines,
+)
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.doc_category import DOC_CATEGORY_CHANNELS
@@ -86,6 +89,9 @@ class ChannelDelete(ModelDeleteMutation):
 
     @classmethod
     def delete_checkouts(cls, origin_channel_id):
+        schedule_variants_channel_availability_update_for_checkout_lines(
+            CheckoutLine.objects.filter(checkout__channel_id=origin_channel_id)
+        )
         Checkout.objects.select_for_update().filter(
             channel_id=origin_channel_id
         ).delete()
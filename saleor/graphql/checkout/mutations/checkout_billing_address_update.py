@@ -2,7 +2,7 @@ import graphene
 
 from ....checkout import AddressType
 from ....checkout.actions import call_checkout_info_event
-from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ....checkout.fetch import fetch_checkout_context
 from ....checkout.utils import change_billing_address_in_checkout, invalidate_checkout
 from ....core.tracing import traced_atomic_transaction
 from ....webhook.event_types import WebhookEventAsyncType
@@ -17,7 +17,7 @@ from ...plugins.dataloaders import get_plugin_manager_promise
 from ..types import Checkout
 from .checkout_create import CheckoutAddressValidationRules
 from .checkout_shipping_address_update import CheckoutShippingAddressUpdate
-from .utils import get_checkout
+from .utils import get_checkout, prime_checkout_loaders
 
 
 class CheckoutBillingAddressUpdate(CheckoutShippingAddressUpdate):
@@ -94,8 +94,7 @@ class CheckoutBillingAddressUpdate(CheckoutShippingAddressUpdate):
             change_address_updated_fields = change_billing_address_in_checkout(
                 checkout, billing_address
             )
-            lines, _ = fetch_checkout_lines(checkout)
-            checkout_info = fetch_checkout_info(checkout, lines, manager)
+            checkout_info, lines, _ = fetch_checkout_context(checkout, manager)
             invalidate_prices_updated_fields = invalidate_checkout(
                 checkout_info,
                 lines,
@@ -114,4 +113,5 @@ class CheckoutBillingAddressUpdate(CheckoutShippingAddressUpdate):
             checkout_info=checkout_info,
             lines=lines,
         )
+        prime_checkout_loaders(info.context, checkout_info, lines)
         return CheckoutBillingAddressUpdate(checkout=checkout)
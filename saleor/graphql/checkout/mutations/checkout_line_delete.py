@@ -2,7 +2,7 @@ import graphene
 
 from ....checkout.actions import call_checkout_info_event
 from ....checkout.error_codes import CheckoutErrorCode
-from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ....checkout.fetch import fetch_checkout_context
 from ....checkout.utils import invalidate_checkout
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
@@ -14,7 +14,11 @@ from ...core.types import CheckoutError
 from ...core.utils import WebhookEventInfo, raise_validation_error
 from ...plugins.dataloaders import get_plugin_manager_promise
 from ..types import Checkout, CheckoutLine
-from .utils import get_checkout, update_checkout_shipping_method_if_invalid
+from .utils import (
+    get_checkout,
+    prime_checkout_loaders,
+    update_checkout_shipping_method_if_invalid,
+)
 
 
 class CheckoutLineDelete(BaseMutation):
@@ -78,8 +82,7 @@ class CheckoutLineDelete(BaseMutation):
             line.delete()
 
         manager = get_plugin_manager_promise(info.context).get()
-        lines, _ = fetch_checkout_lines(checkout)
-        checkout_info = fetch_checkout_info(checkout, lines, manager)
+        checkout_info, lines, _ = fetch_checkout_context(checkout, manager)
         update_checkout_shipping_method_if_invalid(checkout_info, lines)
         invalidate_checkout(checkout_info, lines, manager, save=True)
         call_checkout_info_event(
@@ -89,4 +92,5 @@ class CheckoutLineDelete(BaseMutation):
             lines=lines,
         )
 
+        prime_checkout_loaders(info.context, checkout_info, lines)
         return CheckoutLineDelete(checkout=checkout)
@@ -30,6 +30,7 @@ from .utils import (
     get_checkout,
     get_variants_and_total_quantities,
     group_lines_input_on_add,
+    prime_checkout_loaders,
     update_checkout_external_shipping_method_if_invalid,
     update_checkout_shipping_method_if_invalid,
     validate_variants_are_published,
@@ -236,6 +237,7 @@ class CheckoutLinesAdd(BaseMutation):
             lines=lines,
         )
 
+        prime_checkout_loaders(info.context, checkout_info, lines)
         return CheckoutLinesAdd(checkout=checkout)
 
     @classmethod
@@ -3,7 +3,7 @@ from django.core.exceptions import ValidationError
 
 from ....checkout.actions import call_checkout_info_event
 from ....checkout.error_codes import CheckoutErrorCode
-from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ....checkout.fetch import fetch_checkout_context
 from ....checkout.utils import invalidate_checkout
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
@@ -16,7 +16,11 @@ from ...core.utils import WebhookEventInfo
 from ...plugins.dataloaders import get_plugin_manager_promise
 from ...utils import resolve_global_ids_to_primary_keys
 from ..types import Checkout
-from .utils import get_checkout, update_checkout_shipping_method_if_invalid
+from .utils import (
+    get_checkout,
+    prime_checkout_loaders,
+    update_checkout_shipping_method_if_invalid,
+)
 
 
 class CheckoutLinesDelete(BaseMutation):
@@ -95,10 +99,8 @@ class CheckoutLinesDelete(BaseMutation):
         cls.validate_lines(checkout, lines_to_delete)
         checkout.lines.filter(id__in=lines_to_delete).delete()
 
-        lines, _ = fetch_checkout_lines(checkout)
-
         manager = get_plugin_manager_promise(info.context).get()
-        checkout_info = fetch_checkout_info(checkout, lines, manager)
+        checkout_info, lines, _ = fetch_checkout_context(checkout, manager)
         update_checkout_shipping_method_if_invalid(checkout_info, lines)
         invalidate_checkout(checkout_info, lines, manager, save=True)
         call_checkout_info_event(
@@ -108,4 +110,5 @@ class CheckoutLinesDelete(BaseMutation):
             lines=lines,
         )
 
+        prime_checkout_loaders(info.context, checkout_info, lines)
         return CheckoutLinesDelete(checkout=checkout)
@@ -38,6 +38,7 @@ from .utils import (
     ERROR_DOES_NOT_SHIP,
     check_lines_quantity,
     get_checkout,
+    prime_checkout_loaders,
     update_checkout_shipping_method_if_invalid,
 )
 
@@ -223,4 +224,5 @@ class CheckoutShippingAddressUpdate(AddressMetadataMixin, BaseMutation, I18nMixi
             lines=lines,
         )
 
+        prime_checkout_loaders(info.context, checkout_info, lines)
         return CheckoutShippingAddressUpdate(checkout=checkout)
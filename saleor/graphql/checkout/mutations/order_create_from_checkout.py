@@ -3,7 +3,7 @@ from django.core.exceptions import ValidationError
 
 from ....checkout.checkout_cleaner import validate_checkout
 from ....checkout.complete_checkout import create_order_from_checkout
-from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ....checkout.fetch import fetch_checkout_context
 from ....core.exceptions import GiftCardNotApplicable, InsufficientStock
 from ....discount.models import NotApplicable
 from ....permission.enums import CheckoutPermissions
@@ -177,8 +177,9 @@ class OrderCreateFromCheckout(BaseMutation):
             cls.validate_metadata_keys(private_metadata)
 
         manager = get_plugin_manager_promise(info.context).get()
-        checkout_lines, unavailable_variant_pks = fetch_checkout_lines(checkout)
-        checkout_info = fetch_checkout_info(checkout, checkout_lines, manager)
+        checkout_info, checkout_lines, unavailable_variant_pks = fetch_checkout_context(
+            checkout, manager
+        )
 
         validate_checkout(
             checkout_info=checkout_info,
@@ -40,6 +40,11 @@ from ....warehouse import models as warehouse_models
 from ....warehouse.availability import check_stock_and_preorder_quantity_bulk
 from ...core import ResolveInfo
 from ...core.validators import validate_one_of_args_is_in_mutation
+from ..dataloaders import (
+    CheckoutByTokenLoader,
+    CheckoutInfoByCheckoutTokenLoader,
+    CheckoutLinesInfoByCheckoutTokenLoader,
+)
 from ..types import Checkout
 
 if TYPE_CHECKING:
@@ -316,6 +321,26 @@ def get_checkout_by_token(
     return checkout
 
 
+def prime_checkout_loaders(
+    context,
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+):
+    """Let the checkout returned by the mutation reuse data loaded by the mutation.
+
+    The checkout, its info and lines are up to date at the end of the mutation, so
+    they replace any values cached before the change and the `Checkout` type
+    resolvers don't fetch them again.
+    """
+    checkout = checkout_info.checkout
+    token = checkout.token
+    CheckoutByTokenLoader(context).clear(token).prime(token, checkout)
+    CheckoutLinesInfoByCheckoutTokenLoader(context).clear(token).prime(
+        token, list(lines)
+    )
+    CheckoutInfoByCheckoutTokenLoader(context).clear(token).prime(token, checkout_info)
+
+
 def get_checkout(
     mutation_class: type["BaseMutation"],
     info: ResolveInfo,
@@ -1,4 +1,14 @@
-from ..mutations.utils import apply_gift_reward_if_applicable_on_checkout_creation
+from ....checkout.fetch import fetch_checkout_context
+from ...context import get_context_value
+from ..dataloaders import (
+    CheckoutByTokenLoader,
+    CheckoutInfoByCheckoutTokenLoader,
+    CheckoutLinesInfoByCheckoutTokenLoader,
+)
+from ..mutations.utils import (
+    apply_gift_reward_if_applicable_on_checkout_creation,
+    prime_checkout_loaders,
+)
 
 
 def test_apply_gift_reward_if_applicable(
@@ -48,3 +58,27 @@ def test_apply_gift_reward_if_applicable_no_gift_promotion_rules_for_checkout_ch
     # then
     checkout.refresh_from_db()
     assert checkout.lines.count() == lines_count
+
+
+def test_prime_checkout_loaders(
+    rf, checkout_with_items, plugins_manager, django_assert_num_queries
+):
+    # given
+    context = get_context_value(rf.request())
+    checkout_info, lines, _ = fetch_checkout_context(
+        checkout_with_items, plugins_manager
+    )
+    token = checkout_with_items.token
+
+    # when
+    prime_checkout_loaders(context, checkout_info, lines)
+
+    # then
+    with django_assert_num_queries(0):
+        assert CheckoutByTokenLoader(context).load(token).get() is checkout_with_items
+        assert CheckoutInfoByCheckoutTokenLoader(context).load(token).get() is (
+            checkout_info
+        )
+        assert CheckoutLinesInfoByCheckoutTokenLoader(context).load(
+            token
+        ).get() == list(lines)
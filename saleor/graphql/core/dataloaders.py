@@ -1,16 +1,18 @@
 from collections import defaultdict
 from collections.abc import Iterable
+from functools import partial
 from typing import Generic, Optional, TypeVar, Union
 
 import opentracing
 import opentracing.tags
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
+from promise.dataloader import Loader, dispatch_queue, enqueue_post_promise_job
 
 from ...core.db.connection import allow_writer_in_context
 from ...thumbnail.models import Thumbnail
 from ...thumbnail.utils import get_thumbnail_format
-from . import SaleorContext
+from . import SaleorContext, shared_cache
 from .context import get_database_connection_name
 
 K = TypeVar("K")
@@ -59,6 +61,150 @@ class DataLoader(BaseLoader, Generic[K, R]):
     def batch_load(self, keys: Iterable[K]) -> Union[Promise[list[R]], list[R]]:
         raise NotImplementedError()
 
+    def load_many(self, keys: Iterable[K]) -> Promise[list[R]]:
+        """Load multiple keys, promising a list of values.
+
+        Unlike the base implementation, which creates and joins a promise for
+        each key, the keys that are not cached yet are queued for the next batch
+        behind a single promise. The promise of each of those keys is derived
+        from it and cached right away, so the keys are not queued again while the
+        batch is pending. When the other keys are already loaded, the list is
+        built from the values instead of joining the promises of all keys.
+        """
+        if not isinstance(keys, Iterable) or not (self.cache and self.batch):
+            return super().load_many(keys)
+
+        keys = list(keys)
+        cache_keys = [self.get_cache_key(key) for key in keys]
+        missing: dict = {}
+        for key, cache_key in zip(keys, cache_keys):
+            if cache_key not in missing and cache_key not in self._promise_cache:
+                missing[cache_key] = key
+
+        batch = None
+        if missing:
+            resolvers: list = []
+            batch = Promise(lambda resolve, _reject: resolvers.append(resolve))
+            # cache the promises before dispatching, so a failed batch can clear them
+            for index, cache_key in enumerate(missing):
+                self._promise_cache[cache_key] = batch.then(
+                    partial(_get_batch_value, index)
+                )
+            self._enqueue_many(list(missing.values()), resolvers[0])
+
+        known = {}
+        for cache_key in cache_keys:
+            if cache_key in missing:
+                continue
+            promise = self._promise_cache[cache_key]
+            if not promise.is_fulfilled:
+                # Pending or rejected keys are joined as in the base implementation.
+                return Promise.all([self._promise_cache[key] for key in cache_keys])
+            known[cache_key] = promise.value
+
+        if batch is None:
+            return Promise.resolve([known[cache_key] for cache_key in cache_keys])
+
+        positions = {cache_key: index for index, cache_key in enumerate(missing)}
+
+        def get_values(batch_values):
+            return [
+                _get_batch_value(positions[cache_key], batch_values)
+                if cache_key in positions
+                else known[cache_key]
+                for cache_key in cache_keys
+            ]
+
+        return batch.then(get_values)
+
+    def _enqueue_many(self, keys, resolve):
+        """Queue the keys for the next batch, resolving with the list of values.
+
+        Errors of single keys are resolved as values, so the promise of each key
+        derived from the list can be rejected separately.
+        """
+        values: list = [None] * len(keys)
+        remaining = len(keys)
+
+        def settle_key(index, value):
+            nonlocal remaining
+            values[index] = value
+            remaining -= 1
+            if not remaining:
+                resolve(values)
+
+        should_dispatch = not self._queue
+        self._queue.extend(
+            Loader(
+                key=key,
+                resolve=partial(settle_key, index),
+                reject=partial(settle_key, index),
+            )
+            for index, key in enumerate(keys)
+        )
+        if should_dispatch:
+            enqueue_post_promise_job(partial(dispatch_queue, self), self._scheduler)
+
+
+def _get_batch_value(index, values):
+    value = values[index]
+    if isinstance(value, Exception):
+        raise value
+    return value
+
+
+class SharedCacheDataLoader(DataLoader[K, R]):
+    """Data loader with results cached between requests.
+
+    Use it only for data that rarely changes. Results are stored in the shared
+    cache when `DATALOADER_SHARED_CACHE_ENABLED` is set and invalidated when an
+    instance of one of `shared_cache_models` is saved or deleted.
+    """
+
+    shared_cache_models: tuple[str, ...]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        unknown_models = set(cls.shared_cache_models) - set(
+            shared_cache.SHARED_CACHE_MODELS
+        )
+        if unknown_models:
+            raise TypeError(
+                f"Data loader {cls} depends on models not invalidating the shared "
+                f"cache: {', '.join(sorted(unknown_models))}"
+            )
+
+    def batch_load_fn(  # pylint: disable=method-hidden
+        self, keys: Iterable[K]
+    ) -> Promise[list[R]]:
+        if not shared_cache.is_shared_cache_enabled():
+            return super().batch_load_fn(keys)
+
+        keys = list(keys)
+        versions = shared_cache.get_model_versions(self.shared_cache_models)
+        cache_keys = [
+            shared_cache.generate_shared_cache_key(self.context_key, versions, key)
+            for key in keys
+        ]
+        results = shared_cache.get_many(cache_keys)
+        missing = [
+            (key, cache_key)
+            for key, cache_key in zip(keys, cache_keys)
+            if cache_key not in results
+        ]
+        if not missing:
+            return Promise.resolve([results[cache_key] for cache_key in cache_keys])
+
+        missing_keys, missing_cache_keys = zip(*missing)
+
+        def with_missing_results(missing_results):
+            loaded = dict(zip(missing_cache_keys, missing_results))
+            shared_cache.set_many(loaded)
+            results.update(loaded)
+            return [results[cache_key] for cache_key in cache_keys]
+
+        return super().batch_load_fn(list(missing_keys)).then(with_missing_results)
+
 
 class BaseThumbnailBySizeAndFormatLoader(
     DataLoader[tuple[int, int, Optional[str]], Thumbnail]
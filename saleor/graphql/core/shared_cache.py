@@ -0,0 +1,117 @@
+"""Second-level cache for data loader results shared between requests.
+
+Entries are stored pickled in a process-local LRU cache with a TTL and, when
+`DATALOADER_SHARED_CACHE_DISTRIBUTED` is set, also in the Django cache so they
+are shared between processes.
+
+Cache keys contain the versions of the models the loader depends on. A version
+is replaced after a transaction saving or deleting an instance of the model
+is committed, which makes the entries of all loaders using that model stale.
+Versions are always kept in the Django cache, so a change made by one process
+invalidates the in-process entries of all the others.
+Bulk writes and queryset updates don't send model signals; code doing them
+must call `invalidate_shared_cache_models`, otherwise the entries changed that
+way expire after `DATALOADER_SHARED_CACHE_TIMEOUT`.
+"""
+
+import hashlib
+import pickle
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ... import __version__ as saleor_version
+from ...core.utils.cache import CacheDict
+
+# Models whose changes invalidate the shared cache, as `app_label.ModelName`
+SHARED_CACHE_MODELS = (
+    "attribute.Attribute",
+    "attribute.AttributeValue",
+    "channel.Channel",
+    "menu.MenuItem",
+    "site.SiteSettings",
+    "sites.Site",
+    "tax.TaxConfiguration",
+    "tax.TaxConfigurationPerCountry",
+)
+
+SHARED_CACHE_VERSION_KEY = "dataloader-shared-cache-version-{}"
+
+_local_cache = CacheDict(settings.DATALOADER_SHARED_CACHE_SIZE)
+
+
+def is_shared_cache_enabled() -> bool:
+    return settings.DATALOADER_SHARED_CACHE_ENABLED
+
+
+def get_model_versions(model_labels: Iterable[str]) -> tuple:
+    keys = [SHARED_CACHE_VERSION_KEY.format(label) for label in model_labels]
+    versions = cache.get_many(keys)
+    return tuple(versions.get(key, 0) for key in keys)
+
+
+def generate_shared_cache_key(loader_key: str, versions: tuple, key: Any) -> str:
+    key_hash = hashlib.md5(repr((versions, key)).encode("utf-8")).hexdigest()
+    return f"{saleor_version}-dataloader-{loader_key}-{key_hash}"
+
+
+def get_many(keys: list[str]) -> dict[str, Any]:
+    now = time.monotonic()
+    payloads = {}
+    for key in keys:
+        try:
+            expires_at, payload = _local_cache[key]
+        except KeyError:
+            continue
+        if expires_at > now:
+            payloads[key] = payload
+
+    missing_keys = [key for key in keys if key not in payloads]
+    if missing_keys and settings.DATALOADER_SHARED_CACHE_DISTRIBUTED:
+        distributed_payloads = cache.get_many(missing_keys)
+        expires_at = now + settings.DATALOADER_SHARED_CACHE_TIMEOUT
+        for key, payload in distributed_payloads.items():
+            _local_cache[key] = (expires_at, payload)
+        payloads.update(distributed_payloads)
+
+    return {key: pickle.loads(payload) for key, payload in payloads.items()}
+
+
+def set_many(values: dict[str, Any]):
+    timeout = settings.DATALOADER_SHARED_CACHE_TIMEOUT
+    expires_at = time.monotonic() + timeout
+    payloads = {key: pickle.dumps(value) for key, value in values.items()}
+    for key, payload in payloads.items():
+        _local_cache[key] = (expires_at, payload)
+    if settings.DATALOADER_SHARED_CACHE_DISTRIBUTED:
+        cache.set_many(payloads, timeout=timeout)
+
+
+def bump_model_version(model_label: str):
+    cache.set(
+        SHARED_CACHE_VERSION_KEY.format(model_label), time.time_ns(), timeout=None
+    )
+
+
+def invalidate_shared_cache_models(*model_labels: str, using=None):
+    """Replace the versions of the models once the current transaction commits."""
+    if not is_shared_cache_enabled():
+        return
+
+    def bump_model_versions():
+        for model_label in model_labels:
+            bump_model_version(model_label)
+
+    transaction.on_commit(bump_model_versions, using=using)
+
+
+def invalidate_shared_cache(sender, using=None, **kwargs):
+    invalidate_shared_cache_models(sender._meta.label, using=using)
+
+
+def clear_local_cache():
+    _local_cache.clear()
@@ -0,0 +1,104 @@
+from unittest import mock
+
+import pytest
+from promise import Promise
+
+from ...context import get_context_value
+from ..dataloaders import DataLoader
+
+
+class DoubleLoader(DataLoader[int, int]):
+    context_key = "double"
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.batches = []
+
+    def batch_load(self, keys):
+        self.batches.append(list(keys))
+        return [ValueError(key) if key < 0 else key * 2 for key in keys]
+
+
+@pytest.fixture
+def loader(rf):
+    return DoubleLoader(get_context_value(rf.request()))
+
+
+def test_load_many_batches_missing_keys(loader):
+    # when
+    values = loader.load_many([1, 2, 2, 3]).get()
+
+    # then
+    assert values == [2, 4, 4, 6]
+    assert loader.batches == [[1, 2, 3]]
+
+
+def test_load_many_uses_cached_values(loader):
+    # given
+    loader.load_many([1, 2]).get()
+
+    # when
+    values = loader.load_many([2, 3, 1]).get()
+
+    # then
+    assert values == [4, 6, 2]
+    assert loader.load(3).get() == 6
+    assert loader.batches == [[1, 2], [3]]
+
+
+def _in_same_tick(load):
+    # loads made while promise callbacks run are batched together
+    return Promise.resolve(None).then(lambda _: load()).get()
+
+
+def test_load_many_with_pending_key(loader):
+    # when
+    pending, values = _in_same_tick(
+        lambda: Promise.all([loader.load(1), loader.load_many([1, 2])])
+    )
+
+    # then
+    assert values == [2, 4]
+    assert pending == 2
+    assert loader.batches == [[1, 2]]
+
+
+def test_load_many_caches_key_promises_while_batch_is_pending(loader):
+    # when
+    values, value, other_values = _in_same_tick(
+        lambda: Promise.all(
+            [loader.load_many([1, 2]), loader.load(2), loader.load_many([2, 3])]
+        )
+    )
+
+    # then
+    assert values == [2, 4]
+    assert value == 4
+    assert other_values == [4, 6]
+    assert loader.batches == [[1, 2, 3]]
+
+
+def test_load_many_rejects_on_error_value(loader):
+    # when
+    promise = loader.load_many([1, -1])
+
+    # then
+    with pytest.raises(ValueError, match="-1"):
+        promise.get()
+    with pytest.raises(ValueError, match="-1"):
+        loader.load(-1).get()
+    assert loader.load(1).get() == 2
+    assert loader.batches == [[1, -1]]
+
+
+def test_load_many_failed_batch_is_not_cached(loader):
+    # given
+    loader.batch_load = mock.Mock(side_effect=RuntimeError("Batch failed"))
+
+    # when
+    promise = loader.load_many([1, 2])
+
+    # then
+    with pytest.raises(RuntimeError, match="Batch failed"):
+        promise.get()
+    assert not loader._promise_cache
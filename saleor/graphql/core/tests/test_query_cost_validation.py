@@ -1,6 +1,13 @@
+from unittest import mock
+
 import graphene
 import pytest
 from django.test import override_settings
+from graphql import parse
+
+from ...api import schema
+from ...query_cost_map import COST_MAP
+from ..validators.query_cost import build_query_cost_plan
 
 
 @override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=1)
@@ -235,3 +242,74 @@ def test_query_with_fragments_have_same_multiplied_complexity_cost(
     assert json_response["data"] == expected_data
     query_cost = json_response["extensions"]["cost"]["requestedQueryCost"]
     assert query_cost == 120
+
+
+PRODUCTS_QUERIES = [
+    PRODUCTS_QUERY,
+    PRODUCTS_QUERY_WITH_INLINE_FRAGMENT,
+    PRODUCTS_QUERY_WITH_FRAGMENT,
+]
+
+
+@pytest.mark.parametrize(
+    ("query", "variables", "maximum_cost", "expected_cost", "expected_errors"),
+    [
+        *[
+            (query, {"channel": "c", "first": 10}, 100000, 120, [])
+            for query in PRODUCTS_QUERIES
+        ],
+        *[
+            (
+                query,
+                {"channel": "c", "first": 50},
+                100,
+                2600,
+                ["The query exceeds the maximum cost of 100. Actual cost is 2600"],
+            )
+            for query in PRODUCTS_QUERIES
+        ],
+        *[
+            (query, {"channel": "c", "first": "invalid"}, 100, 3, [])
+            for query in PRODUCTS_QUERIES
+        ],
+        *[(query, None, 100, 3, []) for query in PRODUCTS_QUERIES],
+        (VARIANTS_QUERY, {"channel": "c", "first": 10}, 100000, 10, []),
+        (VARIANTS_QUERY, {"channel": "c", "first": 50}, 100, 50, []),
+        (VARIANTS_QUERY, {"channel": "c", "first": "invalid"}, 100, 1, []),
+        (VARIANTS_QUERY, None, 100, 1, []),
+    ],
+)
+def test_query_cost_plan_evaluate(
+    query, variables, maximum_cost, expected_cost, expected_errors
+):
+    # given
+    plan = build_query_cost_plan(schema, parse(query), COST_MAP)
+
+    # when
+    cost, errors = plan.evaluate(variables, maximum_cost)
+
+    # then
+    assert cost == expected_cost
+    assert [str(error) for error in errors or []] == expected_errors
+
+
+def test_query_cost_plan_resolves_static_arguments_once():
+    # given
+    document_ast = parse(
+        """
+        query {
+            products(first: 10, channel: "c") { edges { node { id } } }
+        }
+        """
+    )
+    plan = build_query_cost_plan(schema, document_ast, COST_MAP)
+
+    # when
+    with mock.patch(
+        "saleor.graphql.core.validators.query_cost.get_argument_values"
+    ) as get_argument_values_mock:
+        cost, errors = plan.evaluate(None, 100)
+
+    # then
+    assert (cost, errors) == (10, None)
+    get_argument_values_mock.assert_not_called()
@@ -0,0 +1,157 @@
+import time
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from ....attribute.models import Attribute, AttributeValue
+from ...attribute.dataloaders import AttributesByAttributeId
+from ...channel.dataloaders import ChannelBySlugLoader
+from ...context import get_context_value
+from ..dataloaders import SharedCacheDataLoader
+from ..shared_cache import (
+    SHARED_CACHE_VERSION_KEY,
+    clear_local_cache,
+    invalidate_shared_cache_models,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_cache():
+    clear_local_cache()
+    yield
+    clear_local_cache()
+
+
+def load_channel(rf, slug):
+    context = get_context_value(rf.request())
+    return ChannelBySlugLoader(context).load(slug).get()
+
+
+@override_settings(DATALOADER_SHARED_CACHE_ENABLED=True)
+def test_shared_cache_reuses_results_between_requests(
+    rf, channel_USD, django_assert_num_queries
+):
+    # given
+    load_channel(rf, channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(0):
+        channel = load_channel(rf, channel_USD.slug)
+
+    # then
+    assert channel == channel_USD
+    assert channel is not channel_USD
+
+
+@override_settings(DATALOADER_SHARED_CACHE_ENABLED=True)
+def test_shared_cache_invalidated_on_save(
+    rf, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    load_channel(rf, channel_USD.slug)
+
+    # when
+    channel_USD.name = "New name"
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_USD.save(update_fields=["name"])
+
+    # then
+    assert load_channel(rf, channel_USD.slug).name == "New name"
+
+
+def load_attribute(rf, attribute_id):
+    context = get_context_value(rf.request())
+    return AttributesByAttributeId(context).load(attribute_id).get()
+
+
+@override_settings(DATALOADER_SHARED_CACHE_ENABLED=True)
+def test_shared_cache_invalidated_after_bulk_update(
+    rf, color_attribute, django_capture_on_commit_callbacks
+):
+    # given
+    load_attribute(rf, color_attribute.pk)
+
+    # when
+    color_attribute.name = "New name"
+    with django_capture_on_commit_callbacks(execute=True):
+        Attribute.objects.bulk_update([color_attribute], ["name"])
+        invalidate_shared_cache_models("attribute.Attribute")
+
+    # then
+    assert load_attribute(rf, color_attribute.pk).name == "New name"
+
+
+@override_settings(DATALOADER_SHARED_CACHE_ENABLED=True)
+def test_shared_cache_attribute_invalidated_on_value_save(
+    rf, color_attribute, django_capture_on_commit_callbacks
+):
+    # given
+    with django_capture_on_commit_callbacks(execute=True):
+        AttributeValue.objects.create(
+            attribute=color_attribute, name="Green", slug="green"
+        )
+    max_sort_order = load_attribute(rf, color_attribute.pk).max_sort_order
+
+    # when
+    # `Attribute.max_sort_order` is increased with a queryset update
+    with django_capture_on_commit_callbacks(execute=True):
+        AttributeValue.objects.create(
+            attribute=color_attribute, name="White", slug="white"
+        )
+
+    # then
+    assert load_attribute(rf, color_attribute.pk).max_sort_order == max_sort_order + 1
+
+
+@override_settings(DATALOADER_SHARED_CACHE_ENABLED=False)
+def test_invalidate_shared_cache_models_when_disabled(
+    django_capture_on_commit_callbacks,
+):
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        invalidate_shared_cache_models("attribute.Attribute")
+
+    # then
+    assert not callbacks
+
+
+@override_settings(
+    DATALOADER_SHARED_CACHE_ENABLED=True, DATALOADER_SHARED_CACHE_DISTRIBUTED=False
+)
+def test_shared_cache_local_entries_invalidated_by_other_process(
+    rf, channel_USD, django_assert_num_queries
+):
+    # given
+    load_channel(rf, channel_USD.slug)
+
+    # when
+    # another process saved a channel
+    cache.set(
+        SHARED_CACHE_VERSION_KEY.format("channel.Channel"), time.time_ns(), timeout=None
+    )
+
+    # then
+    with django_assert_num_queries(1):
+        load_channel(rf, channel_USD.slug)
+
+
+@override_settings(DATALOADER_SHARED_CACHE_ENABLED=False)
+def test_shared_cache_disabled(rf, channel_USD, django_assert_num_queries):
+    # given
+    load_channel(rf, channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(1):
+        channel = load_channel(rf, channel_USD.slug)
+
+    # then
+    assert channel == channel_USD
+
+
+def test_shared_cache_loader_with_not_invalidating_model():
+    with pytest.raises(TypeError):
+
+        class ProductLoader(SharedCacheDataLoader):
+            context_key = "product"
+            shared_cache_models = ("product.Product",)
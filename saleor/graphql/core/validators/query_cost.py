@@ -11,16 +11,16 @@ from graphql import (
 )
 from graphql.execution.values import get_argument_values
 from graphql.language.ast import (
+    Document,
     Field,
     FragmentDefinition,
     FragmentSpread,
     InlineFragment,
+    Node,
     OperationDefinition,
+    Variable,
 )
 from graphql.type import GraphQLField
-from graphql.validation import validate
-from graphql.validation.rules.base import ValidationRule
-from graphql.validation.validation import ValidationContext
 
 CostAwareNode = Union[
     Field,
@@ -33,198 +33,294 @@ CostAwareNode = Union[
 GraphQLFieldMap = dict[str, GraphQLField]
 
 
-class CostValidator(ValidationRule):
-    maximum_cost: int
-    default_cost: int = 0
-    default_complexity: int = 1
-    variables: Optional[dict] = None
-    cost_map: Optional[dict[str, dict[str, Any]]] = None
+def get_multipliers_from_string(multipliers: list[str], field_args: dict) -> list:
+    accessors = [s.split(".") for s in multipliers]
+    values: Any = []
+    for accessor in accessors:
+        val = field_args
+        for key in accessor:
+            val = val.get(key)
+        try:
+            values.append(int(val))
+        except (ValueError, TypeError):
+            pass
+    values = [
+        len(value) if isinstance(value, (list, tuple)) else value for value in values
+    ]
+    return [m for m in values if m > 0]
+
+
+def compute_cost(
+    operation_multipliers: list[int],
+    default_complexity: int,
+    multipliers=None,
+    use_multipliers=True,
+    complexity=None,
+) -> tuple[int, list[int]]:
+    """Return the field cost and the multipliers to apply to its children."""
+    if complexity is None:
+        complexity = default_complexity
+    if use_multipliers:
+        if multipliers:
+            multiplier = reduce(add, multipliers, 0)
+            operation_multipliers = operation_multipliers + [multiplier]
+        return reduce(mul, operation_multipliers, complexity), operation_multipliers
+    return complexity, operation_multipliers
+
+
+def has_variables(node: Any) -> bool:
+    if isinstance(node, Variable):
+        return True
+    if isinstance(node, list):
+        return any(has_variables(item) for item in node)
+    if isinstance(node, Node):
+        return any(has_variables(getattr(node, attr)) for attr in node.__slots__)
+    return False
+
+
+class FieldCostPlan:
+    """Field with its cost map entry and children resolved against the schema.
+
+    Arguments without variables are resolved when the plan is built, so only
+    the fields using variables have to be evaluated for each request.
+    """
+
+    __slots__ = (
+        "field",
+        "node",
+        "cost_args",
+        "is_static",
+        "static_cost_args",
+        "static_error",
+        "selections",
+    )
+
+    def __init__(self, field: GraphQLField, node: Field, cost_args: Optional[dict]):
+        self.field = field
+        self.node = node
+        self.cost_args = cost_args
+        self.is_static = not has_variables(node.arguments)
+        self.static_cost_args: Optional[dict] = None
+        self.static_error: Optional[GraphQLError] = None
+        self.selections: list[Union[FieldCostPlan, FragmentCostPlan]] = []
+        if self.is_static:
+            field_args = self.get_field_args({})
+            if isinstance(field_args, GraphQLError):
+                self.static_error = field_args
+                field_args = {}
+            self.static_cost_args = self.get_cost_args(field_args)
+
+    def get_field_args(self, variables: Optional[dict]) -> Union[dict, GraphQLError]:
+        try:
+            return get_argument_values(self.field.args, self.node.arguments, variables)
+        except Exception as e:
+            return GraphQLError(str(e))
+
+    def get_cost_args(self, field_args: dict) -> Optional[dict]:
+        if self.cost_args is None:
+            return None
+        cost_args = self.cost_args.copy()
+        if "multipliers" in cost_args:
+            cost_args["multipliers"] = get_multipliers_from_string(
+                cost_args["multipliers"], field_args
+            )
+        return cost_args
+
+
+class FragmentCostPlan:
+    __slots__ = ("selections",)
+
+    def __init__(self, selections: Optional[list]):
+        # None when the fragment definition is missing in the document
+        self.selections = selections
+
+
+class QueryCostPlan:
+    """Variable-independent part of the query cost analysis of a document.
+
+    Building the plan resolves schema types, cost map entries and fragments,
+    and validates the cost map. Evaluating it for the request variables gives
+    the cost of the document and the cost errors.
+    """
 
     def __init__(
         self,
-        maximum_cost: int,
+        schema: GraphQLSchema,
+        document_ast: Document,
+        cost_map: Optional[dict[str, dict[str, Any]]],
         *,
         default_cost: int = 0,
         default_complexity: int = 1,
-        variables: Optional[dict] = None,
-        cost_map: Optional[dict[str, dict[str, Any]]] = None,
-    ):  # pylint: disable=super-init-not-called
-        self.maximum_cost = maximum_cost
-        self.variables = variables
+    ):
+        self.schema = schema
         self.cost_map = cost_map
         self.default_cost = default_cost
         self.default_complexity = default_complexity
-        self.cost = 0
-        self.operation_multipliers: list[Any] = []
-
-    def __call__(self, context: ValidationContext):
-        self.context = context
-        return self
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, FragmentDefinition)
+        }
+        self._fragment_plans: dict[str, Optional[list]] = {}
+        self.cost_map_error: Optional[GraphQLError] = None
+        if cost_map:
+            try:
+                validate_cost_map(cost_map, schema)
+            except GraphQLError as cost_map_error:
+                self.cost_map_error = cost_map_error
+
+        root_types = {
+            "query": schema.get_query_type(),
+            "mutation": schema.get_mutation_type(),
+            "subscription": schema.get_subscription_type(),
+        }
+        self.operations: list[list] = []
+        for definition in document_ast.definitions:
+            if not isinstance(definition, OperationDefinition):
+                continue
+            if self.cost_map_error or definition.operation not in root_types:
+                self.operations.append([])
+                continue
+            self.operations.append(
+                self.build_selections(
+                    definition, root_types[definition.operation], frozenset()
+                )
+            )
 
-    def compute_node_cost(self, node: CostAwareNode, type_def, parent_multipliers=None):
-        if parent_multipliers is None:
-            parent_multipliers = []
+    def build_selections(
+        self, node: CostAwareNode, type_def, visited_fragments: frozenset
+    ) -> list:
         if isinstance(node, FragmentSpread) or not node.selection_set:
-            return 0
+            return []
+        if not self.cost_map:
+            return []
         fields: GraphQLFieldMap = {}
         if isinstance(type_def, (GraphQLObjectType, GraphQLInterfaceType)):
             fields = type_def.fields
-        total = 0
+        selections: list[Union[FieldCostPlan, FragmentCostPlan]] = []
         for child_node in node.selection_set.selections:
-            self.operation_multipliers = parent_multipliers[:]
-            node_cost = self.default_cost
             if isinstance(child_node, Field):
                 field = fields.get(child_node.name.value)
                 if not field:
                     continue
-                field_type = get_named_type(field.type)
-                try:
-                    field_args: dict[str, Any] = get_argument_values(
-                        field.args,
-                        child_node.arguments,
-                        self.variables,
-                    )
-                except Exception as e:
-                    report_error(self.context, e)
-                    field_args = {}
-
-                if not self.cost_map:
-                    return 0
-
-                cost_map_args = (
-                    self.get_args_from_cost_map(child_node, type_def.name, field_args)
-                    if type_def and type_def.name
-                    else None
+                cost_args = None
+                if type_def and type_def.name:
+                    type_costs = self.cost_map.get(type_def.name, {})
+                    cost_args = type_costs.get(child_node.name.value) or None
+                field_plan = FieldCostPlan(field, child_node, cost_args)
+                field_plan.selections = self.build_selections(
+                    child_node, get_named_type(field.type), visited_fragments
                 )
-                if cost_map_args is not None:
-                    try:
-                        node_cost = self.compute_cost(**cost_map_args)
-                    except (TypeError, ValueError) as e:
-                        report_error(self.context, e)
-
-                child_cost = self.compute_node_cost(
-                    child_node, field_type, self.operation_multipliers
-                )
-                node_cost += child_cost
-            if isinstance(child_node, FragmentSpread):
-                fragment = self.context.get_fragment(child_node.name.value)
-                if fragment:
-                    fragment_type = self.context.get_schema().get_type(
-                        fragment.type_condition.name.value
-                    )
-                    node_cost = self.compute_node_cost(
-                        fragment, fragment_type, self.operation_multipliers
+                selections.append(field_plan)
+            elif isinstance(child_node, FragmentSpread):
+                selections.append(
+                    FragmentCostPlan(
+                        self.build_fragment(child_node.name.value, visited_fragments)
                     )
-            if isinstance(child_node, InlineFragment):
+                )
+            elif isinstance(child_node, InlineFragment):
                 inline_fragment_type = type_def
                 if child_node.type_condition and child_node.type_condition.name:
-                    inline_fragment_type = self.context.get_schema().get_type(
+                    inline_fragment_type = self.schema.get_type(
                         child_node.type_condition.name.value
                     )
-                node_cost = self.compute_node_cost(
-                    child_node, inline_fragment_type, self.operation_multipliers
+                selections.append(
+                    FragmentCostPlan(
+                        self.build_selections(
+                            child_node, inline_fragment_type, visited_fragments
+                        )
+                    )
                 )
-            total += node_cost
-        return total
-
-    def enter_operation_definition(self, node, key, parent, path, ancestors):  # pylint: disable=unused-argument
-        if self.cost_map:
-            try:
-                validate_cost_map(self.cost_map, self.context.get_schema())
-            except GraphQLError as cost_map_error:
-                self.context.report_error(cost_map_error)
-                return
-
-        if node.operation == "query":
-            self.cost += self.compute_node_cost(
-                node, self.context.get_schema().get_query_type()
-            )
-        if node.operation == "mutation":
-            self.cost += self.compute_node_cost(
-                node, self.context.get_schema().get_mutation_type()
-            )
-        if node.operation == "subscription":
-            self.cost += self.compute_node_cost(
-                node, self.context.get_schema().get_subscription_type()
-            )
+        return selections
 
-    def leave_operation_definition(self, node, key, parent, path, ancestors):  # pylint: disable=unused-argument
-        if self.cost > self.maximum_cost:
-            self.context.report_error(self.get_cost_exceeded_error())
-
-    def compute_cost(self, multipliers=None, use_multipliers=True, complexity=None):
-        if complexity is None:
-            complexity = self.default_complexity
-        if use_multipliers:
-            if multipliers:
-                multiplier = reduce(add, multipliers, 0)
-                self.operation_multipliers = self.operation_multipliers + [multiplier]
-            return reduce(mul, self.operation_multipliers, complexity)
-        return complexity
-
-    def get_args_from_cost_map(self, node: Field, parent_type: str, field_args: dict):
-        cost_args = None
-        cost_map = cast(dict[Any, dict], self.cost_map)
-        if parent_type in cost_map:
-            cost_args = cost_map[parent_type].get(node.name.value)
-        if not cost_args:
+    def build_fragment(self, name: str, visited_fragments: frozenset) -> Optional[list]:
+        fragment = self.fragments.get(name)
+        if not fragment:
             return None
-        cost_args = cost_args.copy()
-        if "multipliers" in cost_args:
-            cost_args["multipliers"] = self.get_multipliers_from_string(
-                cost_args["multipliers"], field_args
+        if name in visited_fragments:
+            # Fragment cycles are reported by the document validation.
+            return []
+        if name not in self._fragment_plans:
+            fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+            self._fragment_plans[name] = self.build_selections(
+                fragment, fragment_type, visited_fragments | {name}
             )
-        return cost_args
+        return self._fragment_plans[name]
+
+    def evaluate(
+        self, variables: Optional[dict], maximum_cost: int
+    ) -> tuple[int, Optional[list[GraphQLError]]]:
+        errors: list[GraphQLError] = []
+        cost = 0
+        for selections in self.operations:
+            if self.cost_map_error:
+                errors.append(self.cost_map_error)
+            else:
+                cost += self.evaluate_selections(selections, [], variables, errors)
+            if cost > maximum_cost:
+                errors.append(
+                    QueryCostError(
+                        cost_analysis_message(maximum_cost, cost),
+                        extensions={
+                            "cost": {
+                                "requestedQueryCost": cost,
+                                "maximumAvailable": maximum_cost,
+                            }
+                        },
+                    )
+                )
+        return cost, errors or None
 
-    def get_multipliers_from_string(self, multipliers: list[str], field_args):
-        accessors = [s.split(".") for s in multipliers]
-        multipliers: Any = []
-        for accessor in accessors:
-            val = field_args
-            for key in accessor:
-                val = val.get(key)
-            try:
-                multipliers.append(int(val))
-            except (ValueError, TypeError):
-                pass
-        multipliers = [
-            len(multiplier) if isinstance(multiplier, (list, tuple)) else multiplier
-            for multiplier in multipliers
-        ]
-        return [m for m in multipliers if m > 0]
-
-    def get_cost_exceeded_error(self) -> "QueryCostError":
-        return QueryCostError(
-            cost_analysis_message(self.maximum_cost, self.cost),
-            extensions={
-                "cost": {
-                    "requestedQueryCost": self.cost,
-                    "maximumAvailable": self.maximum_cost,
-                }
-            },
-        )
-
-    def enter(
+    def evaluate_selections(
         self,
-        node: Any,
-        key: Optional[Union[int, str]],
-        parent: Any,
-        path: list[Union[int, str]],
-        ancestors: list[Any],
-    ):
-        if isinstance(node, OperationDefinition):
-            self.enter_operation_definition(node, key, parent, path, ancestors)
+        selections: list,
+        parent_multipliers: list[int],
+        variables: Optional[dict],
+        errors: list[GraphQLError],
+    ) -> int:
+        total = 0
+        for plan in selections:
+            if isinstance(plan, FragmentCostPlan):
+                if plan.selections is None:
+                    total += self.default_cost
+                else:
+                    total += self.evaluate_selections(
+                        plan.selections, parent_multipliers, variables, errors
+                    )
+                continue
+
+            if plan.is_static:
+                if plan.static_error:
+                    errors.append(plan.static_error)
+                cost_args = plan.static_cost_args
+            else:
+                field_args = plan.get_field_args(variables)
+                if isinstance(field_args, GraphQLError):
+                    errors.append(field_args)
+                    field_args = {}
+                cost_args = plan.get_cost_args(field_args)
+
+            node_cost = self.default_cost
+            multipliers = parent_multipliers
+            if cost_args is not None:
+                try:
+                    node_cost, multipliers = compute_cost(
+                        parent_multipliers, self.default_complexity, **cost_args
+                    )
+                except (TypeError, ValueError) as e:
+                    errors.append(GraphQLError(str(e)))
+            total += node_cost + self.evaluate_selections(
+                plan.selections, multipliers, variables, errors
+            )
+        return total
 
-    def leave(
-        self,
-        node: Any,
-        key: Optional[Union[int, str]],
-        parent: Any,
-        path: list[Union[int, str]],
-        ancestors: list[Any],
-    ):
-        if isinstance(node, OperationDefinition):
-            self.leave_operation_definition(node, key, parent, path, ancestors)
+
+def build_query_cost_plan(
+    schema: GraphQLSchema,
+    document_ast: Document,
+    cost_map: Optional[dict[str, dict[str, Any]]],
+) -> QueryCostPlan:
+    return QueryCostPlan(schema, document_ast, cost_map)
 
 
 def validate_cost_map(cost_map: dict[str, dict[str, Any]], schema: GraphQLSchema):
@@ -252,10 +348,6 @@ def validate_cost_map(cost_map: dict[str, dict[str, Any]], schema: GraphQLSchema
                 )
 
 
-def report_error(context: ValidationContext, error: Exception):
-    context.report_error(GraphQLError(str(error)))
-
-
 def cost_analysis_message(maximum_cost: int, cost: int) -> str:
     return (
         f"The query exceeds the maximum cost of {maximum_cost}. Actual cost is {cost}"
@@ -266,23 +358,6 @@ class QueryCostError(GraphQLError):
     pass
 
 
-def cost_validator(
-    maximum_cost: int,
-    *,
-    default_cost: int = 0,
-    default_complexity: int = 1,
-    variables: Optional[dict] = None,
-    cost_map: Optional[dict[str, dict[str, Any]]] = None,
-) -> CostValidator:
-    return CostValidator(
-        maximum_cost=maximum_cost,
-        default_cost=default_cost,
-        default_complexity=default_complexity,
-        variables=variables,
-        cost_map=cost_map,
-    )
-
-
 def validate_query_cost(
     schema,
     query,
@@ -290,16 +365,5 @@ def validate_query_cost(
     cost_map,
     maximum_cost,
 ):
-    validator = cost_validator(
-        maximum_cost,
-        variables=variables,
-        cost_map=cost_map,
-    )
-    error = validate(
-        schema,
-        query.document_ast,
-        [validator],  # type: ignore[list-item] # cost validator is an instance that pretends to be a class # noqa: E501
-    )
-    if error:
-        return validator.cost, error
-    return validator.cost, None
+    plan = build_query_cost_plan(schema, query.document_ast, cost_map)
+    return plan.evaluate(variables, maximum_cost)
@@ -75,7 +75,7 @@ class InvoiceRequest(ModelMutation):
         cls.check_channel_permissions(info, [order.channel_id])
         cls.clean_order(order)
         manager = get_plugin_manager_promise(info.context).get()
-        if not is_event_active_for_any_plugin("invoice_request", manager.all_plugins):
+        if not is_event_active_for_any_plugin("invoice_request", manager.get_plugins()):
             raise ValidationError(
                 {
                     "orderId": ValidationError(
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from graphql.error import GraphQLSyntaxError
+
+from ...api import SaleorGraphQLDocument, backend, read_warm_up_operations, schema
+from ...persisted_queries import register_allowed_query
+
+
+class Command(BaseCommand):
+    help = (
+        "Registers GraphQL operations stored in `.graphql` files as persisted "
+        "queries allowed to be executed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            help="Paths to `.graphql` files or directories containing them.",
+        )
+
+    def handle(self, *args, **options):
+        for path in options["paths"]:
+            for query in read_warm_up_operations(path):
+                try:
+                    document = backend.document_from_string(schema, query)
+                except (ValueError, GraphQLSyntaxError) as e:
+                    raise CommandError(f"Invalid operation in {path}: {e}") from e
+                if (
+                    not isinstance(document, SaleorGraphQLDocument)
+                    or document.document_ast is None
+                ):
+                    raise CommandError(f"Unable to parse operation in {path}.")
+                if document.validation_errors:
+                    messages = "; ".join(
+                        error.message for error in document.validation_errors
+                    )
+                    raise CommandError(f"Invalid operation in {path}: {messages}")
+                query_hash = register_allowed_query(query)
+                self.stdout.write(query_hash)
@@ -1,7 +1,7 @@
 from collections import defaultdict
 
 from ...menu.models import Menu, MenuItem
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import DataLoader, SharedCacheDataLoader
 
 
 class MenuByIdLoader(DataLoader):
@@ -20,8 +20,9 @@ class MenuItemByIdLoader(DataLoader):
         return [menu_items.get(menu_item_id) for menu_item_id in keys]
 
 
-class MenuItemsByParentMenuLoader(DataLoader):
+class MenuItemsByParentMenuLoader(SharedCacheDataLoader):
     context_key = "menuitems_by_parent_menu"
+    shared_cache_models = ("menu.MenuItem",)
 
     def batch_load(self, keys):
         menu_items = MenuItem.objects.using(self.database_connection_name).filter(
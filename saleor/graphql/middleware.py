@@ -1,5 +1,6 @@
 from django.conf import settings
 
+from .query_stats import get_current_query_stats, resolving
 from .views import GraphQLView
 
 
@@ -10,6 +11,16 @@ def process_view(self, request, view_func, *args):
         request._graphql_view = True
 
 
+class QueryStatsMiddleware:
+    """Attribute SQL queries executed by resolvers to the resolved field path."""
+
+    def resolve(self, next_, root, info, **kwargs):
+        if get_current_query_stats() is None:
+            return next_(root, info, **kwargs)
+        with resolving(info.path):
+            return next_(root, info, **kwargs)
+
+
 if settings.ENABLE_DEBUG_TOOLBAR:
     import warnings
 
@@ -0,0 +1,153 @@
+"""Automatic persisted queries (APQ).
+
+Clients may send only the sha256 hash of a query in the `persistedQuery`
+extension, following the protocol used by Apollo Client:
+
+    {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "..."}}}
+
+When the hash is unknown, the server responds with `PersistedQueryNotFound`
+and the client retries with both the hash and the full query. Queries that pass
+validation are then kept in the cache for the subsequent requests.
+
+With `PERSISTED_QUERIES_ALLOWLIST_ONLY`, only the queries stored in the
+`PersistedQuery` table by the `register_persisted_queries` command are executed.
+"""
+
+import hashlib
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql.error import GraphQLError
+
+from ..core.models import PersistedQuery
+
+PERSISTED_QUERY_CACHE_KEY_PREFIX = "persisted-query"
+ALLOWED_QUERY_CACHE_KEY_PREFIX = "allowed-persisted-query"
+PERSISTED_QUERY_VERSION = 1
+
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+PERSISTED_QUERY_NOT_SUPPORTED = "PersistedQueryNotSupported"
+
+
+class PersistedQueryError(GraphQLError):
+    pass
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_persisted_query_cache_key(query_hash: str) -> str:
+    return f"{PERSISTED_QUERY_CACHE_KEY_PREFIX}:{query_hash}"
+
+
+def get_allowed_query_cache_key(query_hash: str) -> str:
+    return f"{ALLOWED_QUERY_CACHE_KEY_PREFIX}:{query_hash}"
+
+
+def get_allowed_query(query_hash: str) -> Optional[str]:
+    """Return the query registered in the allow-list under the given hash."""
+    cache_key = get_allowed_query_cache_key(query_hash)
+    query = cache.get(cache_key)
+    if query is None:
+        query = (
+            PersistedQuery.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+            .filter(query_hash=query_hash)
+            .values_list("query", flat=True)
+            .first()
+        )
+        if query is not None:
+            cache.set(cache_key, query, timeout=settings.PERSISTED_QUERIES_TIMEOUT)
+    return query
+
+
+def get_persisted_query(query_hash: str) -> Optional[str]:
+    if not settings.PERSISTED_QUERIES_ALLOWLIST_ONLY:
+        query = cache.get(get_persisted_query_cache_key(query_hash))
+        if query is not None:
+            return query
+    return get_allowed_query(query_hash)
+
+
+def register_persisted_query(query: str) -> str:
+    """Store the validated query in the cache under its hash and return the hash."""
+    query_hash = get_query_hash(query)
+    cache.set(
+        get_persisted_query_cache_key(query_hash),
+        query,
+        timeout=settings.PERSISTED_QUERIES_TIMEOUT,
+    )
+    return query_hash
+
+
+def register_allowed_query(query: str) -> str:
+    """Add the validated query to the allow-list and return its hash."""
+    query_hash = get_query_hash(query)
+    PersistedQuery.objects.update_or_create(
+        query_hash=query_hash, defaults={"query": query}
+    )
+    cache.delete(get_allowed_query_cache_key(query_hash))
+    return query_hash
+
+
+def _error(message: str, code: str) -> PersistedQueryError:
+    return PersistedQueryError(message, extensions={"code": code})
+
+
+def resolve_persisted_query(
+    query: Optional[str], extensions: Optional[dict]
+) -> tuple[Optional[str], bool]:
+    """Return the query string to execute and whether to register it.
+
+    The query should be registered with `register_persisted_query` once it
+    passes validation.
+
+    Raise PersistedQueryError when the hash cannot be resolved, does not match
+    the provided query, or the query is not allowed to be executed.
+    """
+    allowlist_only = settings.PERSISTED_QUERIES_ALLOWLIST_ONLY
+    persisted_query = (
+        extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+    )
+    if not persisted_query:
+        if allowlist_only and isinstance(query, str):
+            if get_allowed_query(get_query_hash(query)) is None:
+                raise _error(
+                    "Only registered queries are allowed.", PERSISTED_QUERY_NOT_FOUND
+                )
+        return query, False
+
+    if not settings.PERSISTED_QUERIES_ENABLED and not allowlist_only:
+        raise _error(
+            "Persisted queries are not supported.", PERSISTED_QUERY_NOT_SUPPORTED
+        )
+
+    if not isinstance(persisted_query, dict):
+        raise _error("Invalid persisted query extension.", "INVALID_PERSISTED_QUERY")
+    if persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        raise _error("Unsupported persisted query version.", "INVALID_PERSISTED_QUERY")
+    query_hash = persisted_query.get("sha256Hash")
+    if not query_hash or not isinstance(query_hash, str):
+        raise _error("Missing persisted query hash.", "INVALID_PERSISTED_QUERY")
+    query_hash = query_hash.lower()
+
+    if not query:
+        stored_query = get_persisted_query(query_hash)
+        if stored_query is None:
+            raise _error(PERSISTED_QUERY_NOT_FOUND, PERSISTED_QUERY_NOT_FOUND)
+        return stored_query, False
+
+    if not isinstance(query, str):
+        return query, False
+    if get_query_hash(query) != query_hash:
+        raise _error(
+            "Provided sha256Hash does not match the query.", "INVALID_PERSISTED_QUERY"
+        )
+    if allowlist_only:
+        if get_allowed_query(query_hash) is None:
+            raise _error(
+                "Only registered queries are allowed.", PERSISTED_QUERY_NOT_FOUND
+            )
+        return query, False
+    return query, True
@@ -14,6 +14,7 @@ from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductVariantBulkErrorCode
 from ....warehouse import models as warehouse_models
+from ....warehouse.management import schedule_variants_channel_availability_update
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...attribute.types import (
@@ -896,6 +897,9 @@ class ProductVariantBulkCreate(BaseMutation):
             AttributeAssignmentMixin.save(variant, attributes)
 
         warehouse_models.Stock.objects.bulk_create(stocks_to_create)
+        schedule_variants_channel_availability_update(
+            variant_ids=[stock.product_variant_id for stock in stocks_to_create]
+        )
         models.ProductVariantChannelListing.objects.bulk_create(listings_to_create)
 
         if product and not product.default_variant and variants_to_create:
@@ -13,7 +13,11 @@ from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductErrorCode, ProductVariantBulkErrorCode
 from ....warehouse import models as warehouse_models
-from ....warehouse.management import delete_stocks, stock_bulk_update
+from ....warehouse.management import (
+    delete_stocks,
+    schedule_variants_channel_availability_update,
+    stock_bulk_update,
+)
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...attribute.utils import AttributeAssignmentMixin
@@ -693,6 +697,9 @@ class ProductVariantBulkUpdate(BaseMutation):
             warehouse_models.Stock.objects.bulk_create(
                 stocks_to_create, ignore_conflicts=True
             )
+        schedule_variants_channel_availability_update(
+            variant_ids=[stock.product_variant_id for stock in stocks_to_create]
+        )
         if stocks_to_update:
             stock_bulk_update(stocks_to_update, ["quantity"])
 
@@ -6,6 +6,7 @@ from typing import Optional, TypedDict
 import django_filters
 import graphene
 import pytz
+from django.conf import settings
 from django.db.models import Exists, FloatField, OuterRef, Q, Subquery, Sum
 from django.db.models.expressions import ExpressionWrapper
 from django.db.models.fields import IntegerField
@@ -33,7 +34,13 @@ from ...product.models import (
     ProductVariantChannelListing,
 )
 from ...product.search import search_products
-from ...warehouse.models import Allocation, Reservation, Stock, Warehouse
+from ...warehouse.models import (
+    Allocation,
+    ProductVariantChannelAvailability,
+    Reservation,
+    Stock,
+    Warehouse,
+)
 from ..channel.filters import get_channel_slug_from_filter_data
 from ..core.descriptions import ADDED_IN_38, ADDED_IN_317
 from ..core.doc_category import DOC_CATEGORY_PRODUCTS
@@ -389,7 +396,20 @@ def filter_products_by_collections(qs, collection_pks):
     return qs.filter(Exists(collection_products.filter(product_id=OuterRef("pk"))))
 
 
-def filter_products_by_stock_availability(qs, stock_availability, channel_slug):
+def _get_variants_in_stock(qs, channel_slug):
+    if (
+        settings.VARIANT_CHANNEL_AVAILABILITY_ENABLED
+        and settings.VARIANT_CHANNEL_AVAILABILITY_FILTER_ENABLED
+    ):
+        availabilities = ProductVariantChannelAvailability.objects.using(qs.db).filter(
+            channel__slug=channel_slug, quantity_available__gt=0
+        )
+        return (
+            ProductVariant.objects.using(qs.db)
+            .filter(Exists(availabilities.filter(product_variant_id=OuterRef("pk"))))
+            .values("product_id")
+        )
+
     allocations = (
         Allocation.objects.using(qs.db)
         .values("stock_id")
@@ -424,11 +444,15 @@ def filter_products_by_stock_availability(qs, stock_availability, channel_slug):
         .values("product_variant_id")
     )
 
-    variants = (
+    return (
         ProductVariant.objects.using(qs.db)
         .filter(Exists(stocks.filter(product_variant_id=OuterRef("pk"))))
         .values("product_id")
     )
+
+
+def filter_products_by_stock_availability(qs, stock_availability, channel_slug):
+    variants = _get_variants_in_stock(qs, channel_slug)
     if stock_availability == StockAvailability.IN_STOCK:
         qs = qs.filter(Exists(variants.filter(product_id=OuterRef("pk"))))
     if stock_availability == StockAvailability.OUT_OF_STOCK:
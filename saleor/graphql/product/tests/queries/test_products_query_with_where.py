@@ -11,7 +11,13 @@ from .....attribute.tests.model_helpers import (
 )
 from .....attribute.utils import associate_attribute_values_to_instance
 from .....product import ProductTypeKind
-from .....product.models import Product, ProductChannelListing, ProductType
+from .....product.models import (
+    Product,
+    ProductChannelListing,
+    ProductType,
+    ProductVariant,
+)
+from .....warehouse.management import update_variants_channel_availability
 from .....warehouse.models import Allocation, Reservation, Stock, Warehouse
 from ....tests.utils import get_graphql_content
 
@@ -1337,6 +1343,45 @@ def test_products_filter_by_stock_availability(
     assert returned_slugs == {product_list[index].slug for index in indexes}
 
 
+@pytest.mark.parametrize(
+    ("where", "indexes"),
+    [
+        ({"stockAvailability": "OUT_OF_STOCK"}, [0, 1, 2]),
+        ({"stockAvailability": "IN_STOCK"}, [3]),
+    ],
+)
+def test_products_filter_by_stock_availability_using_channel_availability(
+    where, indexes, api_client, product_list, order_line, channel_USD, product, settings
+):
+    # given
+    settings.VARIANT_CHANNEL_AVAILABILITY_ENABLED = True
+    settings.VARIANT_CHANNEL_AVAILABILITY_FILTER_ENABLED = True
+    for prod in product_list:
+        stock = prod.variants.first().stocks.first()
+        Allocation.objects.create(
+            order_line=order_line, stock=stock, quantity_allocated=stock.quantity
+        )
+    product_list.append(product)
+    update_variants_channel_availability(
+        ProductVariant.objects.values_list("pk", flat=True)
+    )
+
+    variables = {
+        "channel": channel_USD.slug,
+        "where": where,
+    }
+
+    # when
+    response = api_client.post_graphql(PRODUCTS_WHERE_QUERY, variables)
+    data = get_graphql_content(response)
+
+    # then
+    nodes = data["data"]["products"]["edges"]
+    assert len(nodes) == len(indexes)
+    returned_slugs = {node["node"]["slug"] for node in nodes}
+    assert returned_slugs == {product_list[index].slug for index in indexes}
+
+
 def test_products_filter_by_stock_availability_including_reservations(
     api_client,
     product_list,
@@ -0,0 +1,146 @@
+"""SQL query statistics collected for a single GraphQL operation.
+
+When `GRAPHQL_QUERY_STATS_ENABLED` is set, every SQL query executed while the
+operation runs is counted and attributed to the field path of the resolver that
+issued it (see `QueryStatsMiddleware`). Queries sent outside of resolvers, for
+example by dataloader batches, are attributed to `ROOT_PATH`.
+
+The same SQL shape executed many times from one field path usually means that a
+resolver bypasses the dataloaders (N+1). Such queries and operations exceeding
+`GRAPHQL_QUERY_STATS_BUDGET` are reported as span tags and log records.
+"""
+
+import logging
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+ROOT_PATH = "<root>"
+
+# Lists of parameters have a different length depending on the number of
+# looked up objects, e.g. `IN (%s, %s, %s)`, collapse them into a single one.
+PARAMS_LIST_RE = re.compile(r"%s(?:\s*,\s*%s)+")
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar(
+    "graphql_query_stats", default=None
+)
+_current_path: ContextVar[str] = ContextVar("graphql_resolver_path", default=ROOT_PATH)
+
+
+def get_sql_shape(sql: str) -> str:
+    return PARAMS_LIST_RE.sub("%s", sql)
+
+
+def get_resolver_path(path: list) -> str:
+    # List indexes are skipped so the queries of all list items share the path.
+    return ".".join(str(key) for key in path if not isinstance(key, int))
+
+
+class QueryStats:
+    def __init__(self, budget: int = 0, n_plus_one_threshold: int = 0):
+        self.budget = budget
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.total = 0
+        self.by_path: Counter[str] = Counter()
+        self.by_shape: Counter[tuple[str, str]] = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        self.record(sql)
+        return execute(sql, params, many, context)
+
+    def record(self, sql: str):
+        path = _current_path.get()
+        self.total += 1
+        self.by_path[path] += 1
+        self.by_shape[(path, get_sql_shape(sql))] += 1
+
+    @property
+    def budget_exceeded(self) -> bool:
+        return bool(self.budget) and self.total > self.budget
+
+    def get_repeated_queries(self) -> list[dict]:
+        if not self.n_plus_one_threshold:
+            return []
+        return [
+            {"path": path, "sql": sql, "count": count}
+            for (path, sql), count in self.by_shape.most_common()
+            if count >= self.n_plus_one_threshold
+        ]
+
+    def as_dict(self) -> dict:
+        return {
+            "totalQueries": self.total,
+            "budget": self.budget or None,
+            "byPath": dict(self.by_path.most_common()),
+            "repeatedQueries": self.get_repeated_queries(),
+        }
+
+
+@contextmanager
+def collect_query_stats() -> Iterator[Optional[QueryStats]]:
+    if not settings.GRAPHQL_QUERY_STATS_ENABLED:
+        yield None
+        return
+
+    stats = QueryStats(
+        budget=settings.GRAPHQL_QUERY_STATS_BUDGET,
+        n_plus_one_threshold=settings.GRAPHQL_QUERY_STATS_N_PLUS_ONE_THRESHOLD,
+    )
+    token = _current_stats.set(stats)
+    try:
+        with ExitStack() as stack:
+            # resolvers read from the replica, count the queries of all databases
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(stats))
+            yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def get_current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def resolving(path: list) -> Iterator[None]:
+    token = _current_path.set(get_resolver_path(path))
+    try:
+        yield
+    finally:
+        _current_path.reset(token)
+
+
+def report_query_stats(stats: QueryStats, span, query_identifier: str):
+    span.set_tag("graphql.sql_queries", stats.total)
+    repeated_queries = stats.get_repeated_queries()
+    if repeated_queries:
+        span.set_tag("graphql.sql_n_plus_one", len(repeated_queries))
+        for query in repeated_queries:
+            logger.warning(
+                "Possible N+1: query executed %s times by %s in %s.",
+                query["count"],
+                query["path"],
+                query_identifier,
+                extra={
+                    "query_identifier": query_identifier,
+                    "resolver_path": query["path"],
+                    "sql": query["sql"],
+                },
+            )
+    if stats.budget_exceeded:
+        span.set_tag("graphql.sql_query_budget_exceeded", True)
+        logger.warning(
+            "Operation %s executed %s SQL queries, exceeding the budget of %s.",
+            query_identifier,
+            stats.total,
+            stats.budget,
+            extra={"query_identifier": query_identifier},
+        )
@@ -0,0 +1,176 @@
+"""Full-response cache for anonymous storefront queries.
+
+Only queries sent without authentication and selecting exclusively the root
+fields from `GRAPHQL_RESPONSE_CACHE_ROOT_FIELDS` are cached. The channel and the
+language are passed to these fields as arguments, so they are part of the key
+through the query string and the variables.
+
+All entries share a single version stored in the cache. The version is replaced
+whenever `PluginsManager` emits one of `RESPONSE_CACHE_INVALIDATION_EVENTS`,
+which makes every cached response stale at once.
+"""
+
+import hashlib
+import json
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from graphql import GraphQLDocument
+from graphql.language.ast import Field, OperationDefinition
+
+from .. import __version__ as saleor_version
+from ..core.auth import get_token_from_request
+
+RESPONSE_CACHE_VERSION_KEY = "graphql-response-cache-version"
+
+RESPONSE_CACHE_INVALIDATION_EVENTS = frozenset(
+    [
+        "attribute_created",
+        "attribute_updated",
+        "attribute_deleted",
+        "attribute_value_created",
+        "attribute_value_updated",
+        "attribute_value_deleted",
+        "category_created",
+        "category_updated",
+        "category_deleted",
+        "channel_created",
+        "channel_updated",
+        "channel_deleted",
+        "channel_status_changed",
+        "channel_metadata_updated",
+        "collection_created",
+        "collection_updated",
+        "collection_deleted",
+        "collection_metadata_updated",
+        "menu_created",
+        "menu_updated",
+        "menu_deleted",
+        "menu_item_created",
+        "menu_item_updated",
+        "menu_item_deleted",
+        "page_created",
+        "page_updated",
+        "page_deleted",
+        "page_type_created",
+        "page_type_updated",
+        "page_type_deleted",
+        "product_created",
+        "product_updated",
+        "product_deleted",
+        "product_media_created",
+        "product_media_updated",
+        "product_media_deleted",
+        "product_metadata_updated",
+        "product_variant_created",
+        "product_variant_updated",
+        "product_variant_deleted",
+        "product_variant_out_of_stock",
+        "product_variant_back_in_stock",
+        "product_variant_stocks_updated",
+        "product_variant_metadata_updated",
+        "promotion_created",
+        "promotion_updated",
+        "promotion_deleted",
+        "promotion_started",
+        "promotion_ended",
+        "promotion_rule_created",
+        "promotion_rule_updated",
+        "promotion_rule_deleted",
+        "sale_created",
+        "sale_updated",
+        "sale_deleted",
+        "sale_toggle",
+        "shop_metadata_updated",
+        "translations_created",
+        "translations_updated",
+        "warehouse_created",
+        "warehouse_updated",
+        "warehouse_deleted",
+    ]
+)
+
+
+def is_response_cache_enabled() -> bool:
+    return settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT > 0
+
+
+def get_operation_root_fields(
+    document: GraphQLDocument, operation_name: Optional[str]
+) -> Optional[set[str]]:
+    """Return root field names of the query operation that will be executed.
+
+    Return None when the operation is not a query, cannot be determined or
+    uses fragments on the root level.
+    """
+    operations = [
+        definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, OperationDefinition)
+    ]
+    if operation_name:
+        operations = [
+            operation
+            for operation in operations
+            if operation.name and operation.name.value == operation_name
+        ]
+    if len(operations) != 1 or operations[0].operation != "query":
+        return None
+
+    root_fields = set()
+    for selection in operations[0].selection_set.selections:
+        if not isinstance(selection, Field):
+            return None
+        root_fields.add(selection.name.value)
+    return root_fields
+
+
+def is_response_cacheable(
+    request: HttpRequest, document: GraphQLDocument, operation_name: Optional[str]
+) -> bool:
+    if not is_response_cache_enabled():
+        return False
+    if get_token_from_request(request) or getattr(request, "app", None):
+        return False
+    root_fields = get_operation_root_fields(document, operation_name)
+    if not root_fields:
+        return False
+    return root_fields.issubset(settings.GRAPHQL_RESPONSE_CACHE_ROOT_FIELDS)
+
+
+def get_response_cache_version() -> int:
+    version = cache.get(RESPONSE_CACHE_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        cache.add(RESPONSE_CACHE_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def invalidate_response_cache():
+    if not is_response_cache_enabled():
+        return
+    cache.set(RESPONSE_CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def generate_response_cache_key(
+    query: str, operation_name: Optional[str], variables: Optional[dict]
+) -> str:
+    payload = json.dumps(
+        {"query": query, "operationName": operation_name, "variables": variables},
+        sort_keys=True,
+        default=str,
+    )
+    payload_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    version = get_response_cache_version()
+    return f"{saleor_version}-response-{version}-{payload_hash}"
+
+
+def get_cached_response(key: str) -> Optional[dict]:
+    return cache.get(key)
+
+
+def set_cached_response(key: str, data: dict):
+    cache.set(key, data, timeout=settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT)
@@ -8,14 +8,19 @@ from django.db.models import Q
 from django.http.request import split_domain_port
 from promise import Promise
 
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import DataLoader, SharedCacheDataLoader
 
 
-class SiteByIdLoader(DataLoader[int, Site]):
+class SiteByIdLoader(SharedCacheDataLoader[int, Site]):
     context_key = "site_by_id"
+    shared_cache_models = ("sites.Site", "site.SiteSettings")
 
     def batch_load(self, keys):
-        sites_mapped = Site.objects.using(self.database_connection_name).in_bulk(keys)
+        sites_mapped = (
+            Site.objects.using(self.database_connection_name)
+            .select_related("settings")
+            .in_bulk(keys)
+        )
         return [sites_mapped.get(site_id) for site_id in keys]
 
 
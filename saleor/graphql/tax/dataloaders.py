@@ -10,7 +10,7 @@ from ...tax.models import (
     TaxConfiguration,
     TaxConfigurationPerCountry,
 )
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import DataLoader, SharedCacheDataLoader
 from ..product.dataloaders import (
     ProductByIdLoader,
     ProductByVariantIdLoader,
@@ -19,8 +19,9 @@ from ..product.dataloaders import (
 )
 
 
-class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
+class TaxConfigurationPerCountryByTaxConfigurationIDLoader(SharedCacheDataLoader):
     context_key = "tax_configuration_per_country_by_tax_configuration_id"
+    shared_cache_models = ("tax.TaxConfigurationPerCountry",)
 
     def batch_load(self, keys):
         tax_configs_per_country = TaxConfigurationPerCountry.objects.using(
@@ -34,8 +35,9 @@ class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
         return [one_to_many[key] for key in keys]
 
 
-class TaxConfigurationByChannelId(DataLoader[int, TaxConfiguration]):
+class TaxConfigurationByChannelId(SharedCacheDataLoader[int, TaxConfiguration]):
     context_key = "tax_configuration_by_channel_id"
+    shared_cache_models = ("tax.TaxConfiguration",)
 
     def batch_load(self, keys):
         tax_configs = TaxConfiguration.objects.using(
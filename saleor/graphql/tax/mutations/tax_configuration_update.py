@@ -10,6 +10,7 @@ from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_39, ADDED_IN_319
 from ...core.doc_category import DOC_CATEGORY_TAXES
 from ...core.mutations import ModelMutation
+from ...core.shared_cache import invalidate_shared_cache_models
 from ...core.types import BaseInputObjectType, Error, NonNullList
 from ...core.utils import get_duplicates_items
 from ...plugins.dataloaders import get_plugin_manager_promise
@@ -255,6 +256,7 @@ class TaxConfigurationUpdate(ModelMutation):
             if item["country_code"] not in updated_countries
         ]
         models.TaxConfigurationPerCountry.objects.bulk_create(to_create)
+        invalidate_shared_cache_models("tax.TaxConfigurationPerCountry")
 
     @classmethod
     def remove_countries_configuration(cls, country_codes):
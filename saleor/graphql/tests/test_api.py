@@ -0,0 +1,160 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from graphql import GraphQLError
+
+from ...core.utils.cache import CacheDict
+from ..api import (
+    SaleorGraphQLBackend,
+    SaleorGraphQLCachedBackend,
+    SaleorGraphQLDocument,
+    read_warm_up_operations,
+    schema,
+    warm_up_document_cache,
+)
+from ..core.validators.query_cost import build_query_cost_plan
+
+QUERY = """
+query Shop {
+    shop {
+        name
+    }
+}
+"""
+
+
+def test_cached_backend_collects_stats():
+    # given
+    backend = SaleorGraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1))
+
+    # when
+    document = backend.document_from_string(schema, QUERY)
+    cached_document = backend.document_from_string(schema, QUERY)
+    backend.document_from_string(schema, "{ me { id } }")
+
+    # then
+    assert document is cached_document
+    assert backend.get_stats() == {
+        "size": 1,
+        "capacity": 1,
+        "hits": 1,
+        "misses": 2,
+        "evictions": 1,
+    }
+
+
+def test_cached_backend_get_document_reports_cache_hit():
+    # given
+    backend = SaleorGraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1))
+
+    # when
+    document, first_cache_hit = backend.get_document(schema, QUERY)
+    cached_document, second_cache_hit = backend.get_document(schema, QUERY)
+
+    # then
+    assert document is cached_document
+    assert first_cache_hit is False
+    assert second_cache_hit is True
+
+
+def test_cached_backend_counts_concurrent_lookups():
+    # given
+    backend = SaleorGraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1))
+    backend.document_from_string(schema, QUERY)
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                lambda _: backend.document_from_string(schema, QUERY), range(100)
+            )
+        )
+
+    # then
+    assert backend.get_stats()["hits"] == 100
+
+
+def test_document_memoizes_analyses():
+    # given
+    document = SaleorGraphQLBackend().document_from_string(schema, QUERY)
+
+    # when
+    with mock.patch(
+        "saleor.graphql.api.query_identifier", wraps=lambda doc: "shop"
+    ) as identifier_mock:
+        identifiers = {document.query_identifier, document.query_identifier}
+
+    # then
+    assert identifiers == {"shop"}
+    identifier_mock.assert_called_once_with(document)
+    assert document.query_fingerprint.startswith("query:Shop:")
+    assert document.contains_only_schema() is False
+
+
+def test_document_reraises_cached_schema_error():
+    # given
+    document = SaleorGraphQLBackend().document_from_string(
+        schema, "{ shop { name } __schema { queryType { name } } }"
+    )
+
+    # when & then
+    for _ in range(2):
+        with pytest.raises(GraphQLError):
+            document.contains_only_schema()
+
+
+def test_document_reuses_query_cost_plan():
+    # given
+    document = SaleorGraphQLBackend().document_from_string(
+        schema,
+        """
+        query Products($first: Int) {
+            products(first: $first, channel: "default-channel") { edges { node { id } } }
+        }
+        """,
+    )
+
+    # when
+    with mock.patch(
+        "saleor.graphql.api.build_query_cost_plan", wraps=build_query_cost_plan
+    ) as build_plan_mock:
+        cost_10, _ = document.get_query_cost({"first": 10}, 100)
+        cost_20, _ = document.get_query_cost({"first": 20}, 100)
+
+    # then
+    assert (cost_10, cost_20) == (10, 20)
+    build_plan_mock.assert_called_once()
+
+
+def test_warm_up_document_cache(tmp_path):
+    # given
+    (tmp_path / "shop.graphql").write_text(QUERY)
+    (tmp_path / "notes.txt").write_text("not an operation")
+    operations = list(read_warm_up_operations(str(tmp_path)))
+
+    # when
+    count = warm_up_document_cache(operations)
+
+    # then
+    assert operations == [QUERY]
+    assert count == 1
+
+
+def test_warm_up_document_cache_without_configured_path(settings):
+    # given
+    settings.GRAPHQL_DOCUMENT_CACHE_WARM_UP_PATH = None
+
+    # when
+    count = warm_up_document_cache()
+
+    # then
+    assert count == 0
+
+
+def test_cached_document_type():
+    # when
+    document = SaleorGraphQLBackend().document_from_string(schema, QUERY)
+
+    # then
+    assert isinstance(document, SaleorGraphQLDocument)
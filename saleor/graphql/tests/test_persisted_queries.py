@@ -0,0 +1,169 @@
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from ...core.models import PersistedQuery
+from ..persisted_queries import (
+    PERSISTED_QUERY_NOT_FOUND,
+    get_persisted_query,
+    get_persisted_query_cache_key,
+    get_query_hash,
+    register_allowed_query,
+)
+from .utils import get_graphql_content_from_response
+
+QUERY_SHOP = "query ShopName { shop { name } }"
+INVALID_QUERY = "query Invalid { shop { notExistingField } }"
+
+
+def _extensions(query_hash):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+def test_persisted_query_not_found(api_client, settings):
+    # given
+    cache.clear()
+    settings.PERSISTED_QUERIES_ENABLED = True
+
+    # when
+    response = api_client.post({"extensions": _extensions(get_query_hash(QUERY_SHOP))})
+
+    # then
+    assert response.status_code == 200
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == PERSISTED_QUERY_NOT_FOUND
+    assert content["errors"][0]["extensions"]["code"] == PERSISTED_QUERY_NOT_FOUND
+
+
+def test_persisted_query_is_registered_and_executed_by_hash(
+    api_client, site_settings, settings
+):
+    # given
+    cache.clear()
+    settings.PERSISTED_QUERIES_ENABLED = True
+    query_hash = get_query_hash(QUERY_SHOP)
+    api_client.post({"query": QUERY_SHOP, "extensions": _extensions(query_hash)})
+
+    # when
+    response = api_client.post({"extensions": _extensions(query_hash)})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert get_persisted_query(query_hash) == QUERY_SHOP
+
+
+def test_invalid_persisted_query_is_not_registered(api_client, settings):
+    # given
+    cache.clear()
+    settings.PERSISTED_QUERIES_ENABLED = True
+    query_hash = get_query_hash(INVALID_QUERY)
+
+    # when
+    response = api_client.post(
+        {"query": INVALID_QUERY, "extensions": _extensions(query_hash)}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"]
+    assert get_persisted_query(query_hash) is None
+
+
+def test_persisted_query_hash_mismatch(api_client, settings):
+    # given
+    cache.clear()
+    settings.PERSISTED_QUERIES_ENABLED = True
+
+    # when
+    response = api_client.post(
+        {"query": QUERY_SHOP, "extensions": _extensions("0" * 64)}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "INVALID_PERSISTED_QUERY"
+    assert get_persisted_query("0" * 64) is None
+
+
+def test_persisted_queries_disabled(api_client, settings):
+    # given
+    settings.PERSISTED_QUERIES_ENABLED = False
+
+    # when
+    response = api_client.post(
+        {"query": QUERY_SHOP, "extensions": _extensions(get_query_hash(QUERY_SHOP))}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "PersistedQueryNotSupported"
+
+
+def test_allowlist_rejects_unregistered_query(api_client, settings):
+    # given
+    cache.clear()
+    settings.PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+
+    # when
+    response = api_client.post({"query": QUERY_SHOP})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == PERSISTED_QUERY_NOT_FOUND
+
+
+def test_allowlist_accepts_registered_query(api_client, settings, site_settings):
+    # given
+    settings.PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+    register_allowed_query(QUERY_SHOP)
+    cache.clear()
+
+    # when
+    response = api_client.post({"query": QUERY_SHOP})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_allowlist_does_not_register_queries_sent_by_clients(api_client, settings):
+    # given
+    cache.clear()
+    settings.PERSISTED_QUERIES_ENABLED = True
+    settings.PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+    query_hash = get_query_hash(QUERY_SHOP)
+
+    # when
+    response = api_client.post(
+        {"query": QUERY_SHOP, "extensions": _extensions(query_hash)}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == PERSISTED_QUERY_NOT_FOUND
+    assert cache.get(get_persisted_query_cache_key(query_hash)) is None
+
+
+def test_register_persisted_queries_command(tmp_path, db):
+    # given
+    (tmp_path / "shop.graphql").write_text(QUERY_SHOP)
+
+    # when
+    call_command("register_persisted_queries", str(tmp_path))
+
+    # then
+    persisted_query = PersistedQuery.objects.get()
+    assert persisted_query.query_hash == get_query_hash(QUERY_SHOP)
+    assert persisted_query.query == QUERY_SHOP
+
+
+def test_register_persisted_queries_command_invalid_query(tmp_path, db):
+    # given
+    (tmp_path / "invalid.graphql").write_text(INVALID_QUERY)
+
+    # when & then
+    with pytest.raises(CommandError, match="notExistingField"):
+        call_command("register_persisted_queries", str(tmp_path))
+    assert not PersistedQuery.objects.exists()
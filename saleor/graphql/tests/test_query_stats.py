@@ -0,0 +1,131 @@
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.test import override_settings
+
+from ..middleware import QueryStatsMiddleware
+from ..query_stats import (
+    ROOT_PATH,
+    QueryStats,
+    collect_query_stats,
+    get_resolver_path,
+    get_sql_shape,
+    report_query_stats,
+)
+
+SHOP_QUERY = """
+query {
+    shop {
+        name
+    }
+}
+"""
+
+
+def test_get_sql_shape_collapses_parameter_lists():
+    # given
+    sql = 'SELECT "id" FROM "product" WHERE "id" IN (%s, %s, %s) AND "x" = %s'
+
+    # when
+    shape = get_sql_shape(sql)
+
+    # then
+    assert shape == 'SELECT "id" FROM "product" WHERE "id" IN (%s) AND "x" = %s'
+
+
+def test_get_resolver_path_skips_list_indexes():
+    assert get_resolver_path(["products", "edges", 3, "node", "name"]) == (
+        "products.edges.node.name"
+    )
+
+
+def test_query_stats_detects_repeated_queries():
+    # given
+    stats = QueryStats(budget=3, n_plus_one_threshold=3)
+    middleware = QueryStatsMiddleware()
+    sql = 'SELECT * FROM "product_productvariant" WHERE "product_id" = %s'
+
+    def resolver(root, info):
+        stats.record(sql)
+
+    # when
+    with mock.patch(
+        "saleor.graphql.middleware.get_current_query_stats", return_value=stats
+    ):
+        for index in range(3):
+            info = mock.Mock(path=["products", "edges", index, "node", "variants"])
+            middleware.resolve(resolver, None, info)
+    stats.record("SELECT 1")
+
+    # then
+    assert stats.total == 4
+    assert stats.budget_exceeded
+    assert stats.as_dict() == {
+        "totalQueries": 4,
+        "budget": 3,
+        "byPath": {"products.edges.node.variants": 3, ROOT_PATH: 1},
+        "repeatedQueries": [
+            {"path": "products.edges.node.variants", "sql": sql, "count": 3}
+        ],
+    }
+
+
+def test_report_query_stats(caplog):
+    # given
+    stats = QueryStats(budget=1, n_plus_one_threshold=2)
+    stats.record("SELECT 1")
+    stats.record("SELECT 1")
+    span = mock.Mock()
+
+    # when
+    report_query_stats(stats, span, "query")
+
+    # then
+    span.set_tag.assert_has_calls(
+        [
+            mock.call("graphql.sql_queries", 2),
+            mock.call("graphql.sql_n_plus_one", 1),
+            mock.call("graphql.sql_query_budget_exceeded", True),
+        ]
+    )
+    assert len(caplog.records) == 2
+
+
+@override_settings(GRAPHQL_QUERY_STATS_ENABLED=False)
+def test_collect_query_stats_disabled():
+    with collect_query_stats() as stats:
+        assert stats is None
+
+
+@override_settings(GRAPHQL_QUERY_STATS_ENABLED=True)
+def test_collect_query_stats_counts_queries_of_all_databases(site_settings):
+    # when
+    with collect_query_stats() as stats:
+        Site.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME).count()
+        Site.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).count()
+
+    # then
+    assert stats.total == 2
+
+
+@override_settings(GRAPHQL_QUERY_STATS_ENABLED=True, DEBUG=True)
+def test_query_stats_in_response_extensions(api_client, site_settings):
+    # when
+    response = api_client.post_graphql(SHOP_QUERY)
+
+    # then
+    query_stats = response.json()["extensions"]["queryStats"]
+    assert query_stats["totalQueries"] > 0
+    assert query_stats["repeatedQueries"] == []
+
+
+@override_settings(GRAPHQL_QUERY_STATS_ENABLED=True, DEBUG=False)
+def test_query_stats_not_in_response_extensions_without_debug(
+    api_client, site_settings
+):
+    # when
+    response = api_client.post_graphql(SHOP_QUERY)
+
+    # then
+    assert "queryStats" not in response.json().get("extensions", {})
@@ -0,0 +1,128 @@
+from unittest import mock
+
+import graphene
+from django.core.cache import cache
+
+from ...plugins.manager import get_plugins_manager
+from ..api import backend, schema
+from ..response_cache import (
+    RESPONSE_CACHE_VERSION_KEY,
+    generate_response_cache_key,
+    get_operation_root_fields,
+    get_response_cache_version,
+)
+from .utils import get_graphql_content
+
+QUERY_CATEGORY = """
+query Category($id: ID!) {
+    category(id: $id) {
+        name
+    }
+}
+"""
+
+
+def test_get_operation_root_fields():
+    # given
+    document = backend.document_from_string(
+        schema,
+        """
+        query First { shop { name } categories(first: 1) { totalCount } }
+        mutation Second { tokenRefresh { token } }
+        """,
+    )
+
+    # when & then
+    assert get_operation_root_fields(document, "First") == {"shop", "categories"}
+    assert get_operation_root_fields(document, "Second") is None
+    assert get_operation_root_fields(document, None) is None
+
+
+def test_anonymous_query_response_is_cached(api_client, category, settings):
+    # given
+    cache.clear()
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    variables = {"id": graphene.Node.to_global_id("Category", category.pk)}
+    response = api_client.post_graphql(QUERY_CATEGORY, variables)
+    name = get_graphql_content(response)["data"]["category"]["name"]
+
+    # when
+    with mock.patch("saleor.graphql.views.GraphQLView.get_root_value") as root_mock:
+        response = api_client.post_graphql(QUERY_CATEGORY, variables)
+
+    # then
+    assert get_graphql_content(response)["data"]["category"]["name"] == name
+    root_mock.assert_not_called()
+
+
+def test_authenticated_query_response_is_not_cached(
+    staff_api_client, category, settings
+):
+    # given
+    cache.clear()
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+
+    # when
+    with mock.patch("saleor.graphql.views.set_cached_response") as set_mock:
+        staff_api_client.post_graphql("{ shop { name } }")
+
+    # then
+    set_mock.assert_not_called()
+
+
+def test_response_cache_disabled_by_default(api_client, site_settings):
+    # when
+    with mock.patch("saleor.graphql.views.set_cached_response") as set_mock:
+        api_client.post_graphql("{ shop { name } }")
+
+    # then
+    set_mock.assert_not_called()
+
+
+def test_query_with_private_root_field_is_not_cached(api_client, settings):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+
+    # when
+    with mock.patch("saleor.graphql.views.set_cached_response") as set_mock:
+        api_client.post_graphql("{ shop { name } me { email } }")
+
+    # then
+    set_mock.assert_not_called()
+
+
+def test_plugin_manager_event_invalidates_response_cache(
+    category, settings, django_capture_on_commit_callbacks
+):
+    # given
+    cache.clear()
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    key = generate_response_cache_key(QUERY_CATEGORY, None, {"id": "1"})
+    manager = get_plugins_manager(allow_replica=False)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        manager.category_updated(category)
+
+    # then
+    assert generate_response_cache_key(QUERY_CATEGORY, None, {"id": "1"}) != key
+    assert cache.get(RESPONSE_CACHE_VERSION_KEY) == get_response_cache_version()
+
+
+def test_plugin_manager_event_invalidates_response_cache_after_commit(
+    category, settings, django_capture_on_commit_callbacks
+):
+    # given
+    cache.clear()
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    key = generate_response_cache_key(QUERY_CATEGORY, None, {"id": "1"})
+    manager = get_plugins_manager(allow_replica=False)
+
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        manager.category_updated(category)
+
+    # then
+    assert generate_response_cache_key(QUERY_CATEGORY, None, {"id": "1"}) == key
+    callbacks[0]()
+    assert generate_response_cache_key(QUERY_CATEGORY, None, {"id": "1"}) != key
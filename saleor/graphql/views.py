@@ -23,10 +23,22 @@ from .. import __version__ as saleor_version
 from ..core.exceptions import PermissionDenied
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from ..webhook import observability
-from .api import API_PATH, schema
+from .api import API_PATH, SaleorGraphQLCachedBackend, SaleorGraphQLDocument, schema
 from .context import clear_context, get_context_value
 from .core.validators.query_cost import validate_query_cost
+from .persisted_queries import (
+    PersistedQueryError,
+    register_persisted_query,
+    resolve_persisted_query,
+)
 from .query_cost_map import COST_MAP
+from .query_stats import collect_query_stats, report_query_stats
+from .response_cache import (
+    generate_response_cache_key,
+    get_cached_response,
+    is_response_cacheable,
+    set_cached_response,
+)
 from .utils import format_error, query_fingerprint, query_identifier
 from .utils.validators import check_if_query_contains_only_schema
 
@@ -62,6 +74,7 @@ class GraphQLView(View):
     root_value = None
     backend: GraphQLBackend = None  # type: ignore[assignment]
     _query: Optional[str] = None
+    _document_cache_hit: Optional[bool] = None
 
     HANDLED_EXCEPTIONS = (
         GraphQLError,
@@ -250,10 +263,13 @@ class GraphQLView(View):
 
         # Attempt to parse the query, if it fails, return the error
         try:
-            return (
-                self.backend.document_from_string(self.schema, query),
-                None,
-            )
+            if isinstance(self.backend, SaleorGraphQLCachedBackend):
+                document, self._document_cache_hit = self.backend.get_document(
+                    self.schema, query
+                )
+            else:
+                document = self.backend.document_from_string(self.schema, query)
+            return document, None
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
@@ -267,6 +283,12 @@ class GraphQLView(View):
             )
 
             query, variables, operation_name = self.get_graphql_params(request, data)
+            try:
+                query, register_query = resolve_persisted_query(
+                    query, data.get("extensions")
+                )
+            except PersistedQueryError as e:
+                return ExecutionResult(errors=[e], invalid=False)
             document, error = self.parse_query(query)
             with observability.report_gql_operation() as operation:
                 operation.query = document
@@ -274,31 +296,54 @@ class GraphQLView(View):
                 operation.variables = variables
             if error or document is None:
                 return error
+            if (
+                register_query
+                and isinstance(document, SaleorGraphQLDocument)
+                and not document.validation_errors
+            ):
+                register_persisted_query(document.document_string)
+
+            if isinstance(self.backend, SaleorGraphQLCachedBackend):
+                span.set_tag("graphql.document_cache_hit", self._document_cache_hit)
+                for name, value in self.backend.get_stats().items():
+                    span.set_tag(f"graphql.document_cache.{name}", value)
+            if isinstance(document, SaleorGraphQLDocument):
+                analysis = document
+            else:
+                analysis = DocumentAnalysis(document)
 
-            _query_identifier = query_identifier(document)
+            _query_identifier = analysis.query_identifier
             self._query = _query_identifier
             raw_query_string = document.document_string
             span.set_tag("resource.name", raw_query_string)
             span.set_tag("graphql.query", raw_query_string)
             span.set_tag("graphql.query_identifier", _query_identifier)
-            span.set_tag("graphql.query_fingerprint", query_fingerprint(document))
+            span.set_tag("graphql.query_fingerprint", analysis.query_fingerprint)
             try:
-                query_contains_schema = check_if_query_contains_only_schema(document)
+                query_contains_schema = analysis.contains_only_schema()
             except GraphQLError as e:
                 return ExecutionResult(errors=[e], invalid=True)
 
-            query_cost, cost_errors = validate_query_cost(
-                schema,
-                document,
-                variables,
-                COST_MAP,
-                settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+            query_cost, cost_errors = analysis.get_query_cost(
+                variables, settings.GRAPHQL_QUERY_MAX_COMPLEXITY
             )
             span.set_tag("graphql.query_cost", query_cost)
             if settings.GRAPHQL_QUERY_MAX_COMPLEXITY and cost_errors:
                 result = ExecutionResult(errors=cost_errors, invalid=True)
                 return set_query_cost_on_result(result, query_cost)
 
+            response_cache_key = None
+            if is_response_cacheable(request, document, operation_name):
+                response_cache_key = generate_response_cache_key(
+                    raw_query_string, operation_name, variables
+                )
+                cached_data = get_cached_response(response_cache_key)
+                span.set_tag("graphql.response_cache_hit", cached_data is not None)
+                if cached_data is not None:
+                    return set_query_cost_on_result(
+                        ExecutionResult(data=cached_data), query_cost
+                    )
+
             extra_options: dict[str, Optional[Any]] = {}
 
             if self.executor:
@@ -312,7 +357,10 @@ class GraphQLView(View):
                 span.set_tag("app.name", app.name)
 
             try:
-                with connection.execute_wrapper(tracing_wrapper):
+                with (
+                    connection.execute_wrapper(tracing_wrapper),
+                    collect_query_stats() as query_stats,
+                ):
                     response = None
                     should_use_cache_for_scheme = query_contains_schema & (
                         not settings.DEBUG
@@ -332,7 +380,13 @@ class GraphQLView(View):
                         )
                         if should_use_cache_for_scheme:
                             cache.set(key, response)
+                        if response_cache_key and not response.errors:
+                            set_cached_response(response_cache_key, response.data)
 
+                    if query_stats is not None:
+                        report_query_stats(query_stats, span, _query_identifier)
+                        if settings.DEBUG:
+                            response.extensions["queryStats"] = query_stats.as_dict()
                     return set_query_cost_on_result(response, query_cost)
             except Exception as e:
                 span.set_tag(opentracing.tags.ERROR, True)
@@ -382,6 +436,29 @@ class GraphQLView(View):
         return format_error(error, self.HANDLED_EXCEPTIONS, self._query)
 
 
+class DocumentAnalysis:
+    """Compute the document analyses on demand for documents from other backends."""
+
+    def __init__(self, document: GraphQLDocument):
+        self.document = document
+
+    @property
+    def query_identifier(self) -> str:
+        return query_identifier(self.document)
+
+    @property
+    def query_fingerprint(self) -> str:
+        return query_fingerprint(self.document)
+
+    def contains_only_schema(self) -> bool:
+        return check_if_query_contains_only_schema(self.document)
+
+    def get_query_cost(self, variables: Optional[dict], maximum_cost: int):
+        return validate_query_cost(
+            schema, self.document, variables, COST_MAP, maximum_cost
+        )
+
+
 def get_key(key):
     try:
         int_key = int(key)
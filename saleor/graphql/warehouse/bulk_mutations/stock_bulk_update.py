@@ -8,7 +8,10 @@ from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ProductPermissions
 from ....warehouse import models
 from ....warehouse.error_codes import StockBulkUpdateErrorCode
-from ....warehouse.management import stock_qs_select_for_update
+from ....warehouse.management import (
+    schedule_variants_channel_availability_update,
+    stock_qs_select_for_update,
+)
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...core.descriptions import ADDED_IN_313, PREVIEW_FEATURE
@@ -389,6 +392,9 @@ class StockBulkUpdate(BaseMutation):
 
         # Stocks are locked in `get_stocks`
         models.Stock.objects.bulk_update(stocks_to_update, fields=["quantity"])
+        schedule_variants_channel_availability_update(
+            stock_ids=[stock.pk for stock in stocks_to_update]
+        )
 
         return stocks_to_update
 
@@ -8,6 +8,7 @@ from ....permission.enums import AppPermission
 from ....webhook import models
 from ....webhook.const import MAX_FILTERABLE_CHANNEL_SLUGS_LIMIT
 from ....webhook.error_codes import WebhookErrorCode
+from ....webhook.registry import invalidate_webhook_registry
 from ....webhook.validators import (
     HEADERS_LENGTH_LIMIT,
     HEADERS_NUMBER_LIMIT,
@@ -199,3 +200,4 @@ class WebhookCreate(ModelMutation, NotifyUserEventValidationMixin):
                 for event in events
             ]
         )
+        invalidate_webhook_registry()
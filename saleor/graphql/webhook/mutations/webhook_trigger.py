@@ -1,5 +1,3 @@
-from dataclasses import asdict
-
 import graphene
 from celery.exceptions import Retry
 from django.db.models import Exists, OuterRef
@@ -153,7 +151,7 @@ class WebhookTrigger(BaseMutation):
     def perform_mutation(cls, _root, info, **data):
         from ....webhook.transport.asynchronous.transport import (
             create_deliveries_for_subscriptions,
-            generate_deferred_payloads,
+            schedule_deferred_payloads,
             send_webhook_request_async,
         )
         from ....webhook.transport.utils import prepare_deferred_payload_data
@@ -180,12 +178,8 @@ class WebhookTrigger(BaseMutation):
                 deferred_payload_data = prepare_deferred_payload_data(
                     object, requestor, None
                 )
-                generate_deferred_payloads.apply_async(
-                    kwargs={
-                        "event_delivery_ids": [delivery.pk],
-                        "deferred_payload_data": asdict(deferred_payload_data),
-                    },
-                    bind=True,
+                schedule_deferred_payloads(
+                    event_type, [([delivery.pk], deferred_payload_data)]
                 )
             else:
                 deliveries = create_deliveries_for_subscriptions(
@@ -211,6 +211,10 @@ def generate_payload_from_subscription(
     for key in payload_data_keys:
         extracted_payload = get_event_payload(payload_instance.data.get(key))
         payload_instance.data[key] = extracted_payload
+    return _get_event_payload_from_result(payload_instance)
+
+
+def _get_event_payload_from_result(payload_instance) -> dict[str, Any]:
     if "event" in payload_instance.data or not payload_instance.data:
         event_payload = payload_instance.data.get("event") or {}
     else:
@@ -225,6 +229,85 @@ def generate_payload_from_subscription(
     return event_payload
 
 
+def generate_payloads_from_subscription(
+    event_type: str,
+    subscribable_objects: list,
+    subscription_query: str,
+    request: SaleorContext,
+    app: Optional[App] = None,
+) -> list[Optional[dict[str, Any]]]:
+    """Generate webhook payloads from subscription query for multiple objects.
+
+    The query is parsed once and executed for all objects before any of the results
+    is resolved, so the dataloaders of the request load the data needed by all
+    objects in batches. Payloads are the same as the ones returned by
+    `generate_payload_from_subscription` for each object.
+
+    return: A list of payloads in the order of `subscribable_objects`. The payload
+    is None if the function was not able to generate it for the object.
+    """
+    from ..api import schema
+    from ..context import get_context_value
+
+    graphql_backend = get_default_backend()
+    ast = parse(subscription_query)
+    document = graphql_backend.document_from_string(
+        schema,
+        ast,
+    )
+    app_id = app.pk if app else None
+    request.app = app
+    context = get_context_value(request)
+
+    def build_payload(results):
+        if hasattr(results, "errors"):
+            logger.warning(
+                "Unable to build a payload for subscription. Error: %s",
+                str(results.errors),
+                extra={"query": subscription_query, "app": app_id},
+            )
+            return None
+
+        payload: list[Any] = []
+        results.subscribe(payload.append)
+
+        if not payload:
+            logger.warning(
+                "Subscription did not return a payload.",
+                extra={"query": subscription_query, "app": app_id},
+            )
+            return None
+
+        payload_instance = payload[0]
+        keys = list(payload_instance.data.keys())
+
+        def set_payload_data(values):
+            for key, value in zip(keys, values):
+                payload_instance.data[key] = value
+            return _get_event_payload_from_result(payload_instance)
+
+        return Promise.all(
+            [Promise.resolve(payload_instance.data.get(key)) for key in keys]
+        ).then(set_payload_data)
+
+    def execute(subscribable_object):
+        return Promise.resolve(
+            document.execute(
+                allow_subscriptions=True,
+                root=(event_type, subscribable_object),
+                context=context,
+                return_promise=True,
+            )
+        ).then(build_payload)
+
+    def execute_all(_):
+        # Executions are started within a single promise callback to let the
+        # dataloaders dispatch the keys requested by all of them at once.
+        return Promise.all([execute(instance) for instance in subscribable_objects])
+
+    return Promise.resolve(None).then(execute_all).get()
+
+
 def get_pre_save_payload_key(webhook, instance):
     return f"{webhook.pk}_{instance.pk}"
 
@@ -15,16 +15,19 @@ from ..plugins.manager import get_plugins_manager
 from ..warehouse.management import deallocate_stock_for_orders
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..webhook.utils import get_webhooks_for_multiple_events
-from . import OrderEvents, OrderStatus
+from . import ORDER_EDITABLE_STATUS, OrderEvents, OrderStatus
 from .actions import call_order_event, call_order_events
 from .models import Order, OrderEvent
-from .utils import invalidate_order_prices
 
 logger = logging.getLogger(__name__)
 
 # Batch size of 100 is about ~1MB of memory usage in task
 EXPIRE_ORDER_BATCH_SIZE = 100
 
+# Batch size of 5000 is about ~0.5MB of memory usage in task, as only the ids are
+# kept in memory and the orders are updated with a single query
+RECALCULATE_ORDERS_BATCH_SIZE = 5000
+
 # Batch size of 5000 is about ~5MB of memory usage in task
 # It takes +/- 8 secs to delete 5000 orders
 DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
@@ -32,12 +35,20 @@ DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
 
 @app.task
 def recalculate_orders_task(order_ids: list[int]):
-    orders = Order.objects.filter(id__in=order_ids)
-
-    for order in orders:
-        invalidate_order_prices(order)
-
-    Order.objects.bulk_update(orders, ["should_refresh_prices"])
+    """Mark editable orders for prices recalculation.
+
+    Orders are processed in batches; the remaining ones are handled by
+    the next task call.
+    """
+    ids = order_ids[:RECALCULATE_ORDERS_BATCH_SIZE]
+    Order.objects.filter(
+        id__in=ids,
+        status__in=ORDER_EDITABLE_STATUS,
+        should_refresh_prices=False,
+    ).update(should_refresh_prices=True)
+
+    if remaining_ids := order_ids[RECALCULATE_ORDERS_BATCH_SIZE:]:
+        recalculate_orders_task.delay(remaining_ids)
 
 
 @app.task
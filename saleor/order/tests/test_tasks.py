@@ -19,6 +19,7 @@ from ..tasks import (
     _bulk_release_voucher_usage,
     delete_expired_orders_task,
     expire_orders_task,
+    recalculate_orders_task,
     send_order_updated,
 )
 
@@ -852,3 +853,43 @@ def test_send_order_updated(
     )
 
     assert wrapped_call_order_event.called
+
+
+def test_recalculate_orders_task(order_list):
+    # given
+    draft_order, unconfirmed_order, unfulfilled_order = order_list[:3]
+    draft_order.status = OrderStatus.DRAFT
+    unconfirmed_order.status = OrderStatus.UNCONFIRMED
+    unfulfilled_order.status = OrderStatus.UNFULFILLED
+    for order in order_list:
+        order.should_refresh_prices = False
+    Order.objects.bulk_update(order_list, ["status", "should_refresh_prices"])
+
+    # when
+    recalculate_orders_task([order.pk for order in order_list[:3]])
+
+    # then
+    draft_order.refresh_from_db()
+    assert draft_order.should_refresh_prices
+    unconfirmed_order.refresh_from_db()
+    assert unconfirmed_order.should_refresh_prices
+    unfulfilled_order.refresh_from_db()
+    assert not unfulfilled_order.should_refresh_prices
+
+
+@patch("saleor.order.tasks.RECALCULATE_ORDERS_BATCH_SIZE", 1)
+@patch("saleor.order.tasks.recalculate_orders_task.delay")
+def test_recalculate_orders_task_schedules_remaining_orders(
+    mocked_recalculate_orders_task, draft_order_list
+):
+    # given
+    Order.objects.update(should_refresh_prices=False)
+    order_ids = [order.pk for order in draft_order_list]
+
+    # when
+    recalculate_orders_task(order_ids)
+
+    # then
+    assert Order.objects.filter(should_refresh_prices=True).count() == 1
+    assert Order.objects.get(should_refresh_prices=True).pk == order_ids[0]
+    mocked_recalculate_orders_task.assert_called_once_with(order_ids[1:])
@@ -21,6 +21,9 @@ from ..checkout.actions import (
     transaction_amounts_for_checkout_updated,
     update_last_transaction_modified_at_for_checkout,
 )
+from ..checkout.base_calculations import (
+    get_lines_total_prices_with_propagated_checkout_discount,
+)
 from ..checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ..checkout.models import Checkout
 from ..checkout.payment_utils import update_refundable_for_checkout
@@ -165,6 +168,9 @@ def create_checkout_payment_lines_information(
     lines, _ = fetch_checkout_lines(checkout)
     checkout_info = fetch_checkout_info(checkout, lines, manager)
     address = checkout_info.shipping_address or checkout_info.billing_address
+    lines_total_prices = get_lines_total_prices_with_propagated_checkout_discount(
+        checkout_info, lines
+    )
 
     for line_info in lines:
         unit_price = manager.calculate_checkout_line_unit_price(
@@ -172,6 +178,7 @@ def create_checkout_payment_lines_information(
             lines,
             line_info,
             address,
+            lines_total_prices=lines_total_prices,
         )
         unit_gross = unit_price.gross.amount
 
@@ -672,6 +672,15 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.warehouse.tasks.update_stocks_quantity_allocated_task",
         "schedule": crontab(hour=0, minute=0),
     },
+    "update-variants-channel-availability-for-expired-reservations": {
+        "task": "saleor.warehouse.tasks."
+        "update_variants_channel_availability_for_expired_reservations_task",
+        "schedule": timedelta(minutes=1),
+    },
+    "recalculate-variants-channel-availability": {
+        "task": "saleor.warehouse.tasks.recalculate_variants_channel_availability_task",
+        "schedule": crontab(hour=0, minute=30),
+    },
     "delete-old-export-files": {
         "task": "saleor.csv.tasks.delete_old_export_files",
         "schedule": crontab(hour=1, minute=0),
@@ -804,11 +813,78 @@ def SENTRY_INIT(dsn: str, sentry_opts: dict):
 GRAPHQL_PAGINATION_LIMIT = 100
 GRAPHQL_MIDDLEWARE: list[str] = []
 
+# Count SQL queries executed by each GraphQL operation and report repeated
+# queries (N+1) and operations exceeding the budget as span tags and logs.
+# In DEBUG mode the statistics are also returned in `extensions.queryStats`.
+GRAPHQL_QUERY_STATS_ENABLED = get_bool_from_env("GRAPHQL_QUERY_STATS_ENABLED", False)
+# Maximum number of SQL queries per operation, 0 disables the budget
+GRAPHQL_QUERY_STATS_BUDGET = int(os.environ.get("GRAPHQL_QUERY_STATS_BUDGET", 0))
+# Number of executions of the same SQL from one field path reported as N+1
+GRAPHQL_QUERY_STATS_N_PLUS_ONE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_QUERY_STATS_N_PLUS_ONE_THRESHOLD", 10)
+)
+if GRAPHQL_QUERY_STATS_ENABLED:
+    GRAPHQL_MIDDLEWARE.append("saleor.graphql.middleware.QueryStatsMiddleware")
+
 # Set GRAPHQL_QUERY_MAX_COMPLEXITY=0 in env to disable (not recommended)
 GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Number of parsed and validated GraphQL documents kept in the in-process cache
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+
+# Path to a `.graphql` file or a directory of them with operations that are
+# loaded into the document cache when the application starts
+GRAPHQL_DOCUMENT_CACHE_WARM_UP_PATH = os.environ.get(
+    "GRAPHQL_DOCUMENT_CACHE_WARM_UP_PATH"
+)
+
+# Time in seconds the responses to anonymous storefront queries are cached.
+# Set to 0 to disable the response cache.
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = int(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", 0)
+)
+# Root query fields that can be served from the response cache
+GRAPHQL_RESPONSE_CACHE_ROOT_FIELDS = get_list(
+    os.environ.get(
+        "GRAPHQL_RESPONSE_CACHE_ROOT_FIELDS",
+        "categories,category,collections,collection,menus,menu,pages,page,"
+        "products,product,productVariants,productVariant,shop",
+    )
+)
+
+# Cache results of the data loaders for rarely changing data, like channels,
+# tax configurations and site settings, between requests.
+DATALOADER_SHARED_CACHE_ENABLED = get_bool_from_env(
+    "DATALOADER_SHARED_CACHE_ENABLED", False
+)
+# Time in seconds the data loader results are cached
+DATALOADER_SHARED_CACHE_TIMEOUT = int(
+    os.environ.get("DATALOADER_SHARED_CACHE_TIMEOUT", 60)
+)
+# Number of data loader results kept in the in-process cache
+DATALOADER_SHARED_CACHE_SIZE = int(
+    os.environ.get("DATALOADER_SHARED_CACHE_SIZE", 10000)
+)
+# Store the data loader results also in the Django cache shared between processes.
+# Model versions invalidating the results are always kept in the Django cache.
+DATALOADER_SHARED_CACHE_DISTRIBUTED = get_bool_from_env(
+    "DATALOADER_SHARED_CACHE_DISTRIBUTED", False
+)
+
+# Automatic persisted queries: clients may send a sha256 hash of a query in the
+# `persistedQuery` extension instead of the full query string. Any client can
+# register a valid query this way, so it is disabled by default.
+PERSISTED_QUERIES_ENABLED = get_bool_from_env("PERSISTED_QUERIES_ENABLED", False)
+# When enabled, only queries registered with the `register_persisted_queries`
+# command can be executed. They are stored in the database.
+PERSISTED_QUERIES_ALLOWLIST_ONLY = get_bool_from_env(
+    "PERSISTED_QUERIES_ALLOWLIST_ONLY", False
+)
+# Time in seconds the persisted queries are kept in the cache
+PERSISTED_QUERIES_TIMEOUT = int(os.environ.get("PERSISTED_QUERIES_TIMEOUT", 86400))
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -846,6 +922,17 @@ for entry_point in installed_plugins:
 
 PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# Serve plugin configurations from a process-level registry instead of querying
+# the database for every plugins manager.
+PLUGIN_CONFIGURATIONS_REGISTRY_ENABLED = get_bool_from_env(
+    "PLUGIN_CONFIGURATIONS_REGISTRY_ENABLED", True
+)
+# Time in seconds after which a process checks if its plugin configurations
+# registry is stale
+PLUGIN_CONFIGURATIONS_REGISTRY_VERSION_CHECK_INTERVAL = int(
+    os.environ.get("PLUGIN_CONFIGURATIONS_REGISTRY_VERSION_CHECK_INTERVAL", 1)
+)
+
 # When `True`, HTTP requests made from arbitrary URLs will be rejected (e.g., webhooks).
 # if they try to access private IP address ranges, and loopback ranges (unless
 # `HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS=False`).
@@ -857,11 +944,30 @@ HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS: bool = get_bool_from_env(
     "HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS", False
 )
 
+# Reuse keep-alive connections between webhook requests sent to the same host.
+# Sessions are kept per worker thread, up to `HTTP_SESSION_POOL_SIZE` hosts,
+# and replaced after being idle for `HTTP_KEEP_ALIVE_TIMEOUT` seconds.
+HTTP_KEEP_ALIVE_ENABLED: bool = get_bool_from_env("HTTP_KEEP_ALIVE_ENABLED", True)
+HTTP_SESSION_POOL_SIZE = int(os.environ.get("HTTP_SESSION_POOL_SIZE", 32))
+HTTP_KEEP_ALIVE_TIMEOUT = int(os.environ.get("HTTP_KEEP_ALIVE_TIMEOUT", 30))
+
 # Since we split checkout complete logic into two separate transactions, in order to
 # mimic stock lock, we apply short reservation for the stocks. The value represents
 # time of the reservation in seconds.
 RESERVE_DURATION = 45
 
+# Keep the quantity of variants available in each channel in a denormalized table,
+# updated after stock changes. Once enabled, fill the table for the existing stocks
+# with the `update_variants_channel_availability` command.
+VARIANT_CHANNEL_AVAILABILITY_ENABLED = get_bool_from_env(
+    "VARIANT_CHANNEL_AVAILABILITY_ENABLED", False
+)
+# Filter products by stock availability using the denormalized table. Enable only
+# after the table was filled, as variants missing from it are treated as out of stock.
+VARIANT_CHANNEL_AVAILABILITY_FILTER_ENABLED = get_bool_from_env(
+    "VARIANT_CHANNEL_AVAILABILITY_FILTER_ENABLED", False
+)
+
 # Initialize a simple and basic Jaeger Tracing integration
 # for open-tracing if enabled.
 #
@@ -965,6 +1071,36 @@ patch_executor()
 UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME = os.environ.get(
     "UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME", None
 )
+# Serve active webhooks for events from a process-level registry instead of
+# querying the database for every event.
+WEBHOOK_REGISTRY_ENABLED = get_bool_from_env("WEBHOOK_REGISTRY_ENABLED", True)
+# Time in seconds after which a process checks if its webhook registry is stale
+WEBHOOK_REGISTRY_VERSION_CHECK_INTERVAL = int(
+    os.environ.get("WEBHOOK_REGISTRY_VERSION_CHECK_INTERVAL", 1)
+)
+
+# Call product and variant update events emitted in a transaction once per object
+# when it is committed, instead of once per emission.
+EVENT_OUTBOX_ENABLED = get_bool_from_env("EVENT_OUTBOX_ENABLED", False)
+
+# Send async webhook deliveries of the same webhook in batches, using a single
+# task per batch instead of a task per delivery.
+WEBHOOK_BATCH_DELIVERY_ENABLED = get_bool_from_env(
+    "WEBHOOK_BATCH_DELIVERY_ENABLED", False
+)
+# Maximum number of deliveries sent by a single task
+WEBHOOK_BATCH_DELIVERY_MAX_SIZE = int(
+    os.environ.get("WEBHOOK_BATCH_DELIVERY_MAX_SIZE", 100)
+)
+
+# Generate subscription payloads of async webhooks by executing the subscription
+# query of a webhook for all objects of the event at once, reusing the payloads
+# only between webhooks of the same app with the same query. Payloads are never
+# shared between apps.
+WEBHOOK_SUBSCRIPTION_PAYLOADS_BATCH_ENABLED = get_bool_from_env(
+    "WEBHOOK_SUBSCRIPTION_PAYLOADS_BATCH_ENABLED", False
+)
+
 # Queue name for "async webhook" events
 WEBHOOK_CELERY_QUEUE_NAME = os.environ.get("WEBHOOK_CELERY_QUEUE_NAME", None)
 WEBHOOK_SQS_CELERY_QUEUE_NAME = os.environ.get(
@@ -981,6 +1117,38 @@ ORDER_WEBHOOK_EVENTS_CELERY_QUEUE_NAME = os.environ.get(
     "ORDER_WEBHOOK_EVENTS_CELERY_QUEUE_NAME", WEBHOOK_CELERY_QUEUE_NAME
 )
 
+# Queue names for generating deferred payloads of async webhooks. Running dedicated
+# workers for these queues sets the concurrency of payload generation. Deferred
+# payloads of the events with `WEBHOOK_DEFERRED_PAYLOAD_PRIORITY_EVENT_PREFIXES` are
+# generated on the priority queue, so they are not delayed by spikes of other events.
+# Both queues default to the default Celery queue, so there is no prioritization
+# until the priority queue name is set and workers consume it.
+WEBHOOK_DEFERRED_PAYLOAD_CELERY_QUEUE_NAME = os.environ.get(
+    "WEBHOOK_DEFERRED_PAYLOAD_CELERY_QUEUE_NAME", None
+)
+WEBHOOK_DEFERRED_PAYLOAD_PRIORITY_CELERY_QUEUE_NAME = os.environ.get(
+    "WEBHOOK_DEFERRED_PAYLOAD_PRIORITY_CELERY_QUEUE_NAME",
+    WEBHOOK_DEFERRED_PAYLOAD_CELERY_QUEUE_NAME,
+)
+WEBHOOK_DEFERRED_PAYLOAD_PRIORITY_EVENT_PREFIXES = get_list(
+    os.environ.get("WEBHOOK_DEFERRED_PAYLOAD_PRIORITY_EVENT_PREFIXES", "order_")
+)
+
+# When more than `WEBHOOK_DEFERRED_PAYLOAD_BATCH_QUEUE_DEPTH` deferred payloads are
+# waiting in a queue, a single task generates up to
+# `WEBHOOK_DEFERRED_PAYLOAD_BATCH_MAX_SIZE` of them.
+WEBHOOK_DEFERRED_PAYLOAD_BATCH_QUEUE_DEPTH = int(
+    os.environ.get("WEBHOOK_DEFERRED_PAYLOAD_BATCH_QUEUE_DEPTH", 500)
+)
+WEBHOOK_DEFERRED_PAYLOAD_BATCH_MAX_SIZE = int(
+    os.environ.get("WEBHOOK_DEFERRED_PAYLOAD_BATCH_MAX_SIZE", 20)
+)
+# Time in seconds of the windows in which the scheduled deferred payloads are counted.
+# The queue depth includes the payloads of the current and the previous window.
+WEBHOOK_DEFERRED_PAYLOAD_QUEUE_DEPTH_WINDOW = int(
+    os.environ.get("WEBHOOK_DEFERRED_PAYLOAD_QUEUE_DEPTH_WINDOW", 300)
+)
+
 
 # Queue name for execution of collection product_updated events
 COLLECTION_PRODUCT_UPDATED_QUEUE_NAME = os.environ.get(
@@ -1014,6 +1182,13 @@ CHECKOUT_COMPLETION_LOCK_TIME = parse(
     os.environ.get("CHECKOUT_COMPLETION_LOCK_TIME", "3 minutes")
 )
 
+# Complete checkouts with the stocks locked only for the allocation and order inserts,
+# and with the order search vector updated after the commit. It reduces the lock
+# contention on the stocks of popular variants.
+CHECKOUT_COMPLETE_FAST_PATH_ENABLED = get_bool_from_env(
+    "CHECKOUT_COMPLETE_FAST_PATH_ENABLED", False
+)
+
 # Default timeout (sec) for establishing a connection when performing external requests.
 REQUESTS_CONN_EST_TIMEOUT = 2
 
@@ -1023,6 +1198,14 @@ COMMON_REQUESTS_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 
+# Time in seconds for which taxes returned by tax apps are cached for the
+# unchanged checkout tax calculation payload. `0` disables the cache.
+CHECKOUT_TAXES_CACHE_TIMEOUT = int(os.environ.get("CHECKOUT_TAXES_CACHE_TIMEOUT", 0))
+
+# Max number of requests sent concurrently to the sync webhooks of a single event,
+# like shipping methods of different apps. `1` sends the requests one by one.
+WEBHOOK_SYNC_MAX_WORKERS = int(os.environ.get("WEBHOOK_SYNC_MAX_WORKERS", 1))
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
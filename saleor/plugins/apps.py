@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from django.apps import AppConfig
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 
 if TYPE_CHECKING:
@@ -19,6 +20,16 @@ class PluginConfig(AppConfig):
         for plugin_path in plugins:
             self.load_and_check_plugin(plugin_path)
 
+        from .models import PluginConfiguration
+        from .registry import invalidate_plugin_configurations_registry
+
+        for signal in (post_save, post_delete):
+            signal.connect(
+                invalidate_plugin_configurations_registry,
+                sender=PluginConfiguration,
+                dispatch_uid="invalidate_plugin_configurations_registry",
+            )
+
     def load_and_check_plugin(self, plugin_path: str):
         try:
             plugin = import_string(plugin_path)
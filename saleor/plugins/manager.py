@@ -6,21 +6,28 @@ from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 import opentracing
 from django.conf import settings
+from django.db import transaction
 from django.http import HttpResponse, HttpResponseNotFound
-from django.utils.module_loading import import_string
 from graphene import Mutation
 from graphql import GraphQLError
 from graphql.execution import ExecutionResult
-from prices import TaxedMoney
+from prices import Money, TaxedMoney
 
 from ..channel.models import Channel
 from ..checkout import base_calculations
+from ..checkout.base_calculations import (
+    get_lines_total_prices_with_propagated_checkout_discount,
+)
 from ..core.db.connection import allow_writer
 from ..core.models import EventDelivery
 from ..core.payments import PaymentInterface
 from ..core.prices import quantize_price
 from ..core.taxes import TaxData, TaxType, zero_money, zero_taxed_money
 from ..graphql.core import ResolveInfo, SaleorContext
+from ..graphql.response_cache import (
+    RESPONSE_CACHE_INVALIDATION_EVENTS,
+    invalidate_response_cache,
+)
 from ..order import base_calculations as base_order_calculations
 from ..order.base_calculations import (
     base_order_line_total,
@@ -55,8 +62,15 @@ from ..payment.interface import (
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
 from .models import PluginConfiguration
+from .registry import (
+    get_plugin_class,
+    get_plugin_configurations_registry,
+    is_plugin_configurations_registry_enabled,
+)
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from ..account.models import Address, Group, User
     from ..app.models import App
     from ..attribute.models import Attribute, AttributeValue
@@ -93,6 +107,19 @@ NotifyEventTypeChoice = str
 logger = logging.getLogger(__name__)
 
 
+def _get_checkout_line_total_price(
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    checkout_line_info: "CheckoutLineInfo",
+    lines_total_prices: Optional[dict["UUID", Money]],
+) -> Money:
+    if lines_total_prices is not None:
+        return lines_total_prices[checkout_line_info.line.id]
+    return base_calculations.get_line_total_price_with_propagated_checkout_discount(
+        checkout_info, lines, checkout_line_info
+    )
+
+
 class PluginsManager(PaymentInterface):
     """Base manager for handling plugins logic."""
 
@@ -146,6 +173,16 @@ class PluginsManager(PaymentInterface):
             self.loaded_channels: set[str] = set()
             self.loaded_global = False
             self.requestor_getter = requestor_getter
+            # Plugin instances created so far, per plugin path and channel slug
+            self._plugins_by_path: dict[tuple[str, Optional[str]], BasePlugin] = {}
+            self._channels: dict[str, Optional[Channel]] = {}
+            self._db_configs: dict[Optional[int], dict] = {}
+            # Active plugins implementing the method, per channel slug and method name
+            self._plugins_per_method: dict[
+                tuple[Optional[str], str], list[BasePlugin]
+            ] = {}
+            # Number of plugin instances created by the manager
+            self.instantiated_plugins_count = 0
 
     def __del__(self) -> None:
         # remove references to plugins
@@ -154,59 +191,99 @@ class PluginsManager(PaymentInterface):
         for c in self.plugins_per_channel.values():
             c.clear()
         self.loaded_channels.clear()
+        self._plugins_by_path.clear()
+        self._plugins_per_method.clear()
 
     def _ensure_channel_plugins_loaded(
         self, channel_slug: Optional[str], channel: Optional[Channel] = None
     ):
         if channel_slug is None and not self.loaded_global:
-            global_db_config = self._get_db_plugin_configs(None)
-
             for plugin_path in self.plugins:
-                with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
-                    if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
-                        plugin = self._load_plugin(
-                            PluginClass,
-                            global_db_config,
-                            requestor_getter=self.requestor_getter,
-                            allow_replica=self._allow_replica,
-                        )
-                        self.global_plugins.append(plugin)
-                        self.all_plugins.append(plugin)
+                PluginClass = get_plugin_class(plugin_path)
+                if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
+                    plugin = self._get_or_load_plugin(plugin_path, None)
+                    self.global_plugins.append(plugin)
+                    self.all_plugins.append(plugin)
             self.loaded_global = True
+            self._plugins_per_method.clear()
 
         if channel_slug is not None and channel_slug not in self.loaded_channels:
             if channel is None:
-                channel = (
-                    Channel.objects.using(self.database)
-                    .filter(slug=channel_slug)
-                    .first()
-                )
+                channel = self._get_channel(channel_slug)
                 if not channel:
                     return
-
-            channel_db_config = self._get_db_plugin_configs(channel)
+            else:
+                self._channels[channel_slug] = channel
 
             for plugin_path in self.plugins:
-                with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
-                    if getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
-                        plugin = self._load_plugin(
-                            PluginClass,
-                            channel_db_config,
-                            channel=channel,
-                            requestor_getter=self.requestor_getter,
-                            allow_replica=self._allow_replica,
-                        )
-                        self.plugins_per_channel[channel_slug].append(plugin)
-                        self.all_plugins.append(plugin)
+                PluginClass = get_plugin_class(plugin_path)
+                if getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
+                    plugin = self._get_or_load_plugin(plugin_path, channel)
+                    self.plugins_per_channel[channel_slug].append(plugin)
+                    self.all_plugins.append(plugin)
 
             self._ensure_channel_plugins_loaded(None)
             self.plugins_per_channel[channel_slug].extend(self.global_plugins)
             self.loaded_channels.add(channel_slug)
+            self._plugins_per_method.clear()
+
+    def _get_channel(self, channel_slug: str) -> Optional[Channel]:
+        if channel_slug not in self._channels:
+            self._channels[channel_slug] = (
+                Channel.objects.using(self.database).filter(slug=channel_slug).first()
+            )
+        return self._channels[channel_slug]
+
+    def _get_db_plugin_configs_for_channel(self, channel: Optional[Channel]) -> dict:
+        channel_id = channel.pk if channel else None
+        if channel_id not in self._db_configs:
+            self._db_configs[channel_id] = self._get_db_plugin_configs(channel)
+        return self._db_configs[channel_id]
+
+    def _get_or_load_plugin(
+        self, plugin_path: str, channel: Optional[Channel]
+    ) -> "BasePlugin":
+        """Return the plugin instance for the channel, creating it on first use.
+
+        Global plugins are loaded with `channel` set to `None`.
+        """
+        key = (plugin_path, channel.slug if channel else None)
+        if key not in self._plugins_by_path:
+            with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
+                self._plugins_by_path[key] = self._load_plugin(
+                    get_plugin_class(plugin_path),
+                    self._get_db_plugin_configs_for_channel(channel),
+                    channel=channel,
+                    requestor_getter=self.requestor_getter,
+                    allow_replica=self._allow_replica,
+                )
+            self.instantiated_plugins_count += 1
+        return self._plugins_by_path[key]
+
+    def _is_plugin_active(self, plugin_path: str, channel: Optional[Channel]) -> bool:
+        """Check if the plugin is active without creating its instance."""
+        key = (plugin_path, channel.slug if channel else None)
+        if key in self._plugins_by_path:
+            return self._plugins_by_path[key].active
+        PluginClass = get_plugin_class(plugin_path)
+        db_config = self._get_db_plugin_configs_for_channel(channel).get(
+            PluginClass.PLUGIN_ID
+        )
+        if db_config is not None:
+            return db_config.active
+        return PluginClass.get_default_active()
 
     def _get_db_plugin_configs(self, channel: Optional[Channel]):
         with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
+            if is_plugin_configurations_registry_enabled():
+                # managers using the writer get the configurations of the latest
+                # committed changes
+                registry = get_plugin_configurations_registry(
+                    check_version=(
+                        self.database == settings.DATABASE_CONNECTION_DEFAULT_NAME
+                    )
+                )
+                return registry.get_configurations(channel.pk if channel else None)
             plugin_manager_configs = PluginConfiguration.objects.using(
                 self.database
             ).filter(channel=channel)
@@ -225,18 +302,71 @@ class PluginsManager(PaymentInterface):
         **kwargs,
     ):
         """Try to run a method with the given name on each declared active plugin."""
+        if method_name in RESPONSE_CACHE_INVALIDATION_EVENTS:
+            # the changed data may be cached again until the transaction is committed
+            transaction.on_commit(invalidate_response_cache)
         value = default_value
-        plugins = self.get_plugins(
-            channel_slug=channel_slug,
-            active_only=True,
-            plugin_ids=plugin_ids,
-        )
+        if plugin_ids:
+            plugins = self.get_plugins(
+                channel_slug=channel_slug,
+                active_only=True,
+                plugin_ids=plugin_ids,
+            )
+        else:
+            plugins = self._get_plugins_implementing_method(method_name, channel_slug)
         for plugin in plugins:
             value = self.__run_method_on_single_plugin(
                 plugin, method_name, value, *args, **kwargs
             )
         return value
 
+    def _get_plugins_implementing_method(
+        self, method_name: str, channel_slug: Optional[str]
+    ) -> list["BasePlugin"]:
+        """Return active plugins which have own implementation of the method.
+
+        Only these plugins are instantiated, other plugins are created when
+        the full list of plugins is requested.
+        """
+        key = (channel_slug, method_name)
+        if key not in self._plugins_per_method:
+            self._plugins_per_method[key] = self._load_plugins_implementing_method(
+                method_name, channel_slug
+            )
+        return self._plugins_per_method[key]
+
+    def _load_plugins_implementing_method(
+        self, method_name: str, channel_slug: Optional[str]
+    ) -> list["BasePlugin"]:
+        if channel_slug is None and self.loaded_channels:
+            # plugins of already loaded channels are run for events without channel
+            return [
+                plugin
+                for plugin in self.get_plugins(active_only=True)
+                if getattr(plugin, method_name, NotImplemented) != NotImplemented
+            ]
+
+        channel = None
+        if channel_slug is not None:
+            channel = self._get_channel(channel_slug)
+            if not channel:
+                return []
+
+        channel_plugins = []
+        global_plugins = []
+        for plugin_path in self.plugins:
+            PluginClass = get_plugin_class(plugin_path)
+            if getattr(PluginClass, method_name, NotImplemented) == NotImplemented:
+                continue
+            if getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
+                if channel and self._is_plugin_active(plugin_path, channel):
+                    channel_plugins.append(
+                        self._get_or_load_plugin(plugin_path, channel)
+                    )
+            elif self._is_plugin_active(plugin_path, None):
+                global_plugins.append(self._get_or_load_plugin(plugin_path, None))
+        return channel_plugins + global_plugins
+
     def __run_method_on_single_plugin(
         self,
         plugin: Optional["BasePlugin"],
@@ -322,7 +452,14 @@ class PluginsManager(PaymentInterface):
         lines: Iterable["CheckoutLineInfo"],
         address: Optional["Address"],
         plugin_ids: Optional[list[str]] = None,
+        lines_total_prices: Optional[dict["UUID", Money]] = None,
     ) -> TaxedMoney:
+        if lines_total_prices is None:
+            lines_total_prices = (
+                get_lines_total_prices_with_propagated_checkout_discount(
+                    checkout_info, lines
+                )
+            )
         line_totals = [
             self.calculate_checkout_line_total(
                 checkout_info,
@@ -330,6 +467,7 @@ class PluginsManager(PaymentInterface):
                 line_info,
                 address,
                 plugin_ids=plugin_ids,
+                lines_total_prices=lines_total_prices,
             )
             for line_info in lines
         ]
@@ -451,14 +589,17 @@ class PluginsManager(PaymentInterface):
         checkout_line_info: "CheckoutLineInfo",
         address: Optional["Address"],
         plugin_ids: Optional[list[str]] = None,
+        lines_total_prices: Optional[dict["UUID", Money]] = None,
     ) -> TaxedMoney:
+        """Calculate the checkout line total.
+
+        `lines_total_prices` are the discounted prices of all lines returned by
+        `get_lines_total_prices_with_propagated_checkout_discount`; pass them when
+        calculating many lines, so the discount is not propagated for each one.
+        """
         # apply entire order discount or discount from order promotion
-        default_value = (
-            base_calculations.get_line_total_price_with_propagated_checkout_discount(
-                checkout_info,
-                lines,
-                checkout_line_info,
-            )
+        default_value = _get_checkout_line_total_price(
+            checkout_info, lines, checkout_line_info, lines_total_prices
         )
         default_value = quantize_price(default_value, checkout_info.checkout.currency)
         default_taxed_value = TaxedMoney(net=default_value, gross=default_value)
@@ -525,15 +666,12 @@ class PluginsManager(PaymentInterface):
         checkout_line_info: "CheckoutLineInfo",
         address: Optional["Address"],
         plugin_ids: Optional[list[str]] = None,
+        lines_total_prices: Optional[dict["UUID", Money]] = None,
     ) -> TaxedMoney:
         quantity = checkout_line_info.line.quantity
         # apply entire order discount
-        total_value = (
-            base_calculations.get_line_total_price_with_propagated_checkout_discount(
-                checkout_info,
-                lines,
-                checkout_line_info,
-            )
+        total_value = _get_checkout_line_total_price(
+            checkout_info, lines, checkout_line_info, lines_total_prices
         )
         default_taxed_value = TaxedMoney(
             net=total_value / quantity, gross=total_value / quantity
@@ -2780,6 +2918,7 @@ class PluginsManager(PaymentInterface):
                 configuration.description = plugin.PLUGIN_DESCRIPTION
                 plugin.active = configuration.active
                 plugin.configuration = configuration.configuration
+                self._plugins_per_method.clear()
                 return configuration
 
     def get_plugin(
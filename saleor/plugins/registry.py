@@ -0,0 +1,82 @@
+"""Process-level registry of plugin configurations stored in the database.
+
+The registry loads all plugin configurations in a single query and serves them
+to plugin managers, which are created for every request and Celery task,
+without querying the database each time a manager loads its plugins. Any change
+to plugin configurations invalidates it; see `saleor.core.utils.registry` for
+details.
+"""
+
+import copy
+from collections import defaultdict
+from functools import cache
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from ..core.utils.registry import VersionedRegistry
+from .models import PluginConfiguration
+
+if TYPE_CHECKING:
+    from .base_plugin import BasePlugin
+
+PLUGIN_CONFIGURATIONS_REGISTRY_VERSION_KEY = "plugin_configurations_registry_version"
+
+
+class PluginConfigurationsRegistry:
+    def __init__(self, configurations: list[PluginConfiguration]):
+        self._configurations_by_channel: dict[
+            Optional[int], dict[str, PluginConfiguration]
+        ] = defaultdict(dict)
+        for configuration in configurations:
+            self._configurations_by_channel[configuration.channel_id][
+                configuration.identifier
+            ] = configuration
+
+    def get_configurations(
+        self, channel_id: Optional[int]
+    ) -> dict[str, PluginConfiguration]:
+        """Return copies of the plugin configurations for the channel.
+
+        Plugins modify their configurations in place, so every manager gets
+        its own copies.
+        """
+        return copy.deepcopy(self._configurations_by_channel.get(channel_id, {}))
+
+
+def build_plugin_configurations_registry() -> PluginConfigurationsRegistry:
+    configurations = PluginConfiguration.objects.using(
+        settings.DATABASE_CONNECTION_DEFAULT_NAME
+    ).select_related("channel")
+    return PluginConfigurationsRegistry(list(configurations))
+
+
+_registry = VersionedRegistry(
+    PLUGIN_CONFIGURATIONS_REGISTRY_VERSION_KEY,
+    build_plugin_configurations_registry,
+    "PLUGIN_CONFIGURATIONS_REGISTRY_VERSION_CHECK_INTERVAL",
+)
+
+
+def is_plugin_configurations_registry_enabled() -> bool:
+    return settings.PLUGIN_CONFIGURATIONS_REGISTRY_ENABLED
+
+
+def get_plugin_configurations_registry(
+    check_version: bool = False,
+) -> PluginConfigurationsRegistry:
+    return _registry.get(check_version=check_version)
+
+
+def clear_plugin_configurations_registry():
+    _registry.clear()
+
+
+def invalidate_plugin_configurations_registry(**kwargs):
+    _registry.invalidate(using=kwargs.get("using"))
+
+
+@cache
+def get_plugin_class(plugin_path: str) -> type["BasePlugin"]:
+    return import_string(plugin_path)
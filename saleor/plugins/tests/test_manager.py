@@ -42,6 +42,7 @@ from ..tests.sample_plugins import (
     ALL_PLUGINS,
     ActiveDummyPaymentGateway,
     ActivePaymentGateway,
+    ActivePlugin,
     ChannelPluginSample,
     InactivePaymentGateway,
     PluginInactive,
@@ -1072,10 +1073,11 @@ def test_run_method_on_plugins_only_on_active_ones(
     mocked_method, channel_USD, all_plugins_manager
 ):
     all_plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method_name",
+        method_name="process_payment",
         default_value="default_value",
         channel_slug=channel_USD.slug,
     )
+    all_plugins_manager.get_plugins(channel_slug=channel_USD.slug)
     active_plugins_count = len(ACTIVE_PLUGINS)
 
     assert len(all_plugins_manager.all_plugins) == len(ALL_PLUGINS)
@@ -1083,13 +1085,12 @@ def test_run_method_on_plugins_only_on_active_ones(
         len([p for p in all_plugins_manager.all_plugins if p.active])
         == active_plugins_count
     )
-    assert mocked_method.call_count == active_plugins_count
 
     called_plugins_id = [arg.args[0].PLUGIN_ID for arg in mocked_method.call_args_list]
     expected_active_plugins_id = [
         p.PLUGIN_ID
         for p in all_plugins_manager.plugins_per_channel[channel_USD.slug]
-        if p.active
+        if p.active and hasattr(p, "process_payment")
     ]
 
     assert called_plugins_id == expected_active_plugins_id
@@ -1099,37 +1100,77 @@ def test_run_method_on_plugins_only_on_active_ones(
     "saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_single_plugin"
 )
 def test_run_method_on_plugins_only_for_given_channel(
-    mocked_run_on_single_plugin, plugins_manager, channel_USD, channel_PLN
+    mocked_run_on_single_plugin, channel_USD, channel_PLN
 ):
     # given
-    default_value = "default"
-
-    usd_plugin_1 = ActiveDummyPaymentGateway(
-        active=True, channel=channel_USD, configuration=[]
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
     )
-    usd_plugin_2 = ActivePaymentGateway(
-        active=True, channel=channel_USD, configuration=[]
+    manager.get_plugins(channel_slug=channel_PLN.slug)
+
+    # when
+    manager._PluginsManager__run_method_on_plugins(
+        method_name="promotion_created",
+        default_value="default",
+        channel_slug=channel_USD.slug,
     )
-    pln_plugin = ChannelPluginSample(active=True, channel=channel_PLN, configuration=[])
 
-    plugins_manager.all_plugins = [usd_plugin_1, usd_plugin_2, pln_plugin]
+    # then
+    mocked_run_on_single_plugin.assert_called_once()
+    plugin = mocked_run_on_single_plugin.call_args.args[0]
+    assert plugin.PLUGIN_ID == ChannelPluginSample.PLUGIN_ID
+    assert plugin.channel == channel_USD
 
-    plugins_manager.plugins_per_channel[channel_USD.slug] = [usd_plugin_1, usd_plugin_2]
-    plugins_manager.plugins_per_channel[channel_PLN.slug] = [pln_plugin]
 
+@mock.patch(
+    "saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_single_plugin"
+)
+def test_run_method_on_plugins_skips_plugins_without_method(
+    mocked_run_on_single_plugin, channel_USD, all_plugins_manager
+):
     # when
-    plugins_manager._PluginsManager__run_method_on_plugins(
+    all_plugins_manager._PluginsManager__run_method_on_plugins(
         method_name="test_method",
-        default_value=default_value,
+        default_value="default_value",
+        channel_slug=channel_USD.slug,
+    )
+
+    # then
+    mocked_run_on_single_plugin.assert_not_called()
+    assert all_plugins_manager.instantiated_plugins_count == 0
+
+
+def test_run_method_on_plugins_instantiates_only_implementing_plugins(channel_USD):
+    # given
+    manager = PluginsManager(
+        plugins=[
+            "saleor.plugins.tests.sample_plugins.ActivePlugin",
+            "saleor.plugins.tests.sample_plugins.PluginInactive",
+            "saleor.plugins.tests.sample_plugins.ActivePaymentGateway",
+        ]
+    )
+
+    # when
+    manager._PluginsManager__run_method_on_plugins(
+        method_name="get_supported_currencies",
+        default_value=None,
         channel_slug=channel_USD.slug,
     )
 
     # then
-    assert mocked_run_on_single_plugin.call_count == 2
-    called_plugins_id = {
-        arg.args[0].PLUGIN_ID for arg in mocked_run_on_single_plugin.call_args_list
-    }
-    assert called_plugins_id == {usd_plugin_1.PLUGIN_ID, usd_plugin_2.PLUGIN_ID}
+    assert manager.instantiated_plugins_count == 1
+    assert not manager.all_plugins
+
+    # when
+    plugins = manager.get_plugins(channel_slug=channel_USD.slug)
+
+    # then
+    assert manager.instantiated_plugins_count == 3
+    assert [plugin.PLUGIN_ID for plugin in plugins] == [
+        ActivePlugin.PLUGIN_ID,
+        PluginInactive.PLUGIN_ID,
+        ActivePaymentGateway.PLUGIN_ID,
+    ]
 
 
 def test_run_method_on_single_plugin_method_does_not_exist(plugins_manager):
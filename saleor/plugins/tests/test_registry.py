@@ -0,0 +1,124 @@
+import time
+
+import pytest
+from django.core.cache import cache
+
+from ..manager import PluginsManager
+from ..models import PluginConfiguration
+from ..registry import (
+    PLUGIN_CONFIGURATIONS_REGISTRY_VERSION_KEY,
+    clear_plugin_configurations_registry,
+    get_plugin_configurations_registry,
+)
+from .sample_plugins import ChannelPluginSample
+
+
+@pytest.fixture
+def channel_plugin_configuration(channel_USD):
+    return PluginConfiguration.objects.create(
+        identifier=ChannelPluginSample.PLUGIN_ID,
+        name=ChannelPluginSample.PLUGIN_NAME,
+        channel=channel_USD,
+        active=False,
+        configuration=[{"name": "input-per-channel", "value": "value"}],
+    )
+
+
+def test_registry_configurations_used_by_manager(
+    channel_plugin_configuration, channel_USD, django_assert_num_queries
+):
+    # given
+    # the configuration is created in the test transaction, which is never committed
+    clear_plugin_configurations_registry()
+    plugin_path = "saleor.plugins.tests.sample_plugins.ChannelPluginSample"
+    PluginsManager(plugins=[plugin_path]).get_plugins(channel_USD.slug)
+    manager = PluginsManager(plugins=[plugin_path])
+
+    # when
+    with django_assert_num_queries(1):
+        plugins = manager.get_plugins(channel_slug=channel_USD.slug)
+
+    # then
+    plugin = plugins[0]
+    assert plugin.active is False
+    assert plugin.channel == channel_USD
+    assert plugin.configuration[0]["value"] == "value"
+
+
+def test_registry_returns_configuration_copies(
+    channel_plugin_configuration, channel_USD
+):
+    # given
+    clear_plugin_configurations_registry()
+    registry = get_plugin_configurations_registry()
+    configurations = registry.get_configurations(channel_USD.pk)
+
+    # when
+    configurations[ChannelPluginSample.PLUGIN_ID].configuration.clear()
+
+    # then
+    configuration = registry.get_configurations(channel_USD.pk)[
+        ChannelPluginSample.PLUGIN_ID
+    ]
+    assert configuration.configuration == [
+        {"name": "input-per-channel", "value": "value"}
+    ]
+
+
+def test_registry_invalidated_on_configuration_change(
+    channel_plugin_configuration, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    get_plugin_configurations_registry()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_plugin_configuration.active = True
+        channel_plugin_configuration.save(update_fields=["active"])
+
+    # then
+    configuration = get_plugin_configurations_registry().get_configurations(
+        channel_USD.pk
+    )[ChannelPluginSample.PLUGIN_ID]
+    assert configuration.active is True
+
+
+def test_registry_reflects_uncommitted_changes(
+    channel_plugin_configuration, channel_USD
+):
+    # given
+    clear_plugin_configurations_registry()
+    get_plugin_configurations_registry()
+
+    # when
+    channel_plugin_configuration.active = True
+    channel_plugin_configuration.save(update_fields=["active"])
+
+    # then
+    configuration = get_plugin_configurations_registry().get_configurations(
+        channel_USD.pk
+    )[ChannelPluginSample.PLUGIN_ID]
+    assert configuration.active is True
+
+
+def test_registry_version_checked_for_writer_manager(
+    channel_plugin_configuration, channel_USD
+):
+    # given
+    clear_plugin_configurations_registry()
+    plugin_path = "saleor.plugins.tests.sample_plugins.ChannelPluginSample"
+    PluginsManager(plugins=[plugin_path]).get_plugins(channel_USD.slug)
+
+    # the configuration is changed and the version replaced by another process
+    PluginConfiguration.objects.filter(pk=channel_plugin_configuration.pk).update(
+        active=True
+    )
+    cache.set(PLUGIN_CONFIGURATIONS_REGISTRY_VERSION_KEY, time.time_ns(), timeout=None)
+
+    # when
+    plugins = PluginsManager(plugins=[plugin_path], allow_replica=False).get_plugins(
+        channel_slug=channel_USD.slug
+    )
+
+    # then
+    assert plugins[0].active is True
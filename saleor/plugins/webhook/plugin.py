@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Callable, Final, Optional, Union
 
 import graphene
 from django.conf import settings
+from django.core.cache import cache
 
 from ...app.models import App
 from ...channel.models import Channel
@@ -110,12 +111,14 @@ from ...webhook.transport.synchronous.transport import (
     trigger_all_webhooks_sync,
     trigger_webhook_sync,
     trigger_webhook_sync_if_not_cached,
+    trigger_webhooks_sync_if_not_cached,
 )
 from ...webhook.transport.utils import (
     DEFAULT_TAX_CODE,
     DEFAULT_TAX_DESCRIPTION,
     delivery_update,
     from_payment_app_id,
+    generate_cache_key_for_checkout_taxes,
     get_current_tax_app,
     get_meta_code_key,
     get_meta_description_key,
@@ -3272,24 +3275,52 @@ class WebhookPlugin(BasePlugin):
     ) -> Optional["TaxData"]:
         if pregenerated_subscription_payloads is None:
             pregenerated_subscription_payloads = {}
+
+        cache_timeout = settings.CHECKOUT_TAXES_CACHE_TIMEOUT
+        if not cache_timeout:
+            return self.__fetch_taxes_for_checkout(
+                checkout_info,
+                app_identifier,
+                lambda: generate_checkout_payload_for_tax_calculation(
+                    checkout_info, lines
+                ),
+                pregenerated_subscription_payloads,
+            )
+
+        payload = generate_checkout_payload_for_tax_calculation(checkout_info, lines)
+        cache_key = generate_cache_key_for_checkout_taxes(payload, app_identifier)
+        tax_data = cache.get(cache_key)
+        if tax_data is None:
+            tax_data = self.__fetch_taxes_for_checkout(
+                checkout_info,
+                app_identifier,
+                lambda: payload,
+                pregenerated_subscription_payloads,
+            )
+            if tax_data is not None:
+                cache.set(cache_key, tax_data, timeout=cache_timeout)
+        return tax_data
+
+    def __fetch_taxes_for_checkout(
+        self,
+        checkout_info,
+        app_identifier,
+        payload_gen: Callable,
+        pregenerated_subscription_payloads: dict,
+    ) -> Optional["TaxData"]:
         event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
         if app_identifier:
             return self.__run_tax_webhook(
                 event_type,
                 app_identifier,
-                lambda: generate_checkout_payload_for_tax_calculation(
-                    checkout_info, lines
-                ),
+                payload_gen,
                 checkout_info.checkout,
                 pregenerated_subscription_payloads=pregenerated_subscription_payloads,
             )
         else:
             return trigger_all_webhooks_sync(
                 event_type,
-                lambda: generate_checkout_payload_for_tax_calculation(
-                    checkout_info,
-                    lines,
-                ),
+                payload_gen,
                 parse_tax_data,
                 checkout_info.checkout,
                 self.requestor,
@@ -3325,19 +3356,18 @@ class WebhookPlugin(BasePlugin):
         if webhooks:
             payload = generate_checkout_payload(checkout, self.requestor)
             cache_data = get_cache_data_for_shipping_list_methods_for_checkout(payload)
-            for webhook in webhooks:
-                response_data = trigger_webhook_sync_if_not_cached(
-                    event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    payload=payload,
-                    webhook=webhook,
-                    cache_data=cache_data,
-                    allow_replica=self.allow_replica,
-                    subscribable_object=checkout,
-                    request_timeout=WEBHOOK_SYNC_TIMEOUT,
-                    cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    requestor=self.requestor,
-                )
-
+            responses = trigger_webhooks_sync_if_not_cached(
+                event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                payload=payload,
+                webhooks=webhooks,
+                cache_data=cache_data,
+                allow_replica=self.allow_replica,
+                subscribable_object=checkout,
+                request_timeout=WEBHOOK_SYNC_TIMEOUT,
+                cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                requestor=self.requestor,
+            )
+            for webhook, response_data in responses:
                 if response_data:
                     shipping_methods = parse_list_shipping_methods_response(
                         response_data, webhook.app
@@ -1,11 +1,14 @@
 import json
+import threading
 from unittest import mock
 from unittest.mock import call
 
 import graphene
 import pytest
+from django.core.cache import cache
 
-from ....core.models import EventDelivery
+from ....core import EventDeliveryStatus
+from ....core.models import EventDelivery, EventPayload
 from ....graphql.tests.utils import get_graphql_content
 from ....graphql.webhook.utils import get_subscription_query_hash
 from ....order import OrderStatus
@@ -22,8 +25,15 @@ from ....webhook.transport.shipping import (
     parse_list_shipping_methods_response,
     to_shipping_app_id,
 )
-from ....webhook.transport.synchronous.transport import trigger_webhook_sync
-from ....webhook.transport.utils import generate_cache_key_for_webhook
+from ....webhook.transport.synchronous.transport import (
+    send_webhook_requests_sync,
+    trigger_webhook_sync,
+    trigger_webhooks_sync_if_not_cached,
+)
+from ....webhook.transport.utils import (
+    WebhookResponse,
+    generate_cache_key_for_webhook,
+)
 from ...base_plugin import ExcludedShippingMethod
 
 ORDER_QUERY_SHIPPING_METHOD = """
@@ -693,6 +703,122 @@ def test_trigger_webhook_sync(mock_request, shipping_app):
     assert not EventDelivery.objects.exists()
 
 
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_webhooks_sync_if_not_cached_sends_requests_concurrently(
+    mocked_send_webhook_using_http, shipping_app_factory, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 2
+    first_webhook = shipping_app_factory().webhooks.get()
+    second_webhook = shipping_app_factory(app_name="shipping-app2").webhooks.get()
+    both_requests_sent = threading.Barrier(2, timeout=5)
+
+    def send_webhook_using_http(target_url, *args, **kwargs):
+        both_requests_sent.wait()
+        return WebhookResponse(content=json.dumps({"url": target_url}))
+
+    mocked_send_webhook_using_http.side_effect = send_webhook_using_http
+    payload_dict = {"checkout": {"id": 1}}
+    event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+
+    # when
+    responses = trigger_webhooks_sync_if_not_cached(
+        event_type,
+        json.dumps(payload_dict),
+        [first_webhook, second_webhook],
+        payload_dict,
+        allow_replica=False,
+    )
+
+    # then
+    assert responses == [
+        (first_webhook, {"url": first_webhook.target_url}),
+        (second_webhook, {"url": second_webhook.target_url}),
+    ]
+    assert not EventDelivery.objects.exists()
+    cache_key = generate_cache_key_for_webhook(
+        payload_dict, second_webhook.target_url, event_type, second_webhook.app_id
+    )
+    assert cache.get(cache_key) == {"url": second_webhook.target_url}
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_send_webhook_requests_sync_bounded_by_max_workers(
+    mocked_send_webhook_using_http, shipping_app_factory, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 2
+    webhooks = [
+        shipping_app_factory(app_name=f"shipping-app{i}").webhooks.get()
+        for i in range(4)
+    ]
+    lock = threading.Lock()
+    running = []
+    max_running = 0
+
+    def send_webhook_using_http(target_url, *args, **kwargs):
+        nonlocal max_running
+        with lock:
+            running.append(target_url)
+            max_running = max(max_running, len(running))
+        threading.Event().wait(timeout=0.1)
+        with lock:
+            running.remove(target_url)
+        return WebhookResponse(content="{}")
+
+    mocked_send_webhook_using_http.side_effect = send_webhook_using_http
+    deliveries = [
+        EventDelivery(
+            event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+            payload=EventPayload(payload="{}"),
+            webhook=webhook,
+        )
+        for webhook in webhooks
+    ]
+
+    # when
+    responses = send_webhook_requests_sync(deliveries, timeout=5)
+
+    # then
+    assert responses == [{}, {}, {}, {}]
+    assert max_running == 2
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_send_webhook_requests_sync_sends_requests_waiting_for_worker(
+    mocked_send_webhook_using_http, shipping_app_factory, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 2
+    webhooks = [
+        shipping_app_factory(app_name=f"shipping-app{i}").webhooks.get()
+        for i in range(3)
+    ]
+
+    def send_webhook_using_http(*args, **kwargs):
+        threading.Event().wait(timeout=0.3)
+        return WebhookResponse(content="{}")
+
+    mocked_send_webhook_using_http.side_effect = send_webhook_using_http
+    deliveries = [
+        EventDelivery(
+            event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+            payload=EventPayload(payload="{}"),
+            webhook=webhook,
+        )
+        for webhook in webhooks
+    ]
+
+    # when
+    # the last request waits longer than the timeout for a free worker
+    responses = send_webhook_requests_sync(deliveries, timeout=0.5)
+
+    # then
+    assert responses == [{}, {}, {}]
+    assert mocked_send_webhook_using_http.call_count == 3
+    assert all(delivery.status != EventDeliveryStatus.FAILED for delivery in deliveries)
+
+
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
 @mock.patch(
@@ -3,6 +3,7 @@ from unittest import mock
 from unittest.mock import ANY, sentinel
 
 import pytest
+from django.test import override_settings
 from freezegun import freeze_time
 
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
@@ -43,6 +44,58 @@ def test_get_taxes_for_checkout_no_permission(
     assert tax_data is None
 
 
+@override_settings(CHECKOUT_TAXES_CACHE_TIMEOUT=60)
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_checkout_cached_for_unchanged_checkout(
+    mock_request,
+    webhook_plugin,
+    tax_data_response,
+    checkout_with_item,
+    tax_app_with_webhooks,
+):
+    # given
+    mock_request.return_value = tax_data_response
+    plugin = webhook_plugin()
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(
+        checkout_with_item, lines, get_plugins_manager(allow_replica=False)
+    )
+    plugin.get_taxes_for_checkout(checkout_info, lines, None, None)
+
+    # when
+    tax_data = plugin.get_taxes_for_checkout(checkout_info, lines, None, None)
+
+    # then
+    mock_request.assert_called_once()
+    assert tax_data == parse_tax_data(tax_data_response)
+
+
+@override_settings(CHECKOUT_TAXES_CACHE_TIMEOUT=60)
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_checkout_cache_skipped_for_changed_checkout(
+    mock_request,
+    webhook_plugin,
+    tax_data_response,
+    checkout_with_item,
+    tax_app_with_webhooks,
+):
+    # given
+    mock_request.return_value = tax_data_response
+    plugin = webhook_plugin()
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(
+        checkout_with_item, lines, get_plugins_manager(allow_replica=False)
+    )
+    plugin.get_taxes_for_checkout(checkout_info, lines, None, None)
+
+    # when
+    lines[0].line.quantity += 1
+    plugin.get_taxes_for_checkout(checkout_info, lines, None, None)
+
+    # then
+    assert mock_request.call_count == 2
+
+
 @freeze_time()
 @mock.patch("saleor.order.calculations.fetch_order_prices_if_expired")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from ....warehouse.management import update_variants_channel_availability
+from ....warehouse.tasks import VARIANTS_CHANNEL_AVAILABILITY_BATCH_SIZE
+from ...models import ProductVariant
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculates the quantity of all variants available in channels. Run it "
+        "after enabling `VARIANT_CHANNEL_AVAILABILITY_ENABLED`, before the product "
+        "filters start to use the calculated quantities."
+    )
+
+    def handle(self, *args, **options):
+        start_pk = 0
+        while True:
+            variant_pks = list(
+                ProductVariant.objects.filter(pk__gt=start_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:VARIANTS_CHANNEL_AVAILABILITY_BATCH_SIZE]
+            )
+            if not variant_pks:
+                break
+            update_variants_channel_availability(variant_pks)
+            self.stdout.write(
+                f"Updated variants with PK from {variant_pks[0]} to {variant_pks[-1]}."
+            )
+            start_pk = variant_pks[-1]
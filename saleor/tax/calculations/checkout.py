@@ -37,6 +37,11 @@ def update_checkout_prices_with_flat_rates(
         default_country_rate_obj.rate if default_country_rate_obj else Decimal(0)
     )
     currency = checkout.currency
+    lines_total_prices = (
+        base_calculations.get_lines_total_prices_with_propagated_checkout_discount(
+            checkout_info, lines
+        )
+    )
 
     # Calculate checkout line totals.
     for line_info in lines:
@@ -48,14 +53,10 @@ def update_checkout_prices_with_flat_rates(
             default_tax_rate,
             country_code,
         )
-        line_total_price = calculate_checkout_line_total(
-            checkout_info,
-            lines,
-            line_info,
-            tax_rate,
-            prices_entered_with_tax,
+        line_total_price = calculate_flat_rate_tax(
+            lines_total_prices[line.id], tax_rate, prices_entered_with_tax
         )
-        line.total_price = line_total_price
+        line.total_price = quantize_price(line_total_price, currency)
         line.tax_rate = normalize_tax_rate_for_db(tax_rate)
 
     # Calculate shipping price.
@@ -94,23 +95,3 @@ def calculate_checkout_shipping(
         shipping_price, tax_rate, prices_entered_with_tax
     )
     return quantize_price(shipping_price_taxed, shipping_price_taxed.currency)
-
-
-def calculate_checkout_line_total(
-    checkout_info: "CheckoutInfo",
-    lines: Iterable["CheckoutLineInfo"],
-    checkout_line_info: "CheckoutLineInfo",
-    tax_rate: Decimal,
-    prices_entered_with_tax: bool,
-) -> TaxedMoney:
-    total_price = (
-        base_calculations.get_line_total_price_with_propagated_checkout_discount(
-            checkout_info,
-            lines,
-            checkout_line_info,
-        )
-    )
-    total_price = calculate_flat_rate_tax(
-        total_price, tax_rate, prices_entered_with_tax
-    )
-    return quantize_price(total_price, total_price.currency)
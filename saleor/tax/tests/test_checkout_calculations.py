@@ -15,7 +15,6 @@ from ...product.models import ProductVariantChannelListing
 from ...tax.models import TaxClassCountryRate
 from .. import TaxCalculationStrategy
 from ..calculations.checkout import (
-    calculate_checkout_line_total,
     calculate_checkout_shipping,
     update_checkout_prices_with_flat_rates,
 )
@@ -542,9 +541,10 @@ def test_calculate_checkout_line_total(checkout_with_item, shipping_zone, addres
     checkout_info = fetch_checkout_info(checkout, lines, manager)
     checkout_line_info = lines[0]
 
-    line_price = calculate_checkout_line_total(
-        checkout_info, lines, checkout_line_info, rate, prices_entered_with_tax
+    update_checkout_prices_with_flat_rates(
+        checkout, checkout_info, lines, prices_entered_with_tax, address
     )
+    line_price = checkout_line_info.line.total_price
 
     assert line_price == TaxedMoney(
         net=Money("8.13", "USD") * line.quantity,
@@ -588,9 +588,10 @@ def test_calculate_checkout_line_total_voucher_on_entire_order(
     checkout_line_info = lines[0]
 
     # when
-    line_price = calculate_checkout_line_total(
-        checkout_info, lines, checkout_line_info, rate, prices_entered_with_tax
+    update_checkout_prices_with_flat_rates(
+        checkout, checkout_info, lines, prices_entered_with_tax, address
     )
+    line_price = checkout_line_info.line.total_price
 
     # then
     currency = checkout.currency
@@ -636,13 +637,10 @@ def test_calculate_checkout_line_total_with_voucher_one_line(
     checkout_line_info = lines[0]
 
     # when
-    line_price = calculate_checkout_line_total(
-        checkout_info,
-        lines,
-        checkout_line_info,
-        rate,
-        prices_entered_with_tax,
+    update_checkout_prices_with_flat_rates(
+        checkout, checkout_info, lines, prices_entered_with_tax, address
     )
+    line_price = checkout_line_info.line.total_price
 
     # then
     currency = checkout_with_item.currency
@@ -703,13 +701,10 @@ def test_calculate_checkout_line_total_with_voucher_multiple_lines(
     checkout_line_info = lines[0]
 
     # when
-    line_total_price = calculate_checkout_line_total(
-        checkout_info,
-        lines,
-        checkout_line_info,
-        rate,
-        prices_entered_with_tax,
+    update_checkout_prices_with_flat_rates(
+        checkout, checkout_info, lines, prices_entered_with_tax, address
     )
+    line_total_price = checkout_line_info.line.total_price
 
     # then
     currency = checkout.currency
@@ -780,13 +775,10 @@ def test_calculate_checkout_line_total_with_voucher_multiple_lines_last_line(
     checkout_line_info = lines[-1]
 
     # when
-    line_total_price = calculate_checkout_line_total(
-        checkout_info,
-        lines,
-        checkout_line_info,
-        rate,
-        prices_entered_with_tax,
+    update_checkout_prices_with_flat_rates(
+        checkout, checkout_info, lines, prices_entered_with_tax, address
     )
+    line_total_price = checkout_line_info.line.total_price
 
     # then
     discount_amount_for_last_line = (
@@ -852,10 +844,11 @@ def test_calculate_checkout_line_total_with_voucher_for_multiple_lines(
     checkout.voucher_code = voucher.code
     checkout.save()
 
-    line = checkout.lines.last()
-    variant = line.variant
-    product = variant.product
-    product.tax_class.country_rates.update_or_create(country=address.country, rate=rate)
+    for line in checkout.lines.all():
+        product = line.variant.product
+        product.tax_class.country_rates.update_or_create(
+            country=address.country, rate=rate
+        )
 
     total_price = Money(sum(line_prices), currency)
 
@@ -863,19 +856,12 @@ def test_calculate_checkout_line_total_with_voucher_for_multiple_lines(
     checkout_info = fetch_checkout_info(checkout, lines, manager)
 
     # when
-    result_total_prices = []
-    for line_info in lines:
-        result_total_prices.append(
-            calculate_checkout_line_total(
-                checkout_info,
-                lines,
-                line_info,
-                rate,
-                prices_entered_with_tax,
-            )
-        )
+    update_checkout_prices_with_flat_rates(
+        checkout, checkout_info, lines, prices_entered_with_tax, address
+    )
 
     # then
+    result_total_prices = [line_info.line.total_price for line_info in lines]
     remaining_discount = discount_amount
     assert (
         sum(line_prices)
@@ -940,13 +926,10 @@ def test_calculate_checkout_line_total_with_shipping_voucher(
     checkout_line_info = lines[0]
 
     # when
-    line_total_price = calculate_checkout_line_total(
-        checkout_info,
-        lines,
-        checkout_line_info,
-        rate,
-        prices_entered_with_tax,
+    update_checkout_prices_with_flat_rates(
+        checkout, checkout_info, lines, prices_entered_with_tax, address
     )
+    line_total_price = checkout_line_info.line.total_price
 
     # then
     currency = checkout_with_item.currency
@@ -986,9 +969,10 @@ def test_calculate_checkout_line_total_discount_from_order_promotion(
     create_checkout_discount_objects_for_order_promotions(checkout_info, lines)
 
     # when
-    line_price = calculate_checkout_line_total(
-        checkout_info, lines, checkout_line_info, rate, prices_entered_with_tax
+    update_checkout_prices_with_flat_rates(
+        checkout, checkout_info, lines, prices_entered_with_tax, address
     )
+    line_price = checkout_line_info.line.total_price
 
     # then
     variant_listing = variant.channel_listings.get(channel=checkout.channel)
@@ -1034,9 +1018,10 @@ def test_calculate_checkout_line_total_discount_for_gift_line(
     create_checkout_discount_objects_for_order_promotions(checkout_info, lines)
 
     # when
-    line_price = calculate_checkout_line_total(
-        checkout_info, lines, checkout_line_info, rate, prices_entered_with_tax
+    update_checkout_prices_with_flat_rates(
+        checkout, checkout_info, lines, prices_entered_with_tax, address
     )
+    line_price = checkout_line_info.line.total_price
 
     # then
     assert line_price == zero_taxed_money(checkout.currency)
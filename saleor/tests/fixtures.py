@@ -117,6 +117,7 @@ from ..payment.transaction_item_calculations import recalculate_transaction_amou
 from ..payment.utils import create_manual_adjustment_events
 from ..permission.enums import get_permissions
 from ..permission.models import Permission
+from ..plugins import registry as plugin_registry
 from ..plugins.manager import get_plugins_manager
 from ..plugins.webhook.tests.subscription_webhooks import subscription_queries
 from ..product import ProductMediaTypes, ProductTypeKind
@@ -162,6 +163,7 @@ from ..warehouse.models import (
     Stock,
     Warehouse,
 )
+from ..webhook import registry as webhook_registry
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..webhook.models import Webhook, WebhookEvent
 from ..webhook.observability import WebhookData
@@ -386,6 +388,16 @@ def _sample_gateway(settings):
     ]
 
 
+@pytest.fixture(autouse=True)
+def _clear_registries():
+    """Drop the registries built in a previous, rolled back test."""
+    webhook_registry.clear_webhook_registry()
+    plugin_registry.clear_plugin_configurations_registry()
+    yield
+    webhook_registry.clear_webhook_registry()
+    plugin_registry.clear_plugin_configurations_registry()
+
+
 @pytest.fixture(autouse=True)
 def site_settings(db, settings) -> SiteSettings:
     """Create a site and matching site settings.
@@ -0,0 +1,22 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class WarehouseAppConfig(AppConfig):
+    name = "saleor.warehouse"
+
+    def ready(self):
+        from .models import Stock
+        from .signals import update_stock_variant_channel_availability
+
+        # preventing duplicate signals
+        post_save.connect(
+            update_stock_variant_channel_availability,
+            sender=Stock,
+            dispatch_uid="update_saved_stock_variant_channel_availability",
+        )
+        post_delete.connect(
+            update_stock_variant_channel_availability,
+            sender=Stock,
+            dispatch_uid="update_deleted_stock_variant_channel_availability",
+        )
@@ -4,12 +4,15 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any, Optional, cast
 from uuid import UUID
 
-from django.db import transaction
+from django.conf import settings
+from django.db import connection, transaction
 from django.db.models import F, Sum
 from django.db.models.expressions import Exists, OuterRef
 from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from ..channel import AllocationStrategy
+from ..channel.models import Channel
 from ..checkout.models import CheckoutLine
 from ..core.exceptions import (
     AllocationError,
@@ -28,13 +31,13 @@ from .models import (
     ChannelWarehouse,
     PreorderAllocation,
     PreorderReservation,
+    ProductVariantChannelAvailability,
     Reservation,
     Stock,
     Warehouse,
 )
 
 if TYPE_CHECKING:
-    from ..channel.models import Channel
     from ..order.models import Order
 
 
@@ -67,6 +70,130 @@ def stock_bulk_update(stocks: list[Stock], fields_to_update: list[str]):
             .values_list("id", flat=True)
         )
         Stock.objects.bulk_update(stocks, fields_to_update)
+    schedule_variants_channel_availability_update(
+        stock_ids=[stock.pk for stock in stocks]
+    )
+
+
+def update_stocks_quantity_by(field: str, quantity_changes: dict[int, int]):
+    """Add quantities to the given stock field with a single statement.
+
+    `quantity_changes` maps stock pk to the value added to the field; negative values
+    decrease it. Each stock is updated once, even if it occurs in many lines.
+    """
+    changes = {pk: quantity for pk, quantity in quantity_changes.items() if quantity}
+    if not changes:
+        return
+    table = Stock._meta.db_table
+    column = Stock._meta.get_field(field).column
+    values = ", ".join(["(%s, %s)"] * len(changes))
+    params = [value for change in sorted(changes.items()) for value in change]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table} AS stock
+            SET {column} = stock.{column} + change.quantity
+            FROM (VALUES {values}) AS change (id, quantity)
+            WHERE stock.id = change.id
+            """,
+            params,
+        )
+    schedule_variants_channel_availability_update(stock_ids=changes.keys())
+
+
+def update_variants_channel_availability(variant_ids: Iterable[int]):
+    """Recalculate the quantity of variants available in channels.
+
+    The quantity available in a channel is the sum of stock quantities, reduced by
+    allocations and active reservations, in warehouses used by the channel for
+    shipping or click and collect.
+    """
+    variant_ids = set(variant_ids)
+    if not variant_ids:
+        return
+
+    stocks = list(
+        Stock.objects.filter(product_variant_id__in=variant_ids)
+        .annotate_available_quantity()
+        .values_list("id", "product_variant_id", "warehouse_id", "available_quantity")
+    )
+    quantity_reserved_for_stocks = dict(
+        Reservation.objects.filter(
+            stock__product_variant_id__in=variant_ids,
+            reserved_until__gt=timezone.now(),
+        )
+        .values("stock_id")
+        .annotate(quantity_reserved_sum=Sum("quantity_reserved"))
+        .values_list("stock_id", "quantity_reserved_sum")
+    )
+
+    quantities: dict[tuple[int, int], int] = defaultdict(int)
+    for channel_id, channel_slug in Channel.objects.values_list("id", "slug"):
+        warehouse_ids = set(
+            Warehouse.objects.for_channel_with_active_shipping_zone_or_cc(
+                channel_slug
+            ).values_list("pk", flat=True)
+        )
+        for stock_id, variant_id, warehouse_id, available_quantity in stocks:
+            if warehouse_id not in warehouse_ids:
+                continue
+            quantity_reserved = quantity_reserved_for_stocks.get(stock_id, 0)
+            quantities[(variant_id, channel_id)] += max(
+                available_quantity - quantity_reserved, 0
+            )
+
+    now = timezone.now()
+    availabilities_to_update = []
+    availability_ids_to_delete = []
+    for availability in ProductVariantChannelAvailability.objects.filter(
+        product_variant_id__in=variant_ids
+    ):
+        key = (availability.product_variant_id, availability.channel_id)
+        if key not in quantities:
+            availability_ids_to_delete.append(availability.pk)
+            continue
+        quantity = quantities.pop(key)
+        if availability.quantity_available != quantity:
+            availability.quantity_available = quantity
+            availability.updated_at = now
+            availabilities_to_update.append(availability)
+
+    ProductVariantChannelAvailability.objects.filter(
+        pk__in=availability_ids_to_delete
+    ).delete()
+    ProductVariantChannelAvailability.objects.bulk_update(
+        availabilities_to_update, ["quantity_available", "updated_at"]
+    )
+    ProductVariantChannelAvailability.objects.bulk_create(
+        [
+            ProductVariantChannelAvailability(
+                product_variant_id=variant_id,
+                channel_id=channel_id,
+                quantity_available=quantity,
+            )
+            for (variant_id, channel_id), quantity in quantities.items()
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def schedule_variants_channel_availability_update(
+    variant_ids: Iterable[int] = (), stock_ids: Iterable[int] = ()
+):
+    """Update channel availability of the variants after the transaction commit."""
+    from .tasks import update_variants_channel_availability_task
+
+    if not settings.VARIANT_CHANNEL_AVAILABILITY_ENABLED:
+        return
+    variant_ids = list(set(variant_ids))
+    stock_ids = list(set(stock_ids))
+    if not variant_ids and not stock_ids:
+        return
+    transaction.on_commit(
+        lambda: update_variants_channel_availability_task.delay(
+            variant_ids=variant_ids, stock_ids=stock_ids
+        )
+    )
 
 
 def allocation_with_stock_qs_select_for_update():
@@ -139,7 +266,7 @@ def allocate_stocks(
         .filter(**filter_lookup)
         .values("id", "product_variant", "pk", "quantity", "warehouse_id")
     )
-    stocks_id = (stock.pop("id") for stock in stocks)
+    stocks_id = [stock.pop("id") for stock in stocks]
 
     quantity_reservation_for_stocks: dict = _prepare_stock_to_reserved_quantity_map(
         checkout_lines, check_reservations, stocks_id
@@ -190,26 +317,31 @@ def allocate_stocks(
         raise InsufficientStock(insufficient_stock)
 
     if allocations:
-        stocks_to_update = []
-        for alloc in Allocation.objects.bulk_create(allocations):
-            stock = alloc.stock
-            stock.quantity_allocated = (
-                F("quantity_allocated") + alloc.quantity_allocated
-            )
-            stocks_to_update.append(stock)
-        Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
-
+        Allocation.objects.bulk_create(allocations)
+        allocated_quantities: dict[int, int] = defaultdict(int)
         for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
+            allocated_quantities[allocation.stock_id] += allocation.quantity_allocated
+        update_stocks_quantity_by("quantity_allocated", allocated_quantities)
+
+        # Stocks are locked, so the allocated quantity can be computed from the
+        # already fetched allocations instead of querying every stock again.
+        stock_quantities = {
+            stock_data.pk: stock_data.quantity
+            for variant_stocks in variant_to_stocks.values()
+            for stock_data in variant_stocks
+        }
+        out_of_stock_pks = []
+        for stock_pk, quantity in allocated_quantities.items():
+            quantity_allocation_for_stocks[stock_pk] += quantity
+            available_quantity = (
+                stock_quantities[stock_pk] - quantity_allocation_for_stocks[stock_pk]
+            )
+            if available_quantity <= 0:
+                out_of_stock_pks.append(stock_pk)
+        for stock in Stock.objects.filter(pk__in=out_of_stock_pks):
+            transaction.on_commit(
+                lambda stock=stock: manager.product_variant_out_of_stock(stock)
             )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
-                transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
-                )
 
 
 def _prepare_stock_to_reserved_quantity_map(
@@ -348,7 +480,8 @@ def deallocate_stock(
         line_to_allocations[allocation.order_line_id].append(allocation)
 
     allocations_to_update = []
-    stocks_to_update = []
+    deallocated_quantities: dict[int, int] = defaultdict(int)
+    stocks: dict[int, Stock] = {}
     not_dellocated_lines = []
     for line_info in order_lines_data:
         order_line = line_info.line
@@ -363,11 +496,8 @@ def deallocate_stock(
                 allocation.quantity_allocated = (
                     allocation.quantity_allocated - quantity_to_deallocate
                 )
-                stock = allocation.stock
-                stock.quantity_allocated = (
-                    F("quantity_allocated") - quantity_to_deallocate
-                )
-                stocks_to_update.append(stock)
+                stocks[allocation.stock_id] = allocation.stock
+                deallocated_quantities[allocation.stock_id] += quantity_to_deallocate
                 quantity_dealocated += quantity_to_deallocate
                 allocations_to_update.append(allocation)
                 if quantity_dealocated == quantity:
@@ -375,29 +505,27 @@ def deallocate_stock(
         if not quantity_dealocated == quantity:
             not_dellocated_lines.append(order_line)
 
-    allocations_before_update = list(
-        Allocation.objects.filter(
+    stock_available_quantity_before_update = {
+        allocation.stock_id: allocation.stock_available_quantity
+        for allocation in Allocation.objects.filter(
             id__in=[a.id for a in allocations_to_update]
         ).annotate_stock_available_quantity()
-    )
+    }
 
     Allocation.objects.bulk_update(allocations_to_update, ["quantity_allocated"])
 
-    for allocation_before_update in allocations_before_update:
-        available_stock_now = Allocation.objects.available_quantity_for_stock(
-            allocation_before_update.stock
-        )
-        if (
-            allocation_before_update.stock_available_quantity <= 0
-            and available_stock_now > 0
-        ):
+    for stock_pk, available_quantity in stock_available_quantity_before_update.items():
+        available_quantity_now = available_quantity + deallocated_quantities[stock_pk]
+        if available_quantity <= 0 and available_quantity_now > 0:
+            stock = stocks[stock_pk]
             transaction.on_commit(
-                lambda: manager.product_variant_back_in_stock(
-                    allocation_before_update.stock
-                )
+                lambda stock=stock: manager.product_variant_back_in_stock(stock)
             )
 
-    Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    update_stocks_quantity_by(
+        "quantity_allocated",
+        {stock_pk: -quantity for stock_pk, quantity in deallocated_quantities.items()},
+    )
 
     if not_dellocated_lines:
         raise AllocationError(not_dellocated_lines)
@@ -476,6 +604,9 @@ def increase_allocations(
         stocks_to_update.append(stock)
     Allocation.objects.filter(pk__in=allocation_pks_to_delete).delete()
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    schedule_variants_channel_availability_update(
+        stock_ids=[stock.pk for stock in stocks_to_update]
+    )
 
     order = lines_info[0].line.order  # type: ignore[index]
     country_code = get_active_country(
@@ -576,7 +707,7 @@ def _decrease_stocks_quantity(
     allow_stock_to_be_exceeded: bool = False,
 ):
     insufficient_stocks: list[InsufficientStockData] = []
-    stocks_to_update = []
+    quantity_changes: dict[int, int] = defaultdict(int)
     for line_info in order_lines_info:
         variant = line_info.variant
         warehouse_pk = line_info.warehouse_pk
@@ -615,12 +746,12 @@ def _decrease_stocks_quantity(
             )
             continue
         stock.quantity = stock.quantity - line_info.quantity
-        stocks_to_update.append(stock)
+        quantity_changes[stock.pk] -= line_info.quantity
 
     if insufficient_stocks:
         raise InsufficientStock(insufficient_stocks)
 
-    Stock.objects.bulk_update(stocks_to_update, ["quantity"])
+    update_stocks_quantity_by("quantity", quantity_changes)
 
 
 def get_order_lines_with_track_inventory(
@@ -661,6 +792,9 @@ def deallocate_stock_for_order(order: "Order", manager: PluginsManager):
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    schedule_variants_channel_availability_update(
+        stock_ids=[stock.pk for stock in stocks_to_update]
+    )
 
 
 @traced_atomic_transaction()
@@ -688,6 +822,9 @@ def deallocate_stock_for_orders(orders_id, manager: PluginsManager):
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    schedule_variants_channel_availability_update(
+        stock_ids=[stock.pk for stock in stocks_to_update]
+    )
 
 
 @traced_atomic_transaction()
@@ -706,6 +843,7 @@ def allocate_preorders(
 
     all_variants_channel_listings = (
         ProductVariantChannelListing.objects.filter(variant__in=variants)
+        .order_by("pk")
         .select_for_update(of=("self",))
         .select_related("channel")
         .values("id", "channel__slug", "preorder_quantity_threshold", "variant_id")
@@ -893,9 +1031,15 @@ def deactivate_preorder_for_variant(product_variant: ProductVariant):
 
     if stocks_to_create:
         Stock.objects.bulk_create(stocks_to_create)
+        schedule_variants_channel_availability_update(
+            variant_ids=[stock.product_variant_id for stock in stocks_to_create]
+        )
 
     if stocks_to_update:
         Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+        schedule_variants_channel_availability_update(
+            stock_ids=[stock.pk for stock in stocks_to_update]
+        )
 
     if allocations_to_create:
         Allocation.objects.bulk_create(allocations_to_create)
@@ -0,0 +1,51 @@
+# Generated by Django 3.2.25 on 2026-10-18 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("channel", "0018_channel_automatically_complete_paid_checkouts"),
+        ("product", "0194_auto_20240620_1404"),
+        ("warehouse", "0034_warehouse_click_and_collect_option_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductVariantChannelAvailability",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("quantity_available", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="variant_availabilities",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "product_variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="channel_availabilities",
+                        to="product.productvariant",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("pk",),
+                "unique_together": {("product_variant", "channel")},
+            },
+        ),
+    ]
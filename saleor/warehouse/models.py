@@ -636,3 +636,32 @@ class Reservation(models.Model):
             models.Index(fields=["checkout_line", "reserved_until"]),
         ]
         ordering = ("pk",)
+
+
+class ProductVariantChannelAvailability(models.Model):
+    """Quantity of the variant available in the warehouses of the channel.
+
+    It is denormalized from stocks, allocations and reservations of warehouses
+    that the channel uses for shipping or click and collect.
+    """
+
+    product_variant = models.ForeignKey(
+        ProductVariant,
+        null=False,
+        blank=False,
+        on_delete=models.CASCADE,
+        related_name="channel_availabilities",
+    )
+    channel = models.ForeignKey(
+        Channel,
+        null=False,
+        blank=False,
+        on_delete=models.CASCADE,
+        related_name="variant_availabilities",
+    )
+    quantity_available = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = [["product_variant", "channel"]]
+        ordering = ("pk",)
@@ -11,7 +11,11 @@ from django.utils import timezone
 from ..core.exceptions import InsufficientStock, InsufficientStockData
 from ..core.tracing import traced_atomic_transaction
 from ..product.models import ProductVariant, ProductVariantChannelListing
-from .management import sort_stocks, stock_qs_select_for_update
+from .management import (
+    schedule_variants_channel_availability_update,
+    sort_stocks,
+    stock_qs_select_for_update,
+)
 from .models import Allocation, PreorderReservation, Reservation
 
 if TYPE_CHECKING:
@@ -172,8 +176,29 @@ def reserve_stocks(
 
     if reservations:
         if replace:
+            schedule_variants_channel_availability_update_for_checkout_lines(
+                checkout_lines
+            )
             Reservation.objects.filter(checkout_line__in=checkout_lines).delete()
         Reservation.objects.bulk_create(reservations)
+        schedule_variants_channel_availability_update(
+            stock_ids=[reservation.stock_id for reservation in reservations]
+        )
+
+
+def schedule_variants_channel_availability_update_for_checkout_lines(
+    checkout_lines: Iterable["CheckoutLine"],
+):
+    """Update channel availability of the variants reserved by the checkout lines.
+
+    Must be called before the lines or their reservations are deleted.
+    """
+    if not settings.VARIANT_CHANNEL_AVAILABILITY_ENABLED:
+        return
+    stock_ids = Reservation.objects.filter(
+        checkout_line__in=checkout_lines, reserved_until__gt=timezone.now()
+    ).values_list("stock_id", flat=True)
+    schedule_variants_channel_availability_update(stock_ids=stock_ids)
 
 
 def _create_stock_reservations(
@@ -0,0 +1,7 @@
+from .management import schedule_variants_channel_availability_update
+
+
+def update_stock_variant_channel_availability(sender, instance, **kwargs):
+    schedule_variants_channel_availability_update(
+        variant_ids=[instance.product_variant_id]
+    )
@@ -1,14 +1,27 @@
+from datetime import timedelta
+
 from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.db.models import F, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..celeryconf import app
-from .management import delete_allocations, stock_bulk_update
+from ..product.models import ProductVariant
+from .management import (
+    delete_allocations,
+    stock_bulk_update,
+    update_variants_channel_availability,
+)
 from .models import Allocation, PreorderReservation, Reservation, Stock
 
 task_logger = get_task_logger(__name__)
 
+VARIANTS_CHANNEL_AVAILABILITY_BATCH_SIZE = 1000
+# Should be longer than the interval of the scheduled task, so expiring
+# reservations are not missed between the runs.
+EXPIRED_RESERVATIONS_LOOKBACK = timedelta(minutes=2)
+
 
 @app.task
 def delete_empty_allocations_task():
@@ -62,3 +75,47 @@ def update_stocks_quantity_allocated_task():
         "Finished updating quantity_allocated on stocks, %d were corrected.",
         len(stocks_to_update),
     )
+
+
+@app.task
+def update_variants_channel_availability_task(variant_ids=None, stock_ids=None):
+    variant_ids = set(variant_ids or [])
+    if stock_ids:
+        variant_ids.update(
+            Stock.objects.filter(pk__in=stock_ids).values_list(
+                "product_variant_id", flat=True
+            )
+        )
+    update_variants_channel_availability(variant_ids)
+
+
+@app.task
+def update_variants_channel_availability_for_expired_reservations_task():
+    if not settings.VARIANT_CHANNEL_AVAILABILITY_ENABLED:
+        return
+    now = timezone.now()
+    variant_ids = (
+        Reservation.objects.filter(
+            reserved_until__gt=now - EXPIRED_RESERVATIONS_LOOKBACK,
+            reserved_until__lte=now,
+        )
+        .values_list("stock__product_variant_id", flat=True)
+        .distinct()
+    )
+    update_variants_channel_availability(variant_ids)
+
+
+@app.task
+def recalculate_variants_channel_availability_task(from_variant_id=0):
+    """Recalculate the channel availability of all variants in batches."""
+    if not settings.VARIANT_CHANNEL_AVAILABILITY_ENABLED:
+        return
+    variant_ids = list(
+        ProductVariant.objects.filter(pk__gt=from_variant_id)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:VARIANTS_CHANNEL_AVAILABILITY_BATCH_SIZE]
+    )
+    if not variant_ids:
+        return
+    update_variants_channel_availability(variant_ids)
+    recalculate_variants_channel_availability_task.delay(variant_ids[-1])
@@ -19,6 +19,7 @@ from ..management import (
     decrease_stock,
     increase_allocations,
     increase_stock,
+    update_stocks_quantity_by,
 )
 from ..models import Allocation, ChannelWarehouse, PreorderAllocation
 
@@ -499,6 +500,58 @@ def test_deallocate_stock(allocation):
     assert allocation.quantity_allocated == 0
 
 
+def test_deallocate_stock_multiple_lines_from_the_same_stock(allocation):
+    # given
+    stock = allocation.stock
+    first_line = allocation.order_line
+    second_line = OrderLine.objects.get(pk=first_line.pk)
+    second_line.pk = None
+    second_line.save()
+    Allocation.objects.create(
+        order_line=second_line, stock=stock, quantity_allocated=20
+    )
+    allocation.quantity_allocated = 30
+    allocation.save(update_fields=["quantity_allocated"])
+    stock.quantity = 100
+    stock.quantity_allocated = 50
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+    variant = stock.product_variant
+
+    # when
+    deallocate_stock(
+        [
+            OrderLineInfo(line=first_line, quantity=30, variant=variant),
+            OrderLineInfo(line=second_line, quantity=15, variant=variant),
+        ],
+        manager=get_plugins_manager(allow_replica=False),
+    )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 5
+    assert list(
+        Allocation.objects.order_by("quantity_allocated").values_list(
+            "quantity_allocated", flat=True
+        )
+    ) == [0, 5]
+
+
+def test_update_stocks_quantity_by(stock):
+    # given
+    stock.quantity = 10
+    stock.quantity_allocated = 4
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    # when
+    update_stocks_quantity_by("quantity_allocated", {stock.pk: -3})
+    update_stocks_quantity_by("quantity", {stock.pk: 5})
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity == 15
+    assert stock.quantity_allocated == 1
+
+
 def test_deallocate_stock_when_quantity_less_than_zero(allocation):
     stock = allocation.stock
     stock.quantity = -10
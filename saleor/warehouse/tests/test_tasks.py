@@ -1,13 +1,20 @@
 from datetime import timedelta
 
 import pytest
+from django.core.management import call_command
 from django.utils import timezone
 
-from ..models import Allocation, PreorderReservation, Reservation
+from ..models import (
+    Allocation,
+    PreorderReservation,
+    ProductVariantChannelAvailability,
+    Reservation,
+)
 from ..tasks import (
     delete_empty_allocations_task,
     delete_expired_reservations_task,
     update_stocks_quantity_allocated_task,
+    update_variants_channel_availability_task,
 )
 
 
@@ -100,3 +107,73 @@ def test_update_stocks_quantity_allocated_task_stock_without_allocations(stock):
 
     stock.refresh_from_db()
     assert stock.quantity_allocated == 0
+
+
+def test_update_variants_channel_availability_task(
+    allocation, checkout_line, channel_USD
+):
+    # given
+    stock = allocation.stock
+    stock.quantity = 20
+    stock.quantity_allocated = 5
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+    Reservation.objects.bulk_create(
+        [
+            Reservation(
+                checkout_line=checkout_line,
+                stock=stock,
+                quantity_reserved=3,
+                reserved_until=timezone.now() + timedelta(minutes=5),
+            ),
+            Reservation(
+                checkout_line=checkout_line,
+                stock=stock,
+                quantity_reserved=7,
+                reserved_until=timezone.now() - timedelta(minutes=5),
+            ),
+        ]
+    )
+
+    # when
+    update_variants_channel_availability_task(stock_ids=[stock.pk])
+
+    # then
+    availability = ProductVariantChannelAvailability.objects.get(
+        product_variant_id=stock.product_variant_id, channel=channel_USD
+    )
+    assert availability.quantity_available == 12
+
+
+def test_update_variants_channel_availability_task_updates_existing_row(
+    stock, channel_USD
+):
+    # given
+    availability = ProductVariantChannelAvailability.objects.create(
+        product_variant=stock.product_variant,
+        channel=channel_USD,
+        quantity_available=100,
+    )
+    stock.quantity = 0
+    stock.save(update_fields=["quantity"])
+
+    # when
+    update_variants_channel_availability_task(variant_ids=[stock.product_variant_id])
+
+    # then
+    availability.refresh_from_db()
+    assert availability.quantity_available == 0
+
+
+def test_update_variants_channel_availability_command(stock, channel_USD):
+    # given
+    stock.quantity = 15
+    stock.save(update_fields=["quantity"])
+
+    # when
+    call_command("update_variants_channel_availability")
+
+    # then
+    availability = ProductVariantChannelAvailability.objects.get(
+        product_variant_id=stock.product_variant_id, channel=channel_USD
+    )
+    assert availability.quantity_available == 15
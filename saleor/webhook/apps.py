@@ -0,0 +1,24 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WebhookAppConfig(AppConfig):
+    name = "saleor.webhook"
+
+    def ready(self):
+        from ..app.models import App
+        from .models import Webhook, WebhookEvent
+        from .registry import invalidate_webhook_registry
+
+        for model in (App, Webhook, WebhookEvent):
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    invalidate_webhook_registry,
+                    sender=model,
+                    dispatch_uid=f"invalidate_webhook_registry_{model.__name__}",
+                )
+        m2m_changed.connect(
+            invalidate_webhook_registry,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_webhook_registry_app_permissions",
+        )
@@ -0,0 +1,108 @@
+"""Process-level registry of active webhooks per event type.
+
+The registry loads all active webhooks with their events, apps and app
+permissions in a single pass and serves `get_webhooks_for_event` without
+querying the database for every emitted event. Any change to webhooks, their
+events or apps invalidates it; see `saleor.core.utils.registry` for details.
+
+Changes made without model signals, like `bulk_create`, have to call
+`invalidate_webhook_registry` explicitly.
+"""
+
+import copy
+from collections import defaultdict
+
+from django.conf import settings
+
+from ..core.utils.registry import VersionedRegistry
+from .event_types import WebhookEventAsyncType, WebhookEventSyncType
+from .models import Webhook
+
+WEBHOOK_REGISTRY_VERSION_KEY = "webhook_registry_version"
+
+
+class WebhookRegistry:
+    def __init__(self, webhooks: list[Webhook]):
+        self._webhooks_by_event: dict[str, list[Webhook]] = defaultdict(list)
+        self._app_permissions: dict[int, set[tuple[str, str]]] = {}
+        for webhook in webhooks:
+            app = webhook.app
+            if app.id not in self._app_permissions:
+                self._app_permissions[app.id] = {
+                    (permission.content_type.app_label, permission.codename)
+                    for permission in app.permissions.all()
+                }
+            for event in webhook.events.all():
+                self._webhooks_by_event[event.event_type].append(webhook)
+        self._resolved: dict[tuple[str, bool], list[Webhook]] = {}
+
+    def get_webhooks(self, event_type: str) -> list[Webhook]:
+        """Return webhooks for the event, including the ones subscribed to any."""
+        return self._get_webhooks(event_type, exact=False)
+
+    def get_webhooks_subscribed_to(self, event_type: str) -> list[Webhook]:
+        """Return webhooks of not removed apps subscribed to the exact event."""
+        return self._get_webhooks(event_type, exact=True)
+
+    def _get_webhooks(self, event_type: str, exact: bool) -> list[Webhook]:
+        key = (event_type, exact)
+        if key not in self._resolved:
+            self._resolved[key] = self._resolve(event_type, exact)
+        return [copy.copy(webhook) for webhook in self._resolved[key]]
+
+    def _resolve(self, event_type: str, exact: bool) -> list[Webhook]:
+        webhooks = list(self._webhooks_by_event.get(event_type, []))
+        if not exact and event_type in WebhookEventAsyncType.ALL:
+            webhooks.extend(self._webhooks_by_event.get(WebhookEventAsyncType.ANY, []))
+
+        required_permission = WebhookEventAsyncType.PERMISSIONS.get(
+            event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
+        )
+        if required_permission:
+            app_label, codename = required_permission.value.split(".")
+        include_removed_apps = (
+            not exact and event_type == WebhookEventAsyncType.APP_DELETED
+        )
+        resolved: dict[int, Webhook] = {}
+        for webhook in webhooks:
+            if webhook.app.removed_at and not include_removed_apps:
+                continue
+            if required_permission and (
+                (app_label, codename) not in self._app_permissions[webhook.app_id]
+            ):
+                continue
+            resolved[webhook.id] = webhook
+        return sorted(resolved.values(), key=lambda webhook: webhook.pk)
+
+
+def build_webhook_registry() -> WebhookRegistry:
+    webhooks = (
+        Webhook.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+        .filter(is_active=True, app__is_active=True)
+        .select_related("app")
+        .prefetch_related("events", "app__permissions__content_type")
+    )
+    return WebhookRegistry(list(webhooks))
+
+
+_registry = VersionedRegistry(
+    WEBHOOK_REGISTRY_VERSION_KEY,
+    build_webhook_registry,
+    "WEBHOOK_REGISTRY_VERSION_CHECK_INTERVAL",
+)
+
+
+def is_webhook_registry_enabled() -> bool:
+    return settings.WEBHOOK_REGISTRY_ENABLED
+
+
+def get_webhook_registry() -> WebhookRegistry:
+    return _registry.get()
+
+
+def clear_webhook_registry():
+    _registry.clear()
+
+
+def invalidate_webhook_registry(**kwargs):
+    _registry.invalidate(using=kwargs.get("using"))
@@ -0,0 +1,119 @@
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from ..event_types import WebhookEventAsyncType, WebhookEventSyncType
+from ..registry import clear_webhook_registry, get_webhook_registry
+from ..utils import get_webhooks_for_event, get_webhooks_for_multiple_events
+
+
+@pytest.fixture
+def webhooks(app, permission_manage_orders):
+    app.permissions.add(permission_manage_orders)
+    order_webhook = app.webhooks.create(name="order", target_url="http://test.com")
+    order_webhook.events.create(event_type=WebhookEventAsyncType.ORDER_CREATED)
+    any_webhook = app.webhooks.create(name="any", target_url="http://test.com")
+    any_webhook.events.create(event_type=WebhookEventAsyncType.ANY)
+    payment_webhook = app.webhooks.create(name="payment", target_url="http://test.com")
+    payment_webhook.events.create(event_type=WebhookEventSyncType.PAYMENT_AUTHORIZE)
+    inactive_webhook = app.webhooks.create(
+        name="inactive", target_url="http://test.com", is_active=False
+    )
+    inactive_webhook.events.create(event_type=WebhookEventAsyncType.ORDER_CREATED)
+    return order_webhook, any_webhook, payment_webhook
+
+
+@pytest.mark.parametrize(
+    "event_type",
+    [
+        WebhookEventAsyncType.ORDER_CREATED,
+        WebhookEventAsyncType.PRODUCT_CREATED,
+        WebhookEventSyncType.PAYMENT_AUTHORIZE,
+        WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES,
+    ],
+)
+def test_registry_matches_database(webhooks, event_type):
+    # given
+    with override_settings(WEBHOOK_REGISTRY_ENABLED=False):
+        expected_webhooks = list(get_webhooks_for_event(event_type))
+
+    # when
+    registry_webhooks = get_webhooks_for_event(event_type)
+
+    # then
+    assert registry_webhooks == expected_webhooks
+    assert all(webhook.app for webhook in registry_webhooks)
+
+
+def test_registry_multiple_events_matches_database(webhooks):
+    # given
+    event_types = [
+        WebhookEventAsyncType.ORDER_CREATED,
+        WebhookEventSyncType.PAYMENT_AUTHORIZE,
+    ]
+    with override_settings(WEBHOOK_REGISTRY_ENABLED=False):
+        expected_map = get_webhooks_for_multiple_events(event_types)
+
+    # when
+    registry_map = get_webhooks_for_multiple_events(event_types)
+
+    # then
+    assert registry_map == expected_map
+
+
+def test_registry_reused_between_events(webhooks, django_assert_num_queries):
+    # given
+    # the webhooks are created in the test transaction, which is never committed
+    clear_webhook_registry()
+    get_webhooks_for_event(WebhookEventAsyncType.ORDER_CREATED)
+
+    # when
+    with django_assert_num_queries(0):
+        get_webhooks_for_event(WebhookEventAsyncType.ORDER_UPDATED)
+        get_webhooks_for_event(WebhookEventAsyncType.ORDER_CREATED)
+
+
+def test_registry_invalidated_on_webhook_change(
+    webhooks, django_capture_on_commit_callbacks
+):
+    # given
+    order_webhook, any_webhook, _ = webhooks
+    get_webhook_registry()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        order_webhook.is_active = False
+        order_webhook.save(update_fields=["is_active"])
+
+    # then
+    assert get_webhooks_for_event(WebhookEventAsyncType.ORDER_CREATED) == [any_webhook]
+
+
+def test_registry_reflects_uncommitted_changes(webhooks):
+    # given
+    order_webhook, any_webhook, _ = webhooks
+    clear_webhook_registry()
+    get_webhook_registry()
+
+    # when
+    order_webhook.is_active = False
+    order_webhook.save(update_fields=["is_active"])
+
+    # then
+    assert get_webhooks_for_event(WebhookEventAsyncType.ORDER_CREATED) == [any_webhook]
+
+
+def test_registry_not_stored_until_commit(webhooks):
+    # given
+    order_webhook, _, _ = webhooks
+    order_webhook.is_active = False
+    order_webhook.save(update_fields=["is_active"])
+    get_webhook_registry()
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        get_webhook_registry()
+
+    # then
+    assert ctx.captured_queries
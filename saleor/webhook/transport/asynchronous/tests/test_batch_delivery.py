@@ -0,0 +1,140 @@
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+
+from .....core import EventDeliveryStatus
+from .....core.models import EventDelivery, EventDeliveryAttempt
+from ....event_types import WebhookEventAsyncType
+from ...utils import WebhookResponse
+from ..transport import (
+    schedule_webhook_deliveries,
+    send_webhook_deliveries_batch,
+    send_webhook_requests_async_batch,
+)
+
+
+@pytest.fixture
+def event_deliveries(event_payload, webhook, any_webhook):
+    return EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ORDER_CREATED,
+                payload=event_payload,
+                webhook=delivery_webhook,
+            )
+            for delivery_webhook in [webhook, webhook, webhook, any_webhook]
+        ]
+    )
+
+
+@override_settings(
+    WEBHOOK_BATCH_DELIVERY_ENABLED=True, WEBHOOK_BATCH_DELIVERY_MAX_SIZE=2
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "send_webhook_requests_async_batch.apply_async"
+)
+def test_schedule_webhook_deliveries_in_batches(mocked_apply_async, event_deliveries):
+    # when
+    schedule_webhook_deliveries(event_deliveries, default_queue=None)
+
+    # then
+    scheduled_ids = [
+        call.kwargs["kwargs"]["event_delivery_ids"]
+        for call in mocked_apply_async.call_args_list
+    ]
+    first, second, third, fourth = event_deliveries
+    assert scheduled_ids == [[first.pk, second.pk], [third.pk], [fourth.pk]]
+
+
+@override_settings(WEBHOOK_BATCH_DELIVERY_ENABLED=False)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "send_webhook_request_async.apply_async"
+)
+def test_schedule_webhook_deliveries_without_batches(
+    mocked_apply_async, event_deliveries
+):
+    # when
+    schedule_webhook_deliveries(event_deliveries, default_queue=None)
+
+    # then
+    assert mocked_apply_async.call_count == len(event_deliveries)
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "send_webhook_request_async.apply_async"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_requests_async_batch(
+    mocked_send_webhook, mocked_send_webhook_request_async, event_deliveries
+):
+    # given
+    first, second, third, _ = event_deliveries
+    mocked_send_webhook.side_effect = [
+        WebhookResponse(content="", status=EventDeliveryStatus.SUCCESS),
+        WebhookResponse(
+            content="",
+            status=EventDeliveryStatus.FAILED,
+            response_status_code=400,
+        ),
+        WebhookResponse(
+            content="",
+            status=EventDeliveryStatus.FAILED,
+            response_status_code=503,
+        ),
+    ]
+
+    # when
+    send_webhook_requests_async_batch([first.pk, second.pk, third.pk])
+
+    # then
+    assert mocked_send_webhook.call_count == 3
+    assert not EventDelivery.objects.filter(pk=first.pk).exists()
+    second.refresh_from_db()
+    assert second.status == EventDeliveryStatus.FAILED
+    third.refresh_from_db()
+    assert third.status == EventDeliveryStatus.PENDING
+    assert set(EventDeliveryAttempt.objects.values_list("delivery_id", "status")) == {
+        (second.pk, EventDeliveryStatus.FAILED),
+        (third.pk, EventDeliveryStatus.FAILED),
+    }
+    mocked_send_webhook_request_async.assert_called_once()
+    retry_call_kwargs = mocked_send_webhook_request_async.call_args.kwargs
+    assert retry_call_kwargs["kwargs"] == {"event_delivery_id": third.pk}
+    assert retry_call_kwargs["retries"] == 1
+    assert retry_call_kwargs["countdown"] == 10
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "send_webhook_request_async.apply_async"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_deliveries_batch_retry_limit_exceeded(
+    mocked_send_webhook, mocked_send_webhook_request_async, event_deliveries
+):
+    # given
+    delivery = event_deliveries[0]
+    mocked_send_webhook.return_value = WebhookResponse(
+        content="", status=EventDeliveryStatus.FAILED, response_status_code=503
+    )
+    celery_task = mock.Mock(
+        request=mock.Mock(id="task-id", retries=5),
+        retry_backoff=10,
+        retry_kwargs={"max_retries": 5},
+    )
+
+    # when
+    send_webhook_deliveries_batch(celery_task, [delivery])
+
+    # then
+    mocked_send_webhook_request_async.assert_not_called()
+    delivery.refresh_from_db()
+    assert delivery.status == EventDeliveryStatus.FAILED
@@ -4,7 +4,10 @@ from unittest import mock
 import graphene
 from django.test import override_settings
 
-from .....graphql.webhook.subscription_payload import generate_payload_from_subscription
+from .....graphql.webhook.subscription_payload import (
+    generate_payload_from_subscription,
+    generate_payloads_from_subscription,
+)
 from .....webhook.event_types import WebhookEventAsyncType
 from .....webhook.models import Webhook
 from ..transport import (
@@ -210,3 +213,97 @@ def test_create_deliveries_for_multiple_subscription_objects_when_more_objs_than
                 "id": graphene.Node.to_global_id("Product", product_list[index].pk)
             }
         }
+
+
+@override_settings(WEBHOOK_SUBSCRIPTION_PAYLOADS_BATCH_ENABLED=True)
+def test_create_deliveries_for_multiple_subscription_objects_in_batch(
+    subscription_product_updated_webhook, product_list
+):
+    # given
+    webhooks = [subscription_product_updated_webhook]
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+
+    # when
+    deliveries = create_deliveries_for_multiple_subscription_objects(
+        event_type, product_list, webhooks
+    )
+
+    # then
+    assert len(deliveries) == len(product_list)
+    for index, delivery in enumerate(deliveries):
+        assert delivery.webhook == subscription_product_updated_webhook
+        assert delivery.event_type == event_type
+        assert json.loads(delivery.payload.get_payload()) == {
+            "product": {
+                "id": graphene.Node.to_global_id("Product", product_list[index].pk)
+            }
+        }
+
+
+@override_settings(WEBHOOK_SUBSCRIPTION_PAYLOADS_BATCH_ENABLED=True)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "generate_payloads_from_subscription",
+    wraps=generate_payloads_from_subscription,
+)
+def test_create_deliveries_in_batch_reuses_payloads_for_identical_webhooks(
+    mocked_generate_payloads,
+    subscription_product_updated_webhook,
+    subscription_webhook,
+    product_list,
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    webhooks = [
+        subscription_product_updated_webhook,
+        subscription_webhook(
+            subscription_product_updated_webhook.subscription_query,
+            event_type,
+            name="second",
+        ),
+    ]
+
+    # when
+    deliveries = create_deliveries_for_multiple_subscription_objects(
+        event_type, product_list, webhooks
+    )
+
+    # then
+    mocked_generate_payloads.assert_called_once()
+    assert len(deliveries) == len(product_list) * len(webhooks)
+    assert {delivery.webhook for delivery in deliveries} == set(webhooks)
+
+
+@override_settings(WEBHOOK_SUBSCRIPTION_PAYLOADS_BATCH_ENABLED=True)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "generate_payloads_from_subscription",
+    wraps=generate_payloads_from_subscription,
+)
+def test_create_deliveries_in_batch_does_not_reuse_payloads_between_apps(
+    mocked_generate_payloads,
+    subscription_product_updated_webhook,
+    subscription_webhook,
+    external_app,
+    product_list,
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    webhooks = [
+        subscription_product_updated_webhook,
+        subscription_webhook(
+            subscription_product_updated_webhook.subscription_query,
+            event_type,
+            name="other app",
+            app=external_app,
+        ),
+    ]
+
+    # when
+    deliveries = create_deliveries_for_multiple_subscription_objects(
+        event_type, product_list, webhooks
+    )
+
+    # then
+    assert mocked_generate_payloads.call_count == len(webhooks)
+    assert len(deliveries) == len(product_list) * len(webhooks)
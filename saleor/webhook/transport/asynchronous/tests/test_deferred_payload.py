@@ -4,6 +4,9 @@ from dataclasses import asdict
 from unittest import mock
 
 import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from freezegun import freeze_time
 
 from .....checkout.calculations import fetch_checkout_data
 from .....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
@@ -14,7 +17,12 @@ from ...utils import get_webhooks_for_event
 from ..transport import (
     DeferredPayloadData,
     generate_deferred_payloads,
+    generate_deferred_payloads_batch,
+    get_deferred_payloads_queue_depth,
+    get_deferred_payloads_queue_depth_key,
+    schedule_deferred_payloads,
     trigger_webhooks_async,
+    update_deferred_payloads_queue_depth,
 )
 
 
@@ -191,10 +199,209 @@ def test_pass_queue_to_send_webhook_request_async(
 
     # then
     call_kwargs_generate_payloads = mocked_generate_deferred_payloads.call_args.kwargs
-    assert "queue" not in call_kwargs_generate_payloads
+    assert call_kwargs_generate_payloads["queue"] is None
     assert call_kwargs_generate_payloads["kwargs"]["send_webhook_queue"] == queue
 
     call_kwargs_send_webhook_request = (
         mocked_send_webhook_request_async.call_args.kwargs
     )
     assert call_kwargs_send_webhook_request["queue"] == queue
+
+
+@override_settings(
+    WEBHOOK_DEFERRED_PAYLOAD_CELERY_QUEUE_NAME="deferred_payloads",
+    WEBHOOK_DEFERRED_PAYLOAD_PRIORITY_CELERY_QUEUE_NAME="deferred_payloads_priority",
+    WEBHOOK_DEFERRED_PAYLOAD_PRIORITY_EVENT_PREFIXES=["order_"],
+)
+@pytest.mark.parametrize(
+    ("event_type", "expected_queue"),
+    [
+        (WebhookEventAsyncType.ORDER_UPDATED, "deferred_payloads_priority"),
+        (WebhookEventAsyncType.PRODUCT_UPDATED, "deferred_payloads"),
+    ],
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.generate_deferred_payloads.apply_async"
+)
+def test_schedule_deferred_payloads_queue_per_event_type(
+    mocked_generate_deferred_payloads, event_type, expected_queue
+):
+    # given
+    cache.clear()
+    deferred_payload_data = DeferredPayloadData(
+        model_name="checkout.checkout",
+        object_id=uuid.uuid4(),
+        requestor_model_name=None,
+        requestor_object_id=None,
+        request_time=None,
+    )
+
+    # when
+    schedule_deferred_payloads(event_type, [([1], deferred_payload_data)])
+
+    # then
+    call_kwargs = mocked_generate_deferred_payloads.call_args.kwargs
+    assert call_kwargs["queue"] == expected_queue
+    assert call_kwargs["kwargs"]["event_delivery_ids"] == [1]
+    assert get_deferred_payloads_queue_depth(expected_queue) == 1
+
+
+@override_settings(
+    WEBHOOK_DEFERRED_PAYLOAD_BATCH_QUEUE_DEPTH=2,
+    WEBHOOK_DEFERRED_PAYLOAD_BATCH_MAX_SIZE=2,
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "generate_deferred_payloads_batch.apply_async"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.generate_deferred_payloads.apply_async"
+)
+def test_schedule_deferred_payloads_in_batches_when_queue_is_deep(
+    mocked_generate_deferred_payloads, mocked_generate_deferred_payloads_batch
+):
+    # given
+    cache.clear()
+    event_type = WebhookEventAsyncType.CHECKOUT_UPDATED
+    deferred_payloads = [
+        (
+            [delivery_id],
+            DeferredPayloadData(
+                model_name="checkout.checkout",
+                object_id=uuid.uuid4(),
+                requestor_model_name=None,
+                requestor_object_id=None,
+                request_time=None,
+            ),
+        )
+        for delivery_id in range(3)
+    ]
+
+    # when
+    schedule_deferred_payloads(event_type, deferred_payloads[:1])
+    schedule_deferred_payloads(event_type, deferred_payloads)
+
+    # then
+    assert mocked_generate_deferred_payloads.call_count == 1
+    scheduled_ids = [
+        [
+            deferred_payload["event_delivery_ids"]
+            for deferred_payload in call.kwargs["kwargs"]["deferred_payloads"]
+        ]
+        for call in mocked_generate_deferred_payloads_batch.call_args_list
+    ]
+    assert scheduled_ids == [[[0], [1]], [[2]]]
+    assert get_deferred_payloads_queue_depth(None) == 4
+
+
+@override_settings(WEBHOOK_DEFERRED_PAYLOAD_QUEUE_DEPTH_WINDOW=60)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.generate_deferred_payloads.apply_async"
+)
+def test_deferred_payloads_queue_depth_expires(mocked_generate_deferred_payloads):
+    # given
+    cache.clear()
+    deferred_payload_data = DeferredPayloadData(
+        model_name="checkout.checkout",
+        object_id=uuid.uuid4(),
+        requestor_model_name=None,
+        requestor_object_id=None,
+        request_time=None,
+    )
+    event_type = WebhookEventAsyncType.CHECKOUT_UPDATED
+
+    # when
+    with freeze_time("2024-01-01 12:00:00"):
+        schedule_deferred_payloads(event_type, [([1], deferred_payload_data)])
+    with freeze_time("2024-01-01 12:01:00"):
+        schedule_deferred_payloads(event_type, [([2], deferred_payload_data)])
+        depth_in_next_window = get_deferred_payloads_queue_depth(None)
+    with freeze_time("2024-01-01 12:02:00"):
+        depth_after_two_windows = get_deferred_payloads_queue_depth(None)
+
+    # then
+    assert depth_in_next_window == 2
+    assert depth_after_two_windows == 1
+
+
+def test_update_deferred_payloads_queue_depth_expired_key():
+    # given
+    cache.clear()
+    queue_depth_key = get_deferred_payloads_queue_depth_key(None)
+
+    # when
+    update_deferred_payloads_queue_depth(queue_depth_key, -1)
+
+    # then
+    assert cache.get(queue_depth_key) is None
+    assert get_deferred_payloads_queue_depth(None) == 0
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+def test_generate_deferred_payloads_batch(
+    mocked_send_webhook_request_async,
+    checkout_with_item,
+    setup_checkout_webhooks,
+    staff_user,
+    fetch_kwargs,
+):
+    # given
+    checkout = checkout_with_item
+    fetch_checkout_data(**fetch_kwargs)
+
+    event_type = WebhookEventAsyncType.CHECKOUT_UPDATED
+    _, _, _, checkout_updated_webhook = setup_checkout_webhooks(event_type)
+    missing_object_data = DeferredPayloadData(
+        model_name="checkout.checkout",
+        object_id=uuid.uuid4(),
+        requestor_model_name=None,
+        requestor_object_id=None,
+        request_time=None,
+    )
+    checkout_data = DeferredPayloadData(
+        model_name="checkout.checkout",
+        object_id=checkout.pk,
+        requestor_model_name="account.user",
+        requestor_object_id=staff_user.pk,
+        request_time=None,
+    )
+    missing_object_delivery, delivery = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=event_type,
+                webhook=checkout_updated_webhook,
+                status=EventDeliveryStatus.PENDING,
+            )
+            for _ in range(2)
+        ]
+    )
+    cache.clear()
+    queue_depth_key = get_deferred_payloads_queue_depth_key(None)
+    cache.set(queue_depth_key, 2, timeout=None)
+
+    # when
+    generate_deferred_payloads_batch.delay(
+        deferred_payloads=[
+            {
+                "event_delivery_ids": [missing_object_delivery.pk],
+                "deferred_payload_data": asdict(missing_object_data),
+            },
+            {
+                "event_delivery_ids": [delivery.pk],
+                "deferred_payload_data": asdict(checkout_data),
+            },
+        ],
+        queue_depth_key=queue_depth_key,
+    )
+
+    # then
+    missing_object_delivery.refresh_from_db()
+    assert missing_object_delivery.status == EventDeliveryStatus.FAILED
+    delivery.refresh_from_db()
+    assert delivery.payload
+    mocked_send_webhook_request_async.assert_called_once()
+    call_kwargs = mocked_send_webhook_request_async.call_args.kwargs
+    assert call_kwargs["kwargs"]["event_delivery_id"] == delivery.pk
+    assert get_deferred_payloads_queue_depth(None) == 0
@@ -1,6 +1,7 @@
 import datetime
 import json
 import logging
+import time
 from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import asdict, dataclass
@@ -11,18 +12,20 @@ from celery import group
 from celery.utils.log import get_task_logger
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
 from ....core.db.connection import allow_writer
-from ....core.models import EventDelivery, EventPayload
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ....core.tracing import webhooks_opentracing_trace
 from ....core.utils import get_domain
 from ....graphql.core.dataloaders import DataLoader
 from ....graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
     generate_payload_promise_from_subscription,
+    generate_payloads_from_subscription,
     get_pre_save_payload_key,
     initialize_request,
 )
@@ -36,6 +39,7 @@ from ..utils import (
     WebhookResponse,
     WebhookSchemes,
     attempt_update,
+    clear_successful_deliveries,
     clear_successful_delivery,
     create_attempt,
     delivery_update,
@@ -44,6 +48,7 @@ from ..utils import (
     handle_webhook_retry,
     prepare_deferred_payload_data,
     send_webhook_using_scheme_method,
+    should_retry_webhook_request,
 )
 
 if TYPE_CHECKING:
@@ -53,6 +58,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(f"{__name__}.celery")
 
+DEFERRED_PAYLOADS_QUEUE_DEPTH_KEY = "webhook_deferred_payloads_queue_depth"
+
 OBSERVABILITY_QUEUE_NAME = "observability"
 MAX_WEBHOOK_EVENTS_IN_DB_BULK = 100
 
@@ -66,6 +73,61 @@ class WebhookPayloadData:
     )
 
 
+def _get_payload_reuse_key(webhook) -> tuple:
+    """Return the key of webhooks which receive the same subscription payloads.
+
+    Payloads are reused only between webhooks of the same app with the same
+    subscription query, as resolvers may return different data depending on the
+    app that asks for it, e.g. its own private metadata.
+    """
+    return (webhook.app_id, webhook.subscription_query)
+
+
+def generate_payloads_for_webhooks(
+    event_type,
+    subscribable_objects,
+    webhooks,
+    requestor=None,
+    allow_replica=False,
+    request_time: Optional[datetime.datetime] = None,
+) -> dict[int, list[Optional[dict[str, Any]]]]:
+    """Generate subscription payloads of all objects for each webhook.
+
+    The subscription query of a webhook is executed once for all objects, with
+    dataloaders shared between the webhooks. Payloads generated for a webhook are
+    reused for other webhooks of the same app with the same query.
+
+    :return: Payloads per webhook ID, in the order of `subscribable_objects`.
+    """
+    dataloaders: dict[str, type[DataLoader]] = {}
+    payloads_per_key: dict[tuple, list[Optional[dict[str, Any]]]] = {}
+    payloads_per_webhook = {}
+    for webhook in webhooks:
+        key = _get_payload_reuse_key(webhook)
+        if key in payloads_per_key:
+            payloads_per_webhook[webhook.pk] = payloads_per_key[key]
+            continue
+
+        request = initialize_request(
+            requestor,
+            event_type in WebhookEventSyncType.ALL,
+            event_type=event_type,
+            allow_replica=allow_replica,
+            request_time=request_time,
+            dataloaders=dataloaders,
+        )
+        payloads = generate_payloads_from_subscription(
+            event_type=event_type,
+            subscribable_objects=subscribable_objects,
+            subscription_query=webhook.subscription_query,
+            request=request,
+            app=webhook.app,
+        )
+        payloads_per_webhook[webhook.pk] = payloads
+        payloads_per_key[key] = payloads
+    return payloads_per_webhook
+
+
 def create_deliveries_for_multiple_subscription_objects(
     event_type,
     subscribable_objects,
@@ -101,30 +163,45 @@ def create_deliveries_for_multiple_subscription_objects(
     event_deliveries = []
     event_deliveries_for_bulk_update = []
 
-    for subscribable_object in subscribable_objects:
-        # Dataloaders are shared between calls to generate_payload_from_subscription to
-        # reuse their cache. This avoids unnecessary DB queries when different webhooks
-        # need to resolve the same data.
-        dataloaders: dict[str, type[DataLoader]] = {}
-
-        request = initialize_request(
-            requestor,
-            event_type in WebhookEventSyncType.ALL,
-            event_type=event_type,
+    payloads_per_webhook = None
+    if settings.WEBHOOK_SUBSCRIPTION_PAYLOADS_BATCH_ENABLED:
+        payloads_per_webhook = generate_payloads_for_webhooks(
+            event_type,
+            subscribable_objects,
+            webhooks,
+            requestor=requestor,
             allow_replica=allow_replica,
             request_time=request_time,
-            dataloaders=dataloaders,
         )
 
-        for webhook in webhooks:
-            data = generate_payload_from_subscription(
+    for index, subscribable_object in enumerate(subscribable_objects):
+        if payloads_per_webhook is None:
+            # Dataloaders are shared between calls to generate_payload_from_subscription
+            # to reuse their cache. This avoids unnecessary DB queries when different
+            # webhooks need to resolve the same data.
+            dataloaders: dict[str, type[DataLoader]] = {}
+
+            request = initialize_request(
+                requestor,
+                event_type in WebhookEventSyncType.ALL,
                 event_type=event_type,
-                subscribable_object=subscribable_object,
-                subscription_query=webhook.subscription_query,
-                request=request,
-                app=webhook.app,
+                allow_replica=allow_replica,
+                request_time=request_time,
+                dataloaders=dataloaders,
             )
 
+        for webhook in webhooks:
+            if payloads_per_webhook is not None:
+                data = payloads_per_webhook[webhook.pk][index]
+            else:
+                data = generate_payload_from_subscription(
+                    event_type=event_type,
+                    subscribable_object=subscribable_object,
+                    subscription_query=webhook.subscription_query,
+                    request=request,
+                    app=webhook.app,
+                )
+
             if not data:
                 logger.info(
                     "No payload was generated with subscription for event: %s",
@@ -296,6 +373,162 @@ def get_queue_name_for_webhook(webhook, default_queue):
     )
 
 
+def get_queue_name_for_deferred_payload(event_type: str) -> Optional[str]:
+    priority_prefixes = tuple(settings.WEBHOOK_DEFERRED_PAYLOAD_PRIORITY_EVENT_PREFIXES)
+    if priority_prefixes and event_type.startswith(priority_prefixes):
+        return settings.WEBHOOK_DEFERRED_PAYLOAD_PRIORITY_CELERY_QUEUE_NAME
+    return settings.WEBHOOK_DEFERRED_PAYLOAD_CELERY_QUEUE_NAME
+
+
+def _get_queue_depth_window() -> int:
+    return int(time.time() // settings.WEBHOOK_DEFERRED_PAYLOAD_QUEUE_DEPTH_WINDOW)
+
+
+def get_deferred_payloads_queue_depth_key(
+    queue: Optional[str], window: Optional[int] = None
+) -> str:
+    if window is None:
+        window = _get_queue_depth_window()
+    return f"{DEFERRED_PAYLOADS_QUEUE_DEPTH_KEY}:{queue or 'default'}:{window}"
+
+
+def get_deferred_payloads_queue_depth(queue: Optional[str]) -> int:
+    """Return the number of deferred payloads waiting to be generated on the queue.
+
+    Payloads are counted per `WEBHOOK_DEFERRED_PAYLOAD_QUEUE_DEPTH_WINDOW` seconds
+    in which they were scheduled, and only the current and the previous windows
+    are summed, so payloads of tasks that never finished stop being counted.
+    """
+    window = _get_queue_depth_window()
+    keys = [
+        get_deferred_payloads_queue_depth_key(queue, window),
+        get_deferred_payloads_queue_depth_key(queue, window - 1),
+    ]
+    return sum(max(depth, 0) for depth in cache.get_many(keys).values())
+
+
+def update_deferred_payloads_queue_depth(key: str, delta: int):
+    if delta > 0:
+        cache.add(
+            key, 0, timeout=2 * settings.WEBHOOK_DEFERRED_PAYLOAD_QUEUE_DEPTH_WINDOW
+        )
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # The counter of the window has expired or was evicted from the cache.
+        pass
+
+
+def schedule_deferred_payloads(
+    event_type: str,
+    deferred_payloads: list[tuple[list[int], DeferredPayloadData]],
+    send_webhook_queue: Optional[str] = None,
+):
+    """Schedule tasks generating the deferred payloads of the deliveries.
+
+    `deferred_payloads` contains the delivery ids and the deferred payload data of
+    each subscribable object. Payloads are generated on the queue returned by
+    `get_queue_name_for_deferred_payload`, one object per task; once more than
+    `WEBHOOK_DEFERRED_PAYLOAD_BATCH_QUEUE_DEPTH` payloads are waiting in that queue,
+    a single task generates up to `WEBHOOK_DEFERRED_PAYLOAD_BATCH_MAX_SIZE` of them.
+    `send_webhook_queue` is passed to run the `send_webhook_request_async` task after
+    the payload is generated.
+    """
+    if not deferred_payloads:
+        return
+
+    queue = get_queue_name_for_deferred_payload(event_type)
+    queue_depth_key = get_deferred_payloads_queue_depth_key(queue)
+    update_deferred_payloads_queue_depth(queue_depth_key, len(deferred_payloads))
+    queue_depth = get_deferred_payloads_queue_depth(queue)
+
+    batch_size = 1
+    if queue_depth > settings.WEBHOOK_DEFERRED_PAYLOAD_BATCH_QUEUE_DEPTH:
+        batch_size = max(settings.WEBHOOK_DEFERRED_PAYLOAD_BATCH_MAX_SIZE, 1)
+        logger.info(
+            "Deferred payloads queue %r depth: %r; generating payloads in batches "
+            "of %r.",
+            queue,
+            queue_depth,
+            batch_size,
+        )
+
+    if batch_size == 1:
+        for event_delivery_ids, deferred_payload_data in deferred_payloads:
+            generate_deferred_payloads.apply_async(
+                kwargs={
+                    "event_delivery_ids": event_delivery_ids,
+                    "deferred_payload_data": asdict(deferred_payload_data),
+                    "send_webhook_queue": send_webhook_queue,
+                    "queue_depth_key": queue_depth_key,
+                },
+                queue=queue,
+                bind=True,
+            )
+        return
+
+    for start in range(0, len(deferred_payloads), batch_size):
+        generate_deferred_payloads_batch.apply_async(
+            kwargs={
+                "deferred_payloads": [
+                    {
+                        "event_delivery_ids": event_delivery_ids,
+                        "deferred_payload_data": asdict(deferred_payload_data),
+                    }
+                    for event_delivery_ids, deferred_payload_data in deferred_payloads[
+                        start : start + batch_size
+                    ]
+                ],
+                "send_webhook_queue": send_webhook_queue,
+                "queue_depth_key": queue_depth_key,
+            },
+            queue=queue,
+            bind=True,
+        )
+
+
+def schedule_webhook_deliveries(deliveries: list[EventDelivery], default_queue):
+    """Schedule tasks sending the deliveries.
+
+    When `WEBHOOK_BATCH_DELIVERY_ENABLED` is set, deliveries of the same webhook are
+    sent by a single task in batches of `WEBHOOK_BATCH_DELIVERY_MAX_SIZE`; otherwise
+    a task is scheduled for each delivery.
+    """
+    if not settings.WEBHOOK_BATCH_DELIVERY_ENABLED:
+        for delivery in deliveries:
+            send_webhook_request_async.apply_async(
+                kwargs={"event_delivery_id": delivery.pk},
+                queue=get_queue_name_for_webhook(
+                    delivery.webhook, default_queue=default_queue
+                ),
+                bind=True,
+                retry_backoff=10,
+                retry_kwargs={"max_retries": 5},
+            )
+        return
+
+    deliveries_per_webhook: dict[int, list[EventDelivery]] = defaultdict(list)
+    for delivery in deliveries:
+        deliveries_per_webhook[delivery.webhook_id].append(delivery)
+
+    batch_size = settings.WEBHOOK_BATCH_DELIVERY_MAX_SIZE
+    for webhook_deliveries in deliveries_per_webhook.values():
+        queue = get_queue_name_for_webhook(
+            webhook_deliveries[0].webhook, default_queue=default_queue
+        )
+        for start in range(0, len(webhook_deliveries), batch_size):
+            send_webhook_requests_async_batch.apply_async(
+                kwargs={
+                    "event_delivery_ids": [
+                        delivery.pk
+                        for delivery in webhook_deliveries[start : start + batch_size]
+                    ]
+                },
+                queue=queue,
+                bind=True,
+            )
+
+
 def trigger_webhooks_async_for_multiple_objects(
     event_type,
     webhooks,
@@ -383,39 +616,24 @@ def trigger_webhooks_async_for_multiple_objects(
                 )
             )
 
-    for _, deferred_deliveries in deferred_deliveries_per_object.items():
-        if not deferred_deliveries:
-            continue
-
-        event_delivery_ids = [delivery.pk for delivery, _ in deferred_deliveries]
-
-        # Deferred payload data is the same for all deliveries for a given subscribable
-        # object; we can take the first one for given `deferred_deliveries`.
-        deferred_payload_data = deferred_deliveries[0][1]
-
-        # Trigger deferred payload generation task for each subscribable object.
-        # This task in run on the default queue; `send_webhook_queue` is passed to
-        # run the `send_webhook_request_async` task after the payload is generated.
-        generate_deferred_payloads.apply_async(
-            kwargs={
-                "event_delivery_ids": event_delivery_ids,
-                "deferred_payload_data": asdict(deferred_payload_data),
-                "send_webhook_queue": queue,
-            },
-            bind=True,
-        )
+    # Deferred payload data is the same for all deliveries for a given subscribable
+    # object; we can take the first one for given `deferred_deliveries`.
+    schedule_deferred_payloads(
+        event_type,
+        [
+            (
+                [delivery.pk for delivery, _ in deferred_deliveries],
+                deferred_deliveries[0][1],
+            )
+            for deferred_deliveries in deferred_deliveries_per_object.values()
+            if deferred_deliveries
+        ],
+        send_webhook_queue=queue,
+    )
 
-    for delivery in deliveries:
-        send_webhook_request_async.apply_async(
-            kwargs={"event_delivery_id": delivery.pk},
-            queue=get_queue_name_for_webhook(
-                delivery.webhook,
-                default_queue=queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
-            ),
-            bind=True,
-            retry_backoff=10,
-            retry_kwargs={"max_retries": 5},
-        )
+    schedule_webhook_deliveries(
+        deliveries, default_queue=queue or settings.WEBHOOK_CELERY_QUEUE_NAME
+    )
 
 
 def trigger_webhooks_async(
@@ -467,6 +685,49 @@ def generate_deferred_payloads(
     event_delivery_ids: list,
     deferred_payload_data: dict,
     send_webhook_queue: Optional[str] = None,
+    queue_depth_key: Optional[str] = None,
+):
+    try:
+        _generate_deferred_payloads(
+            event_delivery_ids, deferred_payload_data, send_webhook_queue
+        )
+    finally:
+        if queue_depth_key:
+            update_deferred_payloads_queue_depth(queue_depth_key, -1)
+
+
+@app.task(bind=True)
+def generate_deferred_payloads_batch(
+    self,
+    deferred_payloads: list[dict],
+    send_webhook_queue: Optional[str] = None,
+    queue_depth_key: Optional[str] = None,
+):
+    """Generate deferred payloads of multiple subscribable objects in one task."""
+    try:
+        for deferred_payload in deferred_payloads:
+            try:
+                _generate_deferred_payloads(
+                    deferred_payload["event_delivery_ids"],
+                    deferred_payload["deferred_payload_data"],
+                    send_webhook_queue,
+                )
+            except Exception:
+                task_logger.exception(
+                    "Failed to generate deferred payloads for deliveries: %r.",
+                    deferred_payload["event_delivery_ids"],
+                )
+    finally:
+        if queue_depth_key:
+            update_deferred_payloads_queue_depth(
+                queue_depth_key, -len(deferred_payloads)
+            )
+
+
+def _generate_deferred_payloads(
+    event_delivery_ids: list,
+    deferred_payload_data: dict,
+    send_webhook_queue: Optional[str] = None,
 ):
     deliveries = list(
         get_multiple_deliveries_for_webhooks(event_delivery_ids)[0].values()
@@ -533,20 +794,11 @@ def generate_deferred_payloads(
                     event_deliveries_for_bulk_update, ["payload"]
                 )
 
-    for delivery in event_deliveries_for_bulk_update:
-        # Trigger webhook delivery task when the payload is ready.
-        send_webhook_request_async.apply_async(
-            kwargs={
-                "event_delivery_id": delivery.pk,
-            },
-            queue=get_queue_name_for_webhook(
-                delivery.webhook,
-                default_queue=send_webhook_queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
-            ),
-            bind=True,
-            retry_backoff=10,
-            retry_kwargs={"max_retries": 5},
-        )
+    # Trigger webhook delivery tasks when the payloads are ready.
+    schedule_webhook_deliveries(
+        event_deliveries_for_bulk_update,
+        default_queue=send_webhook_queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
+    )
 
 
 @app.task(
@@ -612,6 +864,132 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
+@app.task(
+    queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+    bind=True,
+    retry_backoff=10,
+    retry_kwargs={"max_retries": 5},
+)
+def send_webhook_requests_async_batch(self, event_delivery_ids):
+    """Send deliveries of a single webhook in one task."""
+    deliveries_map, inactive_delivery_ids = get_multiple_deliveries_for_webhooks(
+        event_delivery_ids
+    )
+    not_found_ids = (
+        set(event_delivery_ids) - set(deliveries_map) - inactive_delivery_ids
+    )
+
+    deliveries = [
+        deliveries_map[delivery_id]
+        for delivery_id in event_delivery_ids
+        if delivery_id in deliveries_map
+    ]
+    if deliveries:
+        send_webhook_deliveries_batch(self, deliveries)
+    if not_found_ids:
+        # The deliveries may not be committed yet.
+        raise self.retry(
+            countdown=1, kwargs={"event_delivery_ids": sorted(not_found_ids)}
+        )
+
+
+def send_webhook_deliveries_batch(celery_task, deliveries: list[EventDelivery]):
+    """Send the deliveries and write their attempts in bulk.
+
+    Failed deliveries that should be retried are handed over to
+    `send_webhook_request_async`, which handles the remaining retries.
+    """
+    domain = get_domain()
+    with allow_writer():
+        attempts = EventDeliveryAttempt.objects.bulk_create(
+            [
+                create_attempt(delivery, celery_task.request.id, with_save=False)
+                for delivery in deliveries
+            ]
+        )
+
+    # The batch attempt counts as the first try of the handed over deliveries.
+    retries = celery_task.request.retries + 1
+    deliveries_to_retry = []
+    failed_deliveries = []
+    for delivery, attempt in zip(deliveries, attempts):
+        webhook = delivery.webhook
+        try:
+            if not delivery.payload:
+                raise ValueError(f"Event delivery id: {delivery.pk!r} has no payload.")
+            data = delivery.payload.get_payload()
+            data = data if isinstance(data, bytes) else data.encode("utf-8")
+            with webhooks_opentracing_trace(
+                delivery.event_type, domain, len(data), app=webhook.app
+            ):
+                response = send_webhook_using_scheme_method(
+                    webhook.target_url,
+                    domain,
+                    webhook.secret_key,
+                    delivery.event_type,
+                    data,
+                    webhook.custom_headers,
+                )
+        except ValueError as e:
+            response = WebhookResponse(
+                content=str(e), status=EventDeliveryStatus.FAILED
+            )
+            attempt_update(attempt, response, with_save=False)
+            delivery.status = EventDeliveryStatus.FAILED
+            failed_deliveries.append(delivery)
+            continue
+
+        attempt_update(attempt, response, with_save=False)
+        if response.status == EventDeliveryStatus.SUCCESS:
+            task_logger.info(
+                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+                webhook.id,
+                webhook.target_url,
+                delivery.event_type,
+                delivery.id,
+            )
+            delivery.status = EventDeliveryStatus.SUCCESS
+            continue
+
+        if (
+            should_retry_webhook_request(webhook, response, delivery, attempt)
+            and retries <= celery_task.retry_kwargs["max_retries"]
+        ):
+            deliveries_to_retry.append(delivery)
+        else:
+            delivery.status = EventDeliveryStatus.FAILED
+            failed_deliveries.append(delivery)
+
+    with allow_writer():
+        EventDeliveryAttempt.objects.bulk_update(
+            attempts,
+            [
+                "duration",
+                "response",
+                "response_headers",
+                "response_status_code",
+                "request_headers",
+                "status",
+            ],
+        )
+        if failed_deliveries:
+            EventDelivery.objects.bulk_update(failed_deliveries, ["status"])
+
+    for attempt in attempts:
+        observability.report_event_delivery_attempt(attempt)
+    clear_successful_deliveries(deliveries)
+
+    for delivery in deliveries_to_retry:
+        send_webhook_request_async.apply_async(
+            kwargs={"event_delivery_id": delivery.pk},
+            queue=get_queue_name_for_webhook(
+                delivery.webhook, default_queue=settings.WEBHOOK_CELERY_QUEUE_NAME
+            ),
+            countdown=celery_task.retry_backoff * (2**celery_task.request.retries),
+            retries=retries,
+        )
+
+
 def send_observability_events(webhooks: list[WebhookData], events: list[bytes]):
     event_type = WebhookEventAsyncType.OBSERVABILITY
     for webhook in webhooks:
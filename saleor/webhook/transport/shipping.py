@@ -12,14 +12,13 @@ from ...app.models import App
 from ...checkout.models import Checkout
 from ...graphql.core.utils import from_global_id_or_error
 from ...graphql.shipping.types import ShippingMethod
-from ...graphql.webhook.utils import get_pregenerated_subscription_payload
 from ...order.models import Order
 from ...plugins.base_plugin import ExcludedShippingMethod, RequestorOrLazyObject
 from ...settings import WEBHOOK_SYNC_TIMEOUT
 from ...shipping.interface import ShippingMethodData
 from ...webhook.utils import get_webhooks_for_event
 from ..const import APP_ID_PREFIX, CACHE_EXCLUDED_SHIPPING_TIME
-from .synchronous.transport import trigger_webhook_sync_if_not_cached
+from .synchronous.transport import trigger_webhooks_sync_if_not_cached
 
 logger = logging.getLogger(__name__)
 
@@ -125,29 +124,26 @@ def get_excluded_shipping_methods_or_fetch(
     """Return data of all excluded shipping methods.
 
     The data will be fetched from the cache. If missing it will fetch it from all
-    defined webhooks by calling a request to each of them one by one.
+    defined webhooks by calling requests to them concurrently.
     """
     if pregenerated_subscription_payloads is None:
         pregenerated_subscription_payloads = {}
     cache_data = get_cache_data_for_exclude_shipping_methods(payload)
     excluded_methods = []
     # Gather responses from webhooks
-    for webhook in webhooks:
-        pregenerated_subscription_payload = get_pregenerated_subscription_payload(
-            webhook, pregenerated_subscription_payloads
-        )
-        response_data = trigger_webhook_sync_if_not_cached(
-            event_type=event_type,
-            payload=payload,
-            webhook=webhook,
-            cache_data=cache_data,
-            allow_replica=allow_replica,
-            subscribable_object=subscribable_object,
-            request_timeout=WEBHOOK_SYNC_TIMEOUT,
-            cache_timeout=CACHE_EXCLUDED_SHIPPING_TIME,
-            requestor=requestor,
-            pregenerated_subscription_payload=pregenerated_subscription_payload,
-        )
+    responses = trigger_webhooks_sync_if_not_cached(
+        event_type=event_type,
+        payload=payload,
+        webhooks=webhooks,
+        cache_data=cache_data,
+        allow_replica=allow_replica,
+        subscribable_object=subscribable_object,
+        request_timeout=WEBHOOK_SYNC_TIMEOUT,
+        cache_timeout=CACHE_EXCLUDED_SHIPPING_TIME,
+        requestor=requestor,
+        pregenerated_subscription_payloads=pregenerated_subscription_payloads,
+    )
+    for _webhook, response_data in responses:
         if response_data and isinstance(response_data, dict):
             excluded_methods.extend(
                 get_excluded_shipping_methods_from_response(response_data)
@@ -1,5 +1,8 @@
 import json
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 from urllib.parse import urlparse
@@ -11,7 +14,7 @@ from django.db import transaction
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
 from ....core.db.connection import allow_writer
-from ....core.models import EventDelivery, EventPayload
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ....core.tracing import webhooks_opentracing_trace
 from ....core.utils import get_domain
 from ....graphql.webhook.subscription_payload import (
@@ -45,6 +48,7 @@ from ..utils import (
 )
 
 if TYPE_CHECKING:
+    from ....app.models import App
     from ....webhook.models import Webhook
 
 R = TypeVar("R")
@@ -86,41 +90,72 @@ def handle_transaction_request_task(self, delivery_id, request_event_id):
     )
 
 
-def _send_webhook_request_sync(
-    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
-) -> tuple[WebhookResponse, Optional[dict[Any, Any]]]:
+@dataclass
+class SyncWebhookRequest:
+    delivery: EventDelivery
+    attempt: EventDeliveryAttempt
+    app: "App"
+    domain: str
+    message: bytes
+    signature: str
+
+
+def _prepare_webhook_request_sync(delivery, attempt=None) -> SyncWebhookRequest:
     event_payload = delivery.payload
     data = event_payload.get_payload()
     webhook = delivery.webhook
     parts = urlparse(webhook.target_url)
     domain = get_domain()
     message = data.encode("utf-8")
-    payload_size = len(message)
     signature = signature_for_payload(message, webhook.secret_key)
 
     if parts.scheme.lower() not in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
         delivery_update(delivery, EventDeliveryStatus.FAILED)
         raise ValueError(f"Unknown webhook scheme: {parts.scheme!r}")
 
+    if attempt is None:
+        attempt = create_attempt(delivery=delivery, task_id=None, with_save=False)
+    return SyncWebhookRequest(
+        delivery=delivery,
+        attempt=attempt,
+        app=webhook.app,
+        domain=domain,
+        message=message,
+        signature=signature,
+    )
+
+
+def _post_webhook_request_sync(
+    request: SyncWebhookRequest, timeout=settings.WEBHOOK_SYNC_TIMEOUT
+) -> tuple[WebhookResponse, Optional[dict[Any, Any]]]:
+    """Send the prepared request without touching the database.
+
+    It is safe to call it from a thread other than the one which prepared
+    the request.
+    """
+    delivery = request.delivery
+    webhook = delivery.webhook
     logger.debug(
         "[Webhook] Sending payload to %r for event %r.",
         webhook.target_url,
         delivery.event_type,
     )
-    if attempt is None:
-        attempt = create_attempt(delivery=delivery, task_id=None, with_save=False)
     response = WebhookResponse(content="")
     response_data = None
 
     try:
         with webhooks_opentracing_trace(
-            delivery.event_type, domain, payload_size, sync=True, app=webhook.app
+            delivery.event_type,
+            request.domain,
+            len(request.message),
+            sync=True,
+            app=request.app,
         ):
             response = send_webhook_using_http(
                 webhook.target_url,
-                message,
-                domain,
-                signature,
+                request.message,
+                request.domain,
+                request.signature,
                 delivery.event_type,
                 timeout=timeout,
                 custom_headers=webhook.custom_headers,
@@ -133,7 +168,7 @@ def _send_webhook_request_sync(
             "ID of failed DeliveryAttempt: %r . ",
             webhook.target_url,
             e,
-            attempt.id,
+            request.attempt.id,
         )
         response.status = EventDeliveryStatus.FAILED
     else:
@@ -143,24 +178,71 @@ def _send_webhook_request_sync(
                 "ID of failed DeliveryAttempt: %r . ",
                 webhook.target_url,
                 response.content,
-                attempt.id,
+                request.attempt.id,
             )
         if response.status == EventDeliveryStatus.SUCCESS:
             logger.debug(
                 "[Webhook] Success response from %r."
                 "Successful DeliveryAttempt id: %r",
                 webhook.target_url,
-                attempt.id,
+                request.attempt.id,
             )
+    return response, response_data
+
 
-    attempt_update(attempt, response)
-    delivery_update(delivery, response.status)
-    observability.report_event_delivery_attempt(attempt)
-    save_unsuccessful_delivery_attempt(attempt)
-    clear_successful_delivery(delivery)
+def _save_webhook_request_sync_result(
+    request: SyncWebhookRequest, response: WebhookResponse
+):
+    attempt_update(request.attempt, response)
+    delivery_update(request.delivery, response.status)
+    observability.report_event_delivery_attempt(request.attempt)
+    save_unsuccessful_delivery_attempt(request.attempt)
+    clear_successful_delivery(request.delivery)
+
+
+def _send_webhook_request_sync(
+    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
+) -> tuple[WebhookResponse, Optional[dict[Any, Any]]]:
+    request = _prepare_webhook_request_sync(delivery, attempt)
+    response, response_data = _post_webhook_request_sync(request, timeout)
+    _save_webhook_request_sync_result(request, response)
     return response, response_data
 
 
+def send_webhook_requests_sync(
+    deliveries: list[EventDelivery], timeout=settings.WEBHOOK_SYNC_TIMEOUT
+) -> list[Optional[dict[Any, Any]]]:
+    """Send synchronous webhook requests concurrently.
+
+    The requests are prepared and their results are saved in the calling thread,
+    only the HTTP calls are made by the worker threads. Up to
+    `WEBHOOK_SYNC_MAX_WORKERS` requests are sent at once and each of them is limited
+    by its own timeout, counted from the moment it is sent, like when the requests
+    are sent one by one.
+    """
+    max_workers = min(len(deliveries), settings.WEBHOOK_SYNC_MAX_WORKERS)
+    if max_workers <= 1:
+        return [send_webhook_request_sync(delivery, timeout) for delivery in deliveries]
+
+    requests = [_prepare_webhook_request_sync(delivery) for delivery in deliveries]
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="sync-webhook"
+    ) as executor:
+        results = list(
+            executor.map(
+                lambda request: _post_webhook_request_sync(request, timeout), requests
+            )
+        )
+
+    responses_data = []
+    for request, (response, response_data) in zip(requests, results):
+        _save_webhook_request_sync_result(request, response)
+        responses_data.append(
+            response_data if response.status == EventDeliveryStatus.SUCCESS else None
+        )
+    return responses_data
+
+
 def send_webhook_request_sync(
     delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT
 ) -> Optional[dict[Any, Any]]:
@@ -212,6 +294,93 @@ def trigger_webhook_sync_if_not_cached(
     return response_data
 
 
+def trigger_webhooks_sync_if_not_cached(
+    event_type: str,
+    payload: str,
+    webhooks: Iterable["Webhook"],
+    cache_data: dict,
+    allow_replica: bool,
+    subscribable_object=None,
+    request_timeout=None,
+    cache_timeout=None,
+    request=None,
+    requestor=None,
+    pregenerated_subscription_payloads: Optional[dict] = None,
+) -> list[tuple["Webhook", Optional[dict]]]:
+    """Get responses of all given synchronous webhooks.
+
+    - Fetch responses from cache if they are still valid.
+    - Send the requests for the remaining webhooks concurrently.
+    """
+    if pregenerated_subscription_payloads is None:
+        pregenerated_subscription_payloads = {}
+    if settings.WEBHOOK_SYNC_MAX_WORKERS <= 1:
+        return [
+            (
+                webhook,
+                trigger_webhook_sync_if_not_cached(
+                    event_type=event_type,
+                    payload=payload,
+                    webhook=webhook,
+                    cache_data=cache_data,
+                    allow_replica=allow_replica,
+                    subscribable_object=subscribable_object,
+                    request_timeout=request_timeout,
+                    cache_timeout=cache_timeout,
+                    request=request,
+                    requestor=requestor,
+                    pregenerated_subscription_payload=(
+                        get_pregenerated_subscription_payload(
+                            webhook, pregenerated_subscription_payloads
+                        )
+                    ),
+                ),
+            )
+            for webhook in webhooks
+        ]
+
+    responses: dict[int, Optional[dict]] = {}
+    cache_keys: dict[int, str] = {}
+    deliveries: list[EventDelivery] = []
+    webhooks = list(webhooks)
+    for webhook in webhooks:
+        cache_key = generate_cache_key_for_webhook(
+            cache_data, webhook.target_url, event_type, webhook.app_id
+        )
+        responses[webhook.id] = cache.get(cache_key)
+        if responses[webhook.id] is not None:
+            continue
+        delivery = _create_delivery_for_sync_event(
+            event_type,
+            payload,
+            webhook,
+            allow_replica,
+            subscribable_object=subscribable_object,
+            request=request,
+            requestor=requestor,
+            pregenerated_subscription_payload=get_pregenerated_subscription_payload(
+                webhook, pregenerated_subscription_payloads
+            ),
+        )
+        if delivery:
+            cache_keys[webhook.id] = cache_key
+            deliveries.append(delivery)
+
+    responses_data = send_webhook_requests_sync(
+        deliveries, timeout=request_timeout or settings.WEBHOOK_SYNC_TIMEOUT
+    )
+    for delivery, response_data in zip(deliveries, responses_data):
+        webhook_id = delivery.webhook.id
+        responses[webhook_id] = response_data
+        if response_data is not None:
+            cache.set(
+                cache_keys[webhook_id],
+                response_data,
+                timeout=cache_timeout or WEBHOOK_CACHE_DEFAULT_TIMEOUT,
+            )
+    return [(webhook, responses[webhook.id]) for webhook in webhooks]
+
+
 def create_delivery_for_subscription_sync_event(
     event_type,
     subscribable_object,
@@ -283,20 +452,18 @@ def create_delivery_for_subscription_sync_event(
     return event_delivery
 
 
-def trigger_webhook_sync(
+def _create_delivery_for_sync_event(
     event_type: str,
     payload: str,
     webhook: "Webhook",
     allow_replica,
     subscribable_object=None,
-    timeout=None,
     request=None,
     requestor=None,
     pregenerated_subscription_payload: Optional[dict] = None,
-) -> Optional[dict[Any, Any]]:
-    """Send a synchronous webhook request."""
+) -> Optional[EventDelivery]:
     if webhook.subscription_query:
-        delivery = create_delivery_for_subscription_sync_event(
+        return create_delivery_for_subscription_sync_event(
             event_type=event_type,
             subscribable_object=subscribable_object,
             webhook=webhook,
@@ -306,15 +473,38 @@ def trigger_webhook_sync(
             pregenerated_payload=pregenerated_subscription_payload,
             with_save=False,
         )
-        if not delivery:
-            return None
-    else:
-        delivery = EventDelivery(
-            status=EventDeliveryStatus.PENDING,
-            event_type=event_type,
-            payload=EventPayload(payload=payload),
-            webhook=webhook,
-        )
+    return EventDelivery(
+        status=EventDeliveryStatus.PENDING,
+        event_type=event_type,
+        payload=EventPayload(payload=payload),
+        webhook=webhook,
+    )
+
+
+def trigger_webhook_sync(
+    event_type: str,
+    payload: str,
+    webhook: "Webhook",
+    allow_replica,
+    subscribable_object=None,
+    timeout=None,
+    request=None,
+    requestor=None,
+    pregenerated_subscription_payload: Optional[dict] = None,
+) -> Optional[dict[Any, Any]]:
+    """Send a synchronous webhook request."""
+    delivery = _create_delivery_for_sync_event(
+        event_type,
+        payload,
+        webhook,
+        allow_replica,
+        subscribable_object=subscribable_object,
+        request=request,
+        requestor=requestor,
+        pregenerated_subscription_payload=pregenerated_subscription_payload,
+    )
+    if not delivery:
+        return None
 
     kwargs = {}
     if timeout:
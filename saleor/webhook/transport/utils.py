@@ -12,6 +12,7 @@ from urllib.parse import unquote, urlparse, urlunparse
 from uuid import UUID
 
 import boto3
+import opentracing
 from botocore.exceptions import ClientError
 from celery import Task
 from celery.exceptions import MaxRetriesExceededError, Retry
@@ -26,7 +27,7 @@ from requests_hardened.ip_filter import InvalidIPAddress
 from ...app.headers import AppHeaders, DeprecatedAppHeaders
 from ...app.models import App
 from ...core.db.connection import allow_writer
-from ...core.http_client import HTTPClient
+from ...core.http_client import send_pooled_request
 from ...core.models import (
     EventDelivery,
     EventDeliveryAttempt,
@@ -140,6 +141,21 @@ def generate_cache_key_for_webhook(
     )
 
 
+def generate_cache_key_for_checkout_taxes(
+    payload: str, app_identifier: Optional[str]
+) -> str:
+    """Generate cache key for taxes calculated by tax apps for the checkout.
+
+    The key is a hash of the tax calculation payload, which contains the checkout
+    lines, addresses, shipping and discounts, so any taxable change results in
+    a new key.
+    """
+    return (
+        f"checkout_taxes-{app_identifier or ''}-"
+        f"{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+    )
+
+
 # TODO (PE-568): change typing of data to `bytes` to avoid unnecessary encoding.
 def send_webhook_using_http(
     target_url,
@@ -178,7 +194,7 @@ def send_webhook_using_http(
         headers.update(custom_headers)
 
     try:
-        response = HTTPClient.send_request(
+        response = send_pooled_request(
             "POST",
             target_url,
             data=message,
@@ -207,6 +223,10 @@ def send_webhook_using_http(
         )
         return result
 
+    span = opentracing.global_tracer().active_span
+    if span:
+        span.set_tag("webhooks.connection_reused", response.connection_reused)
+
     return WebhookResponse(
         content=response.text,
         request_headers=headers,
@@ -341,20 +361,10 @@ def send_webhook_using_scheme_method(
     raise ValueError(f"Unknown webhook scheme: {parts.scheme!r}")
 
 
-def handle_webhook_retry(
-    celery_task: Task,
-    webhook: Webhook,
-    response: WebhookResponse,
-    delivery: EventDelivery,
-    delivery_attempt: EventDeliveryAttempt,
-) -> bool:
-    """Handle celery retry for webhook requests.
-
-    Calls retry to re-run the celery_task by raising Retry exception.
-    When MaxRetriesExceededError is raised the function will end without exception.
-    """
-    is_success = True
-    log_extra_details = {
+def _get_webhook_retry_log_extra(
+    webhook: Webhook, response: WebhookResponse, delivery: EventDelivery
+) -> dict:
+    return {
         "webhook": {
             "id": webhook.id,
             "target_url": webhook.target_url,
@@ -364,6 +374,16 @@ def handle_webhook_retry(
             "http_status_code": response.response_status_code,
         },
     }
+
+
+def should_retry_webhook_request(
+    webhook: Webhook,
+    response: WebhookResponse,
+    delivery: EventDelivery,
+    delivery_attempt: EventDeliveryAttempt,
+) -> bool:
+    """Log the failed webhook request and return whether it should be retried."""
+    log_extra_details = _get_webhook_retry_log_extra(webhook, response, delivery)
     task_logger.info(
         "[Webhook ID: %r] Failed request to %r: %r for event: %r."
         " Delivery attempt id: %r",
@@ -385,6 +405,24 @@ def handle_webhook_retry(
             extra=log_extra_details,
         )
         return False
+    return True
+
+
+def handle_webhook_retry(
+    celery_task: Task,
+    webhook: Webhook,
+    response: WebhookResponse,
+    delivery: EventDelivery,
+    delivery_attempt: EventDeliveryAttempt,
+) -> bool:
+    """Handle celery retry for webhook requests.
+
+    Calls retry to re-run the celery_task by raising Retry exception.
+    When MaxRetriesExceededError is raised the function will end without exception.
+    """
+    if not should_retry_webhook_request(webhook, response, delivery, delivery_attempt):
+        return False
+    is_success = True
     try:
         countdown = celery_task.retry_backoff * (2**celery_task.request.retries)
         celery_task.retry(countdown=countdown, **celery_task.retry_kwargs)
@@ -399,7 +437,7 @@ def handle_webhook_retry(
             webhook.id,
             webhook.target_url,
             delivery.id,
-            extra=log_extra_details,
+            extra=_get_webhook_retry_log_extra(webhook, response, delivery),
         )
     return is_success
 
@@ -529,6 +567,36 @@ def clear_successful_delivery(delivery: "EventDelivery"):
         delete_files_from_private_storage_task(files_to_delete)
 
 
+@allow_writer()
+def clear_successful_deliveries(deliveries: list["EventDelivery"]):
+    deliveries = [
+        delivery
+        for delivery in deliveries
+        if delivery.id and delivery.status == EventDeliveryStatus.SUCCESS
+    ]
+    if not deliveries:
+        return
+
+    payload_ids = {delivery.payload_id for delivery in deliveries}
+    payload_ids.discard(None)
+    EventDelivery.objects.filter(
+        id__in=[delivery.id for delivery in deliveries]
+    ).delete()
+    if payload_ids:
+        payloads_to_delete = EventPayload.objects.filter(
+            pk__in=payload_ids, deliveries__isnull=True
+        )
+        files_to_delete = [
+            event_payload.payload_file.name
+            for event_payload in payloads_to_delete.using(
+                settings.DATABASE_CONNECTION_REPLICA_NAME
+            )
+            if event_payload.payload_file
+        ]
+        payloads_to_delete.delete()
+        delete_files_from_private_storage_task(files_to_delete)
+
+
 @allow_writer()
 def delivery_update(delivery: "EventDelivery", status: str):
     delivery.status = status
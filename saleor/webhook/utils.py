@@ -1,6 +1,6 @@
 from collections import defaultdict
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from django.conf import settings
 from django.db.models import Q
@@ -9,6 +9,7 @@ from django.db.models.expressions import Exists, OuterRef
 from ..app.models import App
 from .event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .models import Webhook, WebhookEvent
+from .registry import get_webhook_registry, is_webhook_registry_enabled
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -61,8 +62,19 @@ def get_webhooks_for_event(
     webhooks: Optional["QuerySet[Webhook]"] = None,
     apps_ids: Optional["list[int]"] = None,
     apps_identifier: Optional[list[str]] = None,
-) -> "QuerySet[Webhook]":
-    """Get active webhooks from the database for an event."""
+) -> Union["QuerySet[Webhook]", list[Webhook]]:
+    """Get active webhooks for an event.
+
+    Without additional filters, webhooks are returned from the webhook registry
+    when it's enabled; otherwise they are fetched from the database.
+    """
+    if (
+        webhooks is None
+        and not apps_ids
+        and not apps_identifier
+        and is_webhook_registry_enabled()
+    ):
+        return get_webhook_registry().get_webhooks(event_type)
 
     if webhooks is None:
         # For this QS replica usage is applied later, as this QS could be also passed
@@ -88,6 +100,16 @@ def get_webhooks_for_multiple_events(
     if set_event_types.intersection(WebhookEventAsyncType.ALL):
         set_event_types.add(WebhookEventAsyncType.ANY)
 
+    if is_webhook_registry_enabled():
+        registry = get_webhook_registry()
+        return defaultdict(
+            set,
+            {
+                event_type: set(registry.get_webhooks_subscribed_to(event_type))
+                for event_type in set_event_types
+            },
+        )
+
     webhook_id_to_event_type = (
         WebhookEvent.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
         .filter(event_type__in=set_event_types)